@@ -1,5 +1,4 @@
 import eqsig
-from collections import OrderedDict
 import numpy as np
 import sfsimodels as sm
 
@@ -23,10 +22,6 @@ def site_response(sp, asig, linear=0):
     assert isinstance(sp, sm.SoilProfile)
     sp.gen_split(props=['shear_vel', 'unit_mass', 'cohesion', 'phi', 'bulk_mod', 'poissons_ratio', 'strain_peak'])
     thicknesses = sp.split["thickness"]
-    n_node_rows = len(thicknesses) + 1
-    node_depths = np.cumsum(sp.split["thickness"])
-    node_depths = np.insert(node_depths, 0, 0)
-    ele_depths = (node_depths[1:] + node_depths[:-1]) / 2
     shear_vels = sp.split["shear_vel"]
     unit_masses = sp.split["unit_mass"] / 1e3
     g_mods = unit_masses * shear_vels ** 2
@@ -50,33 +45,6 @@ def site_response(sp, asig, linear=0):
     newmark_beta = 0.25
 
     ele_width = min(thicknesses)
-    total_soil_nodes = len(thicknesses) * 2 + 2
-
-    # Define nodes and set boundary conditions for simple shear deformation
-    # Start at top and build down?
-    nd = OrderedDict()
-    nd["R0L"] = o3.node.Node(osi, 0, 0)  # row 0 left
-    nd["R0R"] = o3.node.Node(osi, ele_width, 0)
-    for i in range(1, n_node_rows):
-        # Establish left and right nodes
-        nd[f"R{i}L"] = o3.node.Node(osi, 0, -node_depths[i])
-        nd[f"R{i}R"] = o3.node.Node(osi, ele_width, -node_depths[i])
-        # set x and y dofs equal for left and right nodes
-        o3.EqualDOF(osi, nd[f"R{i}L"], nd[f"R{i}R"], [o3.cc.X, o3.cc.Y])
-
-    # Fix base nodes
-    o3.Fix2DOF(osi, nd[f"R{n_node_rows - 1}L"], o3.cc.FREE, o3.cc.FIXED)
-    o3.Fix2DOF(osi, nd[f"R{n_node_rows - 1}R"], o3.cc.FREE, o3.cc.FIXED)
-
-    # Define dashpot nodes
-    dashpot_node_l = o3.node.Node(osi, 0, -node_depths[-1])
-    dashpot_node_2 = o3.node.Node(osi, 0, -node_depths[-1])
-    o3.Fix2DOF(osi, dashpot_node_l,  o3.cc.FIXED, o3.cc.FIXED)
-    o3.Fix2DOF(osi, dashpot_node_2, o3.cc.FREE, o3.cc.FIXED)
-
-    # define equal DOF for dashpot and soil base nodes
-    o3.EqualDOF(osi, nd[f"R{n_node_rows - 1}L"], nd[f"R{n_node_rows - 1}R"], [o3.cc.X])
-    o3.EqualDOF(osi, nd[f"R{n_node_rows - 1}L"], dashpot_node_2, [o3.cc.X])
 
     # define materials
     ele_thick = 1.0  # m
@@ -84,7 +52,6 @@ def site_response(sp, asig, linear=0):
     strains = np.logspace(-6, -0.5, 16)
     ref_strain = 0.005
     rats = 1. / (1 + (strains / ref_strain) ** 0.91)
-    eles = []
     for i in range(len(thicknesses)):
         if not linear:
             mat = o3.nd_material.PressureIndependMultiYield(osi, 2, unit_masses[i], g_mods[i],
@@ -95,15 +62,17 @@ def site_response(sp, asig, linear=0):
             mat = o3.nd_material.ElasticIsotropic(osi, youngs_mods[i], poissons_ratio[i], rho=unit_masses[i])
         soil_mats.append(mat)
 
-        # def element
-        nodes = [nd[f"R{i + 1}L"], nd[f"R{i + 1}R"], nd[f"R{i}R"], nd[f"R{i}L"]]
-        ele = o3.element.Quad(osi, nodes, ele_thick, o3.cc.PLANE_STRAIN, mat, b2=grav * unit_masses[i])
-        eles.append(ele)
-
-    # define material and element for viscous dampers
-    c_base = ele_width * unit_masses[-1] * shear_vels[-1]
-    dashpot_mat = o3.uniaxial_material.Viscous(osi, c_base, alpha=1.)
-    o3.element.ZeroLength(osi, [dashpot_node_l, dashpot_node_2], mats=[dashpot_mat], dirs=[o3.cc.DOF2D_X])
+    # Define nodes, elements, compliant base and the base dashpot
+    body_forces = [[0.0, grav * unit_masses[i]] for i in range(len(thicknesses))]
+    mesh = o3.tools.build_soil_mesh(osi, thicknesses, soil_mats, ele_h=thicknesses, width=ele_width,
+                                    ele_type='Quad', thick=ele_thick, otype=o3.cc.PLANE_STRAIN,
+                                    body_forces=body_forces, tie_lateral=False,
+                                    base_imp=unit_masses[-1] * shear_vels[-1])
+    # set x and y dofs equal for left and right nodes below the surface for simple shear deformation
+    o3.build_equal_dofs(osi, mesh.node_tags[1:-1, 0], mesh.node_tags[1:-1, 1], [o3.cc.X, o3.cc.Y])
+    c_base = mesh.c_base
+    surface_node = mesh.get_node(0, 0)
+    eles = [ele for ele_set in mesh.ele_sets for ele in ele_set]
 
     # Static analysis
     o3.constraints.Transformation(osi)
@@ -123,14 +92,14 @@ def site_response(sp, asig, linear=0):
     o3.set_time(osi, 0.0)
     o3.wipe_analysis(osi)
 
-    # o3.recorder.NodeToFile(osi, 'sample_out.txt', node=nd["R0L"], dofs=[o3.cc.X], res_type='accel')
-    na = o3.recorder.NodeToArrayCache(osi, node=nd["R0L"], dofs=[o3.cc.X], res_type='accel')
+    # o3.recorder.NodeToFile(osi, 'sample_out.txt', node=surface_node, dofs=[o3.cc.X], res_type='accel')
+    na = o3.recorder.NodeToArrayCache(osi, node=surface_node, dofs=[o3.cc.X], res_type='accel')
     es = o3.recorder.ElementsToArrayCache(osi, eles=eles, arg_vals=['stress'])
 
     # Define the dynamic analysis
     ts_obj = o3.time_series.Path(osi, dt=asig.dt, values=asig.velocity * -1, factor=c_base)
     o3.pattern.Plain(osi, ts_obj)
-    o3.Load(osi, nd["R{0}L".format(n_node_rows - 1)], [1., 0.])
+    o3.Load(osi, mesh.base_node, [1., 0.])
 
     # Run the dynamic analysis
     o3.algorithm.Newton(osi)
@@ -2,10 +2,19 @@ from o3seespy.opensees_instance import OpenSeesInstance
 from o3seespy import exceptions
 from o3seespy import cc
 from o3seespy import cc as static  # deprecated
-from o3seespy.command import node, algorithm, rayleigh, test, uniaxial_material, element, nd_material
 from o3seespy.command.common import *
-from o3seespy.command import section, beam_integration, transformation, constraints, numberer, system, region
-from o3seespy.command import integrator, analysis, recorder, pattern, time_series, geom_transf, patch, layer
-import o3seespy.tools
-from o3seespy.command import test_check  # deprecated
+from o3seespy.extensions import get_lazy_attrs as _get_lazy_attrs
 
+_lazy_modules = {  # imported on first access, e.g. o3.element
+    'o3seespy.command.node': [], 'o3seespy.command.algorithm': [], 'o3seespy.command.rayleigh': [],
+    'o3seespy.command.test': [], 'o3seespy.command.uniaxial_material': [], 'o3seespy.command.element': [],
+    'o3seespy.command.nd_material': [], 'o3seespy.command.section': [], 'o3seespy.command.beam_integration': [],
+    'o3seespy.command.transformation': [], 'o3seespy.command.constraints': [], 'o3seespy.command.numberer': [],
+    'o3seespy.command.system': [], 'o3seespy.command.region': [], 'o3seespy.command.integrator': [],
+    'o3seespy.command.analysis': [], 'o3seespy.command.recorder': [], 'o3seespy.command.pattern': [],
+    'o3seespy.command.time_series': [], 'o3seespy.command.geom_transf': [], 'o3seespy.command.patch': [],
+    'o3seespy.command.layer': [], 'o3seespy.command.fiber': [], 'o3seespy.tools': [], 'o3seespy.snapshot': [],
+    'o3seespy.command.test_check': [],  # deprecated
+}
+__getattr__, __dir__, _ = _get_lazy_attrs(__name__, _lazy_modules, globals())
+__all__ = [x for x in __dir__() if x[0] != '_']  # star-imports also bind the lazy submodules
@@ -0,0 +1,382 @@
+from o3seespy import exceptions
+
+# position of the tag in the parameters, used to check for duplicate tags
+_tag_index = {'node': 0, 'element': 1, 'uniaxialMaterial': 1, 'nDMaterial': 1, 'section': 1, 'timeSeries': 1,
+              'geomTransf': 1, 'beamIntegration': 1}
+
+_opy = None
+
+
+def get_opy_module():
+    """The openseespy module (or custom_openseespy if installed), imported on first use"""
+    global _opy
+    if _opy is None:
+        try:
+            import custom_openseespy.opensees as opy
+        except ModuleNotFoundError:
+            import openseespy.opensees as opy
+        _opy = opy
+    return _opy
+
+
+class BackendError(Exception):
+    pass
+
+
+class Backend(object):
+    """
+    Target of the commands of an OpenSeesInstance
+
+    Subclasses implement `_get_func`, which returns the function that processes a command,
+    functions are cached in `funcs` so that the lookup is only performed once per op_base_type.
+    """
+    name = '<not-set>'
+    error = BackendError  # type of exception raised by the functions if a command is invalid
+    batched = False  # if True then `call_many` is used to process several commands
+
+    def __init__(self):
+        self.funcs = {}  # op_base_type: function
+
+    def get_func(self, op_base_type):
+        try:
+            return self.funcs[op_base_type]
+        except KeyError:
+            pass
+        func = self._get_func(op_base_type)
+        self.funcs[op_base_type] = func
+        return func
+
+    def _get_func(self, op_base_type):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class OpenSeesBackend(Backend):
+    """Runs commands in the openseespy domain of the current process"""
+    name = 'opensees'
+
+    def __init__(self):
+        super(OpenSeesBackend, self).__init__()
+        self.error = get_opy_module().OpenSeesError
+
+    def _get_func(self, op_base_type):
+        try:
+            return getattr(get_opy_module(), op_base_type)
+        except AttributeError:
+            raise exceptions.ModelError("op_base_type: '%s' does not exist in opensees module" % op_base_type)
+
+
+class RecordingBackend(Backend):
+    """
+    Records commands without running them, used to validate or export a model without an OpenSees domain
+
+    Duplicate tags raise a `BackendError`. `analyze` returns 0 (successful), `getNodeTags` and `getEleTags`
+    return the recorded tags and other commands return None.
+
+    Parameters
+    ----------
+    store: bool
+        If True then the (op_base_type, parameters) of each command are stored in `commands`
+    """
+    name = 'recording'
+
+    def __init__(self, store=True):
+        super(RecordingBackend, self).__init__()
+        self.store = store
+        self.commands = []
+        self.tags = {}  # op_base_type: set of tags
+
+    def _get_func(self, op_base_type):
+        if op_base_type == 'wipe':
+            return self._wipe
+        if op_base_type == 'getNodeTags':
+            return lambda *args: sorted(self.tags.get('node', []))
+        if op_base_type == 'getEleTags':
+            return lambda *args: sorted(self.tags.get('element', []))
+        output = 0 if op_base_type == 'analyze' else None
+        ind = _tag_index.get(op_base_type)
+        tags = self.tags.setdefault(op_base_type, set()) if ind is not None else None
+        commands = self.commands
+
+        def func(*parameters):
+            if tags is not None:
+                tag = parameters[ind]
+                if tag in tags:
+                    raise BackendError(f'{op_base_type} with tag {tag} already exists')
+                tags.add(tag)
+            if self.store:
+                commands.append((op_base_type, list(parameters)))
+            return output
+        return func
+
+    def _wipe(self):
+        for op_base_type in self.tags:
+            self.tags[op_base_type].clear()
+        if self.store:
+            self.commands.append(('wipe', []))
+
+
+# commands that define the model and return None, sent to a remote worker in batches without waiting for a reply
+_batched_commands = {'wipe', 'model', 'node', 'element', 'uniaxialMaterial', 'nDMaterial', 'section', 'fiber',
+                     'patch', 'layer', 'timeSeries', 'pattern', 'load', 'eleLoad', 'sp', 'groundMotion',
+                     'imposedMotion', 'geomTransf', 'beamIntegration', 'fix', 'fixX', 'fixY', 'fixZ', 'mass',
+                     'equalDOF', 'equalDOF_Mixed', 'rigidDiaphragm', 'rigidLink', 'region', 'rayleigh',
+                     'frictionModel', 'constraints', 'numberer', 'system', 'test', 'algorithm', 'integrator',
+                     'analysis', 'loadConst', 'setTime', 'wipeAnalysis', 'updateMaterialStage', 'setParameter'}
+
+
+def _is_float_output(output):
+    if isinstance(output, float):
+        return True
+    return isinstance(output, list) and len(output) and isinstance(output[0], float)
+
+
+def _to_float_array(outputs):
+    """Outputs as a numpy array if they are floats or lists of floats of the same length, otherwise None"""
+    if not _is_float_output(outputs[0]):
+        return None
+    import numpy as np
+    try:
+        values = np.array(outputs)
+    except (ValueError, TypeError):  # outputs of different lengths
+        return None
+    return values if values.dtype == float else None
+
+
+def _to_shared_memory(values):
+    """
+    Copy a float array to a new shared memory block
+
+    The block stays registered with the resource tracker of the worker, so it is unlinked if the processes exit
+    before the receiving process has sent 'release'.
+    """
+    import numpy as np
+    from multiprocessing import shared_memory
+    shm = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+    np.ndarray(values.shape, dtype=float, buffer=shm.buf)[...] = values
+    return shm
+
+
+def _from_shared_memory(name, shape):
+    import numpy as np
+    from multiprocessing import shared_memory
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        values = np.array(np.ndarray(shape, dtype=float, buffer=shm.buf), copy=True)  # copied before the block is freed
+    finally:
+        shm.close()
+    return values
+
+
+def _remote_worker(conn, min_shared_size):
+    """Run the commands received from `conn` in the openseespy domain of this process"""
+    from o3seespy import extensions
+    opy = get_opy_module()
+    funcs = {}
+    error = None  # error of a batched command, reported on the next command that is replied to
+    n_skipped = 0  # number of batched commands not run since the error
+    shared = {}  # name: shared memory block, unlinked once the values have been copied by the receiving process
+
+    def get_func(op_base_type):
+        if op_base_type not in funcs:
+            try:
+                funcs[op_base_type] = getattr(opy, op_base_type)
+            except AttributeError:
+                raise exceptions.ModelError("op_base_type: '%s' does not exist in opensees module" % op_base_type)
+        return funcs[op_base_type]
+
+    def run(op_base_type, parameters_list):
+        func = get_func(op_base_type)
+        outputs = []
+        for parameters in parameters_list:
+            try:
+                outputs.append(func(*parameters))
+            except Exception as e:
+                com = extensions.to_commands(op_base_type, parameters, max_params=40)
+                raise BackendError('{0} caused error "{1}"'.format(com, e))
+        return outputs
+
+    try:
+        while True:
+            message = conn.recv()
+            if message is None:
+                break
+            kind, op_base_type, data = message
+            if kind == 'release':  # values of a shared memory block have been copied
+                shm = shared.pop(data)
+                shm.close()
+                shm.unlink()
+                continue
+            if kind == 'batch':
+                if error is not None:  # later commands depend on the failed one, so are not run
+                    n_skipped += len(data)
+                    continue
+                for i, (op_base_type, parameters) in enumerate(data):
+                    try:
+                        run(op_base_type, [parameters])
+                    except Exception as e:
+                        error = str(e)
+                        n_skipped = len(data) - i - 1
+                        break
+                continue
+            if error is not None:
+                conn.send((False, f'Batched command {error}, the {n_skipped} batched commands after it and '
+                                  f'{op_base_type} were not run'))
+                error = None
+                continue
+            try:
+                if kind == 'call':
+                    conn.send((True, get_func(op_base_type)(*data)))
+                else:  # 'many'
+                    outputs = run(op_base_type, data)
+                    values = _to_float_array(outputs) if len(outputs) else None
+                    if values is None:
+                        conn.send((True, outputs))
+                    elif values.size < min_shared_size:
+                        conn.send((True, values))
+                    else:
+                        shm = _to_shared_memory(values)
+                        shared[shm.name] = shm
+                        conn.send(('shared', (shm.name, values.shape)))
+            except Exception as e:
+                conn.send((False, str(e)))
+    finally:
+        for shm in shared.values():  # not released, e.g. the receiving process has stopped
+            shm.close()
+            shm.unlink()
+    conn.close()
+
+
+def _stop_worker(conn, process):
+    if process.is_alive():
+        try:
+            conn.send(None)
+        except (OSError, ValueError):
+            pass
+        process.join(timeout=5)
+    conn.close()
+
+
+class RemoteBackend(Backend):
+    """
+    Runs commands in the openseespy domain of a worker process
+
+    The worker is independent of the openseespy domain of the current process and of other workers, so several
+    models can be built and analysed at the same time from one process (see `OpenSeesInstance(isolated=True)`).
+    Commands that define the model (e.g. node, element) are sent in batches without waiting for a reply,
+    if a batched command fails then the commands sent after it are not run and the error (which names the failed
+    command) is raised by the next command that returns a value (or by `sync`), that command is also not run.
+    Float outputs of `call_many` are returned as a numpy array, through shared memory if they have at least
+    `min_shared_size` values.
+    The worker is stopped by `close` or when the backend is garbage collected.
+
+    Parameters
+    ----------
+    batch_size: int
+        Maximum number of commands in a batch, if 0 then every command waits for a reply
+    min_shared_size: int
+        Minimum number of float values to return through shared memory
+    """
+    name = 'remote'
+    batched = True
+
+    def __init__(self, batch_size=1000, min_shared_size=10000):
+        import multiprocessing
+        import weakref
+        from multiprocessing import resource_tracker
+        super(RemoteBackend, self).__init__()
+        resource_tracker.ensure_running()  # shared with the worker, so shared memory blocks are tracked by one process
+        self.batch_size = batch_size
+        self.buffer = []  # (op_base_type, parameters) waiting to be sent
+        self.conn, child_conn = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(target=_remote_worker, args=(child_conn, min_shared_size), daemon=True)
+        self.process.start()
+        child_conn.close()
+        self._finalizer = weakref.finalize(self, _stop_worker, self.conn, self.process)
+
+    def _get_func(self, op_base_type):
+        if self.batch_size and op_base_type in _batched_commands:
+            buffer = self.buffer
+
+            def func(*parameters):
+                buffer.append((op_base_type, parameters))
+                if len(buffer) >= self.batch_size:
+                    self.send_batch()
+            return func
+
+        def func(*parameters):
+            return self._request('call', op_base_type, parameters)
+        return func
+
+    def _request(self, kind, op_base_type, data):
+        if self.buffer:
+            self.send_batch()
+        self.conn.send((kind, op_base_type, data))
+        ok, output = self.conn.recv()
+        if ok == 'shared':
+            name, shape = output
+            try:
+                return _from_shared_memory(name, shape)
+            finally:
+                self.conn.send(('release', None, name))  # the worker unlinks the block
+        if not ok:
+            raise BackendError(output)
+        return output
+
+    def send_batch(self):
+        """Send the buffered commands to the worker without waiting for them to be run"""
+        self.conn.send(('batch', None, self.buffer[:]))
+        del self.buffer[:]
+
+    def sync(self):
+        """Wait for all sent commands to be run, raises the error of a batched command if any"""
+        self._request('call', 'getNDM', ())  # cheap command that is replied to after all batches have run
+
+    def call_many(self, op_base_type, parameters_list):
+        """
+        Run the same command for several sets of parameters with a single message
+
+        Returns a numpy array if the outputs are floats (or lists of floats of the same length), otherwise a list
+        """
+        parameters_list = [tuple(x) for x in parameters_list]
+        if self.batch_size and op_base_type in _batched_commands:
+            self.buffer += [(op_base_type, x) for x in parameters_list]
+            if len(self.buffer) >= self.batch_size:
+                self.send_batch()
+            return [None] * len(parameters_list)
+        return self._request('many', op_base_type, parameters_list)
+
+    def close(self):
+        self._finalizer()
+
+
+_backends = {'opensees': OpenSeesBackend, 'recording': RecordingBackend, 'remote': RemoteBackend}
+_default_backend = None
+
+
+def get_default_backend():
+    """Backend shared by all OpenSeesInstances that use the openseespy domain of the current process"""
+    global _default_backend
+    if _default_backend is None:
+        _default_backend = OpenSeesBackend()
+    return _default_backend
+
+
+def get_backend(backend=None):
+    """
+    Backend from its name or instance
+
+    Parameters
+    ----------
+    backend: str or Backend, optional
+        'opensees' (default), 'recording' or 'remote', new 'recording' and 'remote' backends are created for each call
+    """
+    if backend is None or backend == 'opensees':
+        return get_default_backend()
+    if isinstance(backend, Backend):
+        return backend
+    if backend not in _backends:
+        raise ValueError(f"backend must be one of: {list(_backends)} or a Backend, not '{backend}'")
+    return _backends[backend]()
@@ -1,10 +1,126 @@
 from collections import OrderedDict
-try:
-    import custom_openseespy.opensees as opy
-except ModuleNotFoundError:
-    import openseespy.opensees as opy
 from o3seespy import exceptions
 from o3seespy import extensions
+from o3seespy.backend import get_default_backend
+
+# op_base_types that can be interned (tag is the second parameter) and the tag counter of the OpenSeesInstance
+_intern_counters = {'uniaxialMaterial': 'n_mat', 'nDMaterial': 'n_mat', 'section': 'n_sect'}
+# types that are defined by the commands that follow them (e.g. patch, fiber), so can not be interned
+_not_interned_types = {'Fiber', 'FiberThermal', 'NDFiber'}
+
+
+_model_dims = {}  # (ndm, ndf): _ModelDims, shared by the lean records
+
+
+class _ModelDims(object):
+    __slots__ = ('ndm', 'ndf')
+
+    def __init__(self, ndm, ndf):
+        self.ndm = ndm
+        self.ndf = ndf
+
+
+def _get_model_dims(ndm, ndf):
+    if (ndm, ndf) not in _model_dims:
+        _model_dims[(ndm, ndf)] = _ModelDims(ndm, ndf)
+    return _model_dims[(ndm, ndf)]
+
+
+class InputRef(object):
+    """
+    Weak reference to an object that is an input of a lean record
+
+    The tag is always available, other attributes are taken from the object while it exists.
+    """
+    __slots__ = ('tag', '_ref')
+
+    def __init__(self, obj):
+        import weakref
+        self.tag = obj.tag
+        self._ref = weakref.ref(obj)
+
+    def __getattr__(self, name):
+        obj = self._ref()
+        if obj is None:
+            raise AttributeError(f"Input object with tag {self.tag} has been deleted, '{name}' is not available")
+        return getattr(obj, name)
+
+
+def _to_lean_input(value):
+    if isinstance(value, OpenSeesObject):  # one reference is shared by all records that use the object
+        ref = value.__dict__.get('_input_ref')
+        if ref is None:
+            ref = value._input_ref = InputRef(value)
+        return ref
+    if isinstance(value, (list, tuple)) and any([isinstance(x, OpenSeesObject) for x in value]):
+        return [_to_lean_input(x) for x in value]
+    return value
+
+
+class LeanRecord(object):
+    """
+    Tag and inputs of an object that has been sent to OpenSees in lean mode (see `OpenSeesInstance(lean=True)`)
+
+    Other attributes (e.g. `parameters`, `to_dict()`) are taken from a copy of the object that is rebuilt from
+    the inputs on each access. Inputs that are OpenSeesObjects are stored as weak references (`InputRef`).
+    """
+    __slots__ = ('tag', '_cls', '_dims', '_inputs')
+
+    def __init__(self, obj, osi, args, kwargs):
+        self.tag = obj.tag
+        self._cls = obj.__class__
+        self._dims = _get_model_dims(osi.ndm, osi.ndf)
+        if kwargs:
+            kwargs = {k: _to_lean_input(v) for k, v in kwargs.items()}
+        self._inputs = (kwargs or None, *[_to_lean_input(x) for x in args])
+
+    def __getattr__(self, name):  # only called for attributes that are not slots
+        if name[:2] == '__':
+            raise AttributeError(f"'{self._cls.__name__}' lean record has no attribute '{name}'")
+        return getattr(self.rebuild(), name)
+
+    @property
+    def op_base_type(self):
+        return self._cls.op_base_type
+
+    @property
+    def op_type(self):
+        return self._cls.op_type
+
+    def rebuild(self):
+        """Create a copy of the object from its inputs without processing it"""
+        kwargs, *args = self._inputs
+        obj = object.__new__(self._cls)
+        obj.__init__(StandInInstance(self._dims, self.tag), *args, **(kwargs or {}))
+        return obj
+
+    @property
+    def parameters(self):
+        return self.rebuild().parameters
+
+    def to_dict(self):
+        return self.rebuild().to_dict()
+
+    def to_commands(self):
+        return self.rebuild().to_commands()
+
+
+def lean_new(cls, *args, **kwargs):
+    """
+    Object creation that returns a lean record in lean mode (see `OpenSeesInstance(lean=True)`)
+
+    Used as `__new__` of the classes that are created in large numbers (nodes, elements, time series).
+    If the instance is lean and executes (state=0), the object is built, sent to OpenSees and replaced by
+    its lean record (`OpenSeesObject._to_lean_record`), otherwise the object is created as usual.
+    """
+    obj = object.__new__(cls)
+    osi = args[0] if len(args) else kwargs.get('osi')
+    if not getattr(osi, 'lean', False) or osi.state != 0:
+        return obj
+    args = args[1:]
+    kwargs = {k: v for k, v in kwargs.items() if k != 'osi'}
+    obj.__init__(osi, *args, **kwargs)
+    return obj._to_lean_record(osi, args, kwargs)  # not an instance of cls, so __init__ is not called again
 
 
 class OpenSeesObject(object):
@@ -14,6 +130,10 @@ class OpenSeesObject(object):
     _name = None
     _parameters = None
 
+    def _to_lean_record(self, osi, args, kwargs):
+        """Compact replacement of the object once it has been sent to OpenSees in lean mode"""
+        return LeanRecord(self, osi, args, kwargs)
+
     @property  # deliberately no setter method
     def tag(self):
         return self._tag
@@ -23,38 +143,82 @@ class OpenSeesObject(object):
         return self._name
 
     def to_process(self, osi):
-        if osi.state == 0:
-            self.to_opensees()
-        if osi.state == 1:
-            osi.to_commands(self.to_commands())
+        if osi.interned is not None and self.op_base_type in _intern_counters and self._intern(osi):
+            return
+        if osi.history is not None:
+            osi.history.append((self.op_base_type, self._parameters))
+        if osi.state == 0:  # fast path, the backend function is cached and errors are only formatted on failure
+            backend = osi.backend
+            try:
+                func = backend.funcs[self.op_base_type]
+            except KeyError:
+                func = backend.get_func(self.op_base_type)
+            try:
+                func(*self._parameters)
+            except (backend.error, SystemError) as e:
+                self._raise_opensees_error(e)
+        elif osi.state == 1:
+            osi.to_export(self.op_base_type, self.parameters)
         elif osi.state == 2:
             osi.to_dict(self)
         elif osi.state == 3:
-            osi.to_commands(self.to_commands())
-            self.to_opensees()
+            osi.to_export(self.op_base_type, self.parameters)
+            self.to_opensees(osi.backend)
         elif osi.state == 4:
-            osi.to_commands(self.to_commands())
+            osi.to_export(self.op_base_type, self.parameters)
+        elif osi.state == 5:
+            osi.to_queue(self.op_base_type, self._parameters)
 
-    def to_opensees(self):
+    def _intern(self, osi):
+        """
+        Reuse the tag of an identical object that has already been processed (`OpenSeesInstance(intern=True)`)
+
+        Returns True if an identical object exists, the tag of this object is then set to its tag,
+        otherwise the object is stored so that later identical objects reuse its tag.
+        """
+        pms = self._parameters
+        if self.op_type in _not_interned_types:
+            return False
         try:
-            try:
-                return getattr(opy, self.op_base_type)(*self.parameters)
-            except opy.OpenSeesError as e:
-                com = extensions.to_commands(self.op_base_type, self.parameters)
-                raise ValueError('{0} caused error "{1}"'.format(com, e))
-
-        except SystemError as e:
-            if None in self.parameters:
-                print(self.parameters)
-                raise exceptions.ModelError("%s of type: %s contains 'None'" % (self.op_base_type, self.op_type))
-            else:
-                raise SystemError(e)
-        except AttributeError as e:
-            print(e)
-            print('opensees.{0}({1}) caused error "{2}"'.format(self.op_base_type,
-                                                                               ','.join(str(x) for x in self.parameters),
-                                                                                        e))
-            raise exceptions.ModelError("op_base_type: '%s' does not exist in opensees module" % self.op_base_type)
+            tag = osi.interned.setdefault((self.op_base_type, pms[0], *pms[2:]), self._tag)
+        except TypeError:  # unhashable parameter
+            return False
+        if tag == self._tag:
+            return False
+        counter = _intern_counters[self.op_base_type]
+        if getattr(osi, counter) == self._tag:  # tag is unused so it can be given to the next object
+            setattr(osi, counter, self._tag - 1)
+        self._tag = tag
+        pms[1] = tag
+        return True
+
+    def to_opensees(self, backend=None):
+        """
+        Send the object to OpenSees
+
+        Parameters
+        ----------
+        backend: Backend or o3seespy.OpenSeesInstance, optional
+            Backend, or instance whose backend is used, default is the openseespy domain of the current process
+        """
+        if backend is None:
+            backend = get_default_backend()
+        elif hasattr(backend, 'backend'):  # an OpenSeesInstance
+            backend = backend.backend
+        try:
+            return backend.get_func(self.op_base_type)(*self.parameters)
+        except (backend.error, SystemError) as e:
+            self._raise_opensees_error(e)
+
+    def _raise_opensees_error(self, e):
+        pms = self.parameters
+        if not isinstance(e, SystemError):  # error from the backend
+            com = extensions.to_commands(self.op_base_type, pms, max_params=40)
+            raise ValueError('{0} caused error "{1}"'.format(com, e))
+        if None in pms:
+            print(pms)
+            raise exceptions.ModelError("%s of type: %s contains 'None'" % (self.op_base_type, self.op_type))
+        raise e
 
     def to_commands(self):
         return extensions.to_commands(self.op_base_type, self.parameters)
@@ -83,6 +247,65 @@ class OpenSeesObject(object):
         return outputs
 
 
+class StandInInstance(object):
+    """
+    Stand-in for an OpenSeesInstance that does not process objects
+
+    Used to build an object without sending it to OpenSees, e.g. to obtain its parameters.
+    All tag counters are set so that the object is given the tag `tag`.
+    """
+    state = -1
+    lean = False
+    history = None
+    interned = None
+
+    def __init__(self, osi, tag=1):
+        self.ndm = osi.ndm
+        self.ndf = osi.ndf
+        prev_tag = tag - 1 if tag is not None else 0
+        for name in ['n_node', 'n_con', 'n_ele', 'n_mat', 'n_sect', 'n_tseries', 'n_pat', 'n_fix', 'n_integ',
+                     'n_transformation', 'n_region']:
+            setattr(self, name, prev_tag)
+
+    def to_process(self, op_base_type, parameters):
+        return None
+
+
+class OpenSeesMultiObject(OpenSeesObject):
+    """
+    Several OpenSees objects of the same type that are created together
+
+    Subclasses store the inputs as arrays and build the parameters of each object in `parameters_list`.
+    """
+    _parameters_list = None
+
+    @property
+    def parameters_list(self):
+        return self._parameters_list
+
+    def to_process(self, osi):
+        if osi.state == 2:
+            osi.to_dict_many(self.op_type, self.to_dicts())
+            return
+        if osi.history is not None:
+            osi.history.extend([(self.op_base_type, pms) for pms in self.parameters_list])
+        if osi.state in [1, 3, 4]:
+            osi.to_export_many(self.op_base_type, self.parameters_list)
+        if osi.state in [0, 3]:
+            osi.to_opensees_many(self.op_base_type, self.parameters_list)
+        elif osi.state == 5:
+            for parameters in self.parameters_list:
+                osi.to_queue(self.op_base_type, parameters)
+
+    def to_commands(self):
+        return '\n'.join([extensions.to_commands(self.op_base_type, pms) for pms in self.parameters_list])
+
+    def to_dicts(self):
+        """Tag and inputs of each object, as given by `OpenSeesObject.to_dict`, for export to dict (state=2)"""
+        raise ValueError(f'{self.__class__.__name__} can not be exported to dict (state=2) since its objects do '
+                         f'not have tags')
+
+
 def collect_serial_value(value):
     if isinstance(value, str):
         return value
@@ -0,0 +1,11 @@
+from o3seespy.extensions import get_lazy_attrs as _get_lazy_attrs
+
+_lazy_modules = {  # submodule: names, imported on first access, e.g. o3seespy.command.section
+    'node': [], 'algorithm': [], 'rayleigh': [], 'test': [], 'uniaxial_material': [], 'element': [],
+    'nd_material': [], 'section': [], 'beam_integration': [], 'transformation': [], 'constraints': [],
+    'numberer': [], 'system': [], 'region': [], 'integrator': [], 'analysis': [], 'recorder': [], 'pattern': [],
+    'time_series': [], 'geom_transf': [], 'patch': [], 'layer': [], 'fiber': [], 'common': [],
+    'test_check': [],  # deprecated
+}
+__getattr__, __dir__, _ = _get_lazy_attrs(__name__, _lazy_modules, globals())
+__all__ = [x for x in __dir__() if x[0] != '_']
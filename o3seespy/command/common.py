@@ -1,4 +1,5 @@
-from o3seespy.base_model import OpenSeesObject
+from o3seespy import exceptions
+from o3seespy.base_model import OpenSeesObject, OpenSeesMultiObject
 from o3seespy.opensees_instance import OpenSeesInstance
 
 
@@ -55,6 +56,62 @@ class EqualDOF(OpenSeesObject):
         self.to_process(osi)
 
 
+class EqualDOFSet(OpenSeesMultiObject):
+    op_base_type = "equalDOF"
+    op_type = None
+
+    def __init__(self, r_node_tags, c_node_tags, dofs):
+        """
+        A set of equalDOF constraints with the same constrained degrees-of-freedom stored as arrays
+
+        Parameters
+        ----------
+        r_node_tags: array_like
+            Tags of the retained nodes
+        c_node_tags: array_like
+            Tags of the constrained nodes
+        dofs: list
+            Constrained degrees-of-freedom
+        """
+        import numpy as np
+        self.r_node_tags = np.asarray(r_node_tags, dtype=int).reshape(-1)
+        self.c_node_tags = np.asarray(c_node_tags, dtype=int).reshape(-1)
+        self.dofs = list(dofs)
+
+    @property
+    def parameters_list(self):
+        return [[r, c, *self.dofs] for r, c in zip(self.r_node_tags.tolist(), self.c_node_tags.tolist())]
+
+    def __len__(self):
+        return len(self.r_node_tags)
+
+
+def build_equal_dofs(osi, r_node_tags, c_node_tags, dofs):
+    """
+    Create many equalDOF constraints with the same constrained degrees-of-freedom
+
+    Parameters
+    ----------
+    osi: o3seespy.OpenSeesInstance
+    r_node_tags: array_like
+        Tags of the retained nodes, or a single tag for all constraints
+    c_node_tags: array_like
+        Tags of the constrained nodes
+    dofs: list
+        Constrained degrees-of-freedom
+
+    Returns
+    -------
+    EqualDOFSet
+    """
+    import numpy as np
+    c_node_tags = np.asarray(c_node_tags, dtype=int).reshape(-1)
+    r_node_tags = np.broadcast_to(np.asarray(r_node_tags, dtype=int), c_node_tags.shape)
+    eq_set = EqualDOFSet(r_node_tags, c_node_tags, dofs)
+    eq_set.to_process(osi)
+    return eq_set
+
+
 def set_rigid_diaphragm(osi, r_node, cnodes, perp_dir):
     cnode_tags = [x.tag for x in cnodes]
     op_type = 'rigidDiaphragm'
@@ -207,6 +264,54 @@ class Fix(OpenSeesObject):
         self.to_process(osi)
 
 
+class FixSet(OpenSeesMultiObject):
+    op_base_type = "fix"
+    op_type = None
+
+    def __init__(self, node_tags, fixities):
+        """
+        A set of homogeneous SP constraints with the same fixities stored as arrays
+
+        Parameters
+        ----------
+        node_tags: array_like
+            Node tags
+        fixities: list
+            Fixity of each degree-of-freedom (e.g. `[o3.cc.FIXED, o3.cc.FREE]`)
+        """
+        import numpy as np
+        self.node_tags = np.asarray(node_tags, dtype=int).reshape(-1)
+        self.fixities = list(fixities)
+
+    @property
+    def parameters_list(self):
+        return [[tag, *self.fixities] for tag in self.node_tags.tolist()]
+
+    def __len__(self):
+        return len(self.node_tags)
+
+
+def build_fixities(osi, node_tags, fixities):
+    """
+    Create homogeneous SP constraints with the same fixities for many nodes
+
+    Parameters
+    ----------
+    osi: o3seespy.OpenSeesInstance
+    node_tags: array_like
+        Node tags
+    fixities: list
+        Fixity of each degree-of-freedom (e.g. `[o3.cc.FIXED, o3.cc.FREE]`)
+
+    Returns
+    -------
+    FixSet
+    """
+    fix_set = FixSet(node_tags, fixities)
+    fix_set.to_process(osi)
+    return fix_set
+
+
 class Load(OpenSeesObject):
     op_base_type = "load"
     op_type = None
@@ -279,7 +384,20 @@ def analyze(osi, num_inc=1, dt=0.1, dt_min=None, dt_max=None, jd=None):
     else:
         parameters = [int(num_inc), float(dt), dt_min, dt_max, jd]
     # opy.analyze(*parameters)
-    return osi.to_process(op_type, parameters)
+    if not osi.array_recorders or osi.state not in [0, 3, 5]:
+        return osi.to_process(op_type, parameters)
+    if osi.state == 3:  # exported as a single command, the steps below are not exported
+        osi.to_export(op_type, parameters)
+    # step-by-step so that in-memory recorders are updated after each step
+    step_parameters = [1, *parameters[1:]]
+    for i in range(int(num_inc)):
+        res = osi.to_opensees(op_type, step_parameters)
+        if res != 0:
+            return res
+        time = osi.to_opensees('getTime', [])
+        for recorder in osi.array_recorders:
+            recorder.record(osi, time)
+    return 0
     # if osi.state in [1, 3]:
     #     para = []
     #     for i, e in enumerate(parameters):
@@ -293,6 +411,90 @@ def analyze(osi, num_inc=1, dt=0.1, dt_min=None, dt_max=None, jd=None):
     # return 0
 
 
+def analyze_adaptive(osi, num_inc=1, dt=0.1, algorithms=None, tests=None, dt_min=None, dt_factor=2, n_grow=4,
+                     verbose=0):
+    """
+    Run a transient analysis that recovers from non-convergence
+
+    If a step fails then each combination of the fallback algorithms and tests is tried, if all fail then the time
+    step is reduced by `dt_factor` (down to `dt_min`). After `n_grow` successful sub-steps the time step is
+    increased again by `dt_factor` (up to `dt`). The primary algorithm and test are restored after a fallback
+    succeeds.
+
+    Parameters
+    ----------
+    osi: o3seespy.OpenSeesInstance
+    num_inc: int
+        Number of analysis steps of size `dt`
+    dt: float
+        Time step
+    algorithms: list, optional
+        Algorithm objects (e.g. [o3.algorithm.Newton(osi), o3.algorithm.ModifiedNewton(osi)]), the first is the
+        primary algorithm and the others are fallbacks
+    tests: list, optional
+        Test objects, the first is the primary test and the others are fallbacks
+    dt_min: float, optional
+        Minimum time step, default is `dt / dt_factor ** 4`
+    dt_factor: float
+        Factor to reduce (or increase) the time step by
+    n_grow: int
+        Number of successful steps before the time step is increased
+    verbose: int
+        If 1 then print each fallback
+
+    Returns
+    -------
+    int
+        0 if successful, else the output of the failed `analyze` call
+    """
+    if osi.state not in [0, 3, 5]:
+        return analyze(osi, num_inc, dt)
+    if algorithms is None:
+        algorithms = [None]
+    if tests is None:
+        tests = [None]
+    ladder = [(alg, test) for alg in algorithms for test in tests]
+    if dt_min is None:
+        dt_min = dt / dt_factor ** 4
+    time = get_time(osi)
+    end_time = time + num_inc * dt
+    curr_dt = dt
+    n_ok = 0
+    while time < end_time - dt * 1.0e-6:
+        step_dt = min(curr_dt, end_time - time)
+        res = analyze(osi, 1, step_dt)
+        i = 0
+        while res != 0 and i + 1 < len(ladder):
+            i += 1
+            if verbose:
+                print(f'analyze_adaptive: time={time:.6g}, dt={step_dt:.4g} failed, trying fallback {i}: '
+                      f'{[x.op_type for x in ladder[i] if x is not None]}')
+            for obj in ladder[i]:
+                if obj is not None:
+                    obj.to_process(osi)
+            res = analyze(osi, 1, step_dt)
+        if i > 0:  # restore primary algorithm and test
+            for obj in ladder[0]:
+                if obj is not None:
+                    obj.to_process(osi)
+        if res != 0:
+            n_ok = 0
+            if curr_dt / dt_factor < dt_min * (1 - 1.0e-6):
+                if verbose:
+                    print(f'analyze_adaptive: failed at time={time:.6g} with dt={curr_dt:.4g}')
+                return res
+            curr_dt /= dt_factor
+            if verbose:
+                print(f'analyze_adaptive: time={time:.6g}, reducing dt to {curr_dt:.4g}')
+            continue
+        n_ok += 1
+        if curr_dt < dt and n_ok >= n_grow:
+            curr_dt = min(curr_dt * dt_factor, dt)
+            n_ok = 0
+        time = get_time(osi)
+    return 0
+
+
 def get_node_disp(osi, node, dof):
     op_type = 'nodeDisp'
     parameters = [node.tag, dof]
@@ -302,10 +504,47 @@ def get_node_disp(osi, node, dof):
 
 def get_all_node_disps(osi, dof):
     tags = get_node_tags(osi)
-    disps = []
-    for tag in tags:
-        disps.append(osi.to_process('nodeDisp', [tag, dof]))  # very slow
-    return disps
+    return osi.to_process_many('nodeDisp', [[tag, dof] for tag in tags])
+
+
+def _get_all_node_resps_as_array(osi, op_type, nodes=None):
+    import numpy as np
+    if osi.state not in [0, 3, 5]:
+        raise exceptions.ModelError(f'{op_type} is not available in state={osi.state}, since the model is not run')
+    if nodes is None:
+        tags = get_node_tags(osi)
+    elif hasattr(nodes, 'tags'):  # NodeSet
+        tags = nodes.tags.tolist()
+    else:
+        tags = [x.tag for x in nodes]
+    resps = osi.to_process_many(op_type, [[tag] for tag in tags])
+    if isinstance(resps, np.ndarray):  # float outputs of a remote backend
+        return np.array(tags, dtype=int), resps
+    n_dof = max([len(x) for x in resps], default=0)
+    vals = np.full((len(resps), n_dof), np.nan)
+    for i, resp in enumerate(resps):  # nodes may have different number of dofs
+        vals[i, :len(resp)] = resp
+    return np.array(tags, dtype=int), vals
+
+
+def get_all_node_disps_as_array(osi, nodes=None):
+    """
+    Get the displacements of all degrees-of-freedom of several nodes as a single array
+
+    Parameters
+    ----------
+    osi: o3seespy.OpenSeesInstance
+    nodes: list or o3seespy.node.NodeSet, optional
+        List of o3seespy.node.Node objects, if None then all nodes in the domain are used
+
+    Returns
+    -------
+    tags: array_like
+        Node tags, one per row of `disps`
+    disps: array_like (n_nodes, n_dof)
+        Nodal displacements, padded with NaN for nodes with fewer degrees-of-freedom
+    """
+    return _get_all_node_resps_as_array(osi, 'nodeDisp', nodes)
 
 
 def get_node_vel(osi, node, dof):
@@ -320,6 +559,34 @@ def get_node_accel(osi, node, dof):
     return osi.to_process(op_type, parameters)
 
 
+def get_all_node_vels(osi, dof):
+    tags = get_node_tags(osi)
+    return osi.to_process_many('nodeVel', [[tag, dof] for tag in tags])
+
+
+def get_all_node_vels_as_array(osi, nodes=None):
+    """
+    Get the velocities of all degrees-of-freedom of several nodes as a single array
+
+    See `get_all_node_disps_as_array`
+    """
+    return _get_all_node_resps_as_array(osi, 'nodeVel', nodes)
+
+
+def get_all_node_accels(osi, dof):
+    tags = get_node_tags(osi)
+    return osi.to_process_many('nodeAccel', [[tag, dof] for tag in tags])
+
+
+def get_all_node_accels_as_array(osi, nodes=None):
+    """
+    Get the accelerations of all degrees-of-freedom of several nodes as a single array
+
+    See `get_all_node_disps_as_array`
+    """
+    return _get_all_node_resps_as_array(osi, 'nodeAccel', nodes)
+
+
 def gen_reactions(osi):
     op_type = 'reactions'
     parameters = []
@@ -399,6 +666,9 @@ def wipe_analysis(osi):
 
 def wipe(osi):
     osi.to_process('wipe', [])
+    osi.array_recorders = []
+    if osi.interned is not None:
+        osi.interned.clear()
 
 
 def load_constant(osi, time=None):
@@ -465,14 +735,11 @@ def get_node_coords(osi, node, ndm=None):
 
 def get_all_node_coords(osi, ndm=None):
     tags = get_node_tags(osi)
-    coords = []
     if ndm is not None:
         pms = [ndm]
     else:
         pms = []
-    for tag in tags:
-        coords.append(osi.to_process('nodeCoord', [tag, *pms]))  # very slow
-    return coords
+    return osi.to_process_many('nodeCoord', [[tag, *pms] for tag in tags])
 
 
 def get_all_ele_node_tags(osi):
@@ -1,17 +1,31 @@
-from o3seespy.command.element.base_element import *
-from .beam_column import *
-from .bearing import *
-from .brick import *
-from .cable import *
-from .contact import *
-from .joint import *
-from .link import *
-from .misc import *
-from .other_up import *
-from .pfem import *
-from .quadrilateral import *
-from .tetrahedron import *
-from .triangular import *
-from .truss import *
-from .uc_san_diego_up import *
-from .zero_length import *
+from o3seespy.extensions import get_lazy_attrs as _get_lazy_attrs
+
+_lazy_modules = {  # submodule: names, imported on first access
+    'base_element': ['ElementBase', 'ElementSetItem', 'ElementSet'],
+    'beam_column': ['ElasticBeamColumn2D', 'ElasticBeamColumn3D', 'ModElasticBeam2D', 'ElasticTimoshenkoBeam2D',
+                    'ElasticTimoshenkoBeam3D', 'DispBeamColumn', 'ForceBeamColumn', 'NonlinearBeamColumn',
+                    'DispBeamColumnInt', 'MVLEM', 'SFIMVLEM'],
+    'bearing': ['ElastomericBearingPlasticity2D', 'ElastomericBearingPlasticity3D', 'ElastomericBearingBoucWen2D',
+                'ElastomericBearingBoucWen3D', 'FlatSliderBearing2D', 'FlatSliderBearing3D', 'SingleFPBearing2D',
+                'SingleFPBearing3D', 'TFP', 'TripleFrictionPendulum', 'MultipleShearSpring',
+                'KikuchiBearingadjustPDOutput', 'KikuchiBearingdoBalance', 'YamamotoBiaxialHDRcoRS', 'ElastomericX',
+                'LeadRubberX', 'HDR', 'FPBearingPTV'],
+    'brick': ['StdBrick', 'BbarBrick', 'Brick20N', 'SSPbrick'],
+    'cable': ['CatenaryCable'],
+    'contact': ['SimpleContact2D', 'SimpleContact3D', 'BeamContact2D', 'BeamContact3D', 'BeamEndContact3D'],
+    'joint': ['BeamColumnJoint', 'ElasticTubularJoint', 'Joint2D'],
+    'link': ['TwoNodeLink'],
+    'misc': ['SurfaceLoad', 'VS3D4', 'AC3D8', 'ASI3D8', 'AV3D4'],
+    'other_up': ['SSPquadUP', 'SSPbrickUP'],
+    'pfem': ['PFEMElementBubble', 'PFEMElementCompressible'],
+    'quadrilateral': ['Quad', 'ShellMITC4', 'ShellDKGQ', 'ShellDKGT', 'ShellNLDKGQ', 'ShellNLDKGT', 'ShellNL',
+                      'BbarQuad', 'EnhancedQuad', 'SSPquad'],
+    'tetrahedron': ['FourNodeTetrahedron'],
+    'triangular': ['Tri31'],
+    'truss': [],
+    'uc_san_diego_up': ['QuadUP', 'BrickUP', 'BbarQuadUP', 'BbarBrickUP', 'N94QuadUP', 'N208BrickUP'],
+    'zero_length': ['ZeroLength', 'ZeroLengthND', 'ZeroLengthSection', 'CoupledZeroLength',
+                    'ZeroLengthContact2Dnormal', 'ZeroLengthContact3D', 'ZeroLengthContactNTS2D',
+                    'ZeroLengthInterface2Ddof', 'ZeroLengthImpact3D'],
+}
+__getattr__, __dir__, __all__ = _get_lazy_attrs(__name__, _lazy_modules, globals())
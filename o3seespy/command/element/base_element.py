@@ -1,6 +1,129 @@
-from o3seespy.base_model import OpenSeesObject
+from collections import OrderedDict
+from o3seespy.base_model import OpenSeesObject, OpenSeesMultiObject, StandInInstance, collect_serial_value, lean_new
+from o3seespy.command.node import NodeSetItem
 
 
 class ElementBase(OpenSeesObject):
     op_base_type = "element"
+    __new__ = lean_new
 
+    @classmethod
+    def build_many(cls, osi, connectivity, *args, **kwargs):
+        """
+        Create many elements of this type that share the same properties
+
+        Parameters
+        ----------
+        osi: o3seespy.OpenSeesInstance
+        connectivity: array_like (n_ele, n_nodes)
+            Node tags of each element, in the same order as `ele_nodes`
+        args, kwargs:
+            Remaining inputs of the element (e.g. thick, otype, mat for Quad)
+
+        Returns
+        -------
+        ElementSet
+
+        Examples
+        --------
+        >>> import o3seespy as o3
+        >>> osi = o3.OpenSeesInstance(ndm=2, ndf=2)
+        >>> mat = o3.nd_material.ElasticIsotropic(osi, 1, 0.45)
+        >>> nodes = o3.node.build_nodes(osi, [[0, 0], [1, 0], [2, 0], [0, 1], [1, 1], [2, 1]])
+        >>> o3.element.SSPquad.build_many(osi, [[1, 2, 5, 4], [2, 3, 6, 5]], mat, 'PlaneStrain', 1.0, 0.0, 0.0)
+        """
+        return ElementSet.build(cls, osi, connectivity, *args, **kwargs)
+
+
+class ElementSetItem(object):
+    """A single element of an ElementSet, can be used in place of an element object"""
+    __slots__ = ('tag', 'ele_nodes')
+
+    def __init__(self, tag, node_tags):
+        self.tag = tag
+        self.ele_nodes = [NodeSetItem(x, None) for x in node_tags]
+
+
+class ElementSet(OpenSeesMultiObject):
+    op_base_type = "element"
+
+    def __init__(self, op_type, tags, connectivity, shared_parameters, properties=None):
+        """
+        A set of OpenSEES elements of the same type and properties stored as arrays
+
+        Iterating or indexing the set returns `ElementSetItem` objects, so the set can be used in place of a list of
+        element objects. Use the `build_many` method of an element class to create the elements in OpenSees.
+
+        Parameters
+        ----------
+        op_type: str
+            OpenSees element type
+        tags: array_like
+            Element tags
+        connectivity: array_like (n_ele, n_nodes)
+            Node tags of each element
+        shared_parameters: list
+            OpenSees parameters that follow the node tags, same for all elements
+        properties: dict
+            Input values shared by all elements
+        """
+        import numpy as np
+        self.op_type = op_type
+        self.tags = np.asarray(tags, dtype=int)
+        self.connectivity = np.asarray(connectivity, dtype=int).reshape(len(self.tags), -1)
+        self.shared_parameters = shared_parameters
+        if properties is None:
+            properties = {}
+        self.properties = properties
+
+    @classmethod
+    def build(cls, ele_cls, osi, connectivity, *args, **kwargs):
+        import numpy as np
+        connectivity = np.asarray(connectivity, dtype=int)
+        if connectivity.ndim == 1:
+            connectivity = connectivity.reshape(1, -1)
+        n_ele, n_nodes = connectivity.shape
+        # build one element without processing it to obtain the parameter layout
+        row = connectivity[0].tolist()
+        template = ele_cls(StandInInstance(osi), [NodeSetItem(x, None) for x in row], *args, **kwargs)
+        pms = template.parameters
+        if pms[1] != 1 or pms[2: 2 + n_nodes] != row:
+            raise ValueError(f'build_many not supported for {ele_cls.__name__}, the OpenSees parameters must start '
+                             f'with the element tag followed by the {n_nodes} node tags of `connectivity`')
+        properties = {}
+        for item in template.__dict__:
+            if item[0] != '_' and item != 'ele_nodes':
+                properties[item] = template.__dict__[item]
+        tags = np.arange(osi.n_ele + 1, osi.n_ele + n_ele + 1)
+        osi.n_ele += n_ele
+        ele_set = cls(pms[0], tags, connectivity, pms[2 + n_nodes:], properties)
+        ele_set.to_process(osi)
+        return ele_set
+
+    @property
+    def parameters_list(self):
+        tags = self.tags.tolist()
+        conn = self.connectivity.tolist()
+        return [[self.op_type, tags[i], *conn[i], *self.shared_parameters] for i in range(len(tags))]
+
+    def to_dicts(self):
+        properties = OrderedDict()
+        for item in self.properties:
+            if self.properties[item] is not None:
+                properties[item] = collect_serial_value(self.properties[item])
+        conn = self.connectivity.tolist()
+        return [(tag, OrderedDict([('ele_nodes', conn[i])], **properties)) for i, tag in enumerate(self.tags.tolist())]
+
+    def __len__(self):
+        return len(self.tags)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice) or hasattr(item, '__len__'):
+            return ElementSet(self.op_type, self.tags[item], self.connectivity[item], self.shared_parameters,
+                              self.properties)
+        return ElementSetItem(int(self.tags[item]), self.connectivity[item].tolist())
+
+    def __iter__(self):
+        conn = self.connectivity.tolist()
+        for i, tag in enumerate(self.tags.tolist()):
+            yield ElementSetItem(tag, conn[i])
@@ -0,0 +1,108 @@
+from o3seespy.base_model import OpenSeesObject, OpenSeesMultiObject
+
+
+class Fiber(OpenSeesObject):
+    """
+    The Fiber Class
+
+    This command allows the user to construct a single fiber and add it to the enclosing FiberSection or NDFiberSection.
+    """
+    op_base_type = "fiber"
+    op_type = None
+
+    def __init__(self, osi, y_loc, z_loc, area, mat):
+        """
+        Initial method for Fiber
+
+        Parameters
+        ----------
+        osi: o3seespy.OpenSeesInstance
+        y_loc: float
+            Y-coordinate of the fiber (local coordinate system)
+        z_loc: float
+            Z-coordinate of the fiber (local coordinate system)
+        area: float
+            Area of the fiber
+        mat: obj
+            Material object associated with this fiber (uniaxialmaterial object for a fibersection and ndmaterial object
+            for use in an ndfibersection).
+
+        Examples
+        --------
+        >>> import o3seespy as o3
+        >>> osi = o3.OpenSeesInstance(ndm=2)
+        >>> rebar = o3.uniaxial_material.Steel01(osi, fy=60.0, e0=30000.0, b=0.02)
+        >>> o3.section.Fiber(osi)
+        >>> o3.fiber.Fiber(osi, y_loc=0.1, z_loc=0.0, area=1.0e-4, mat=rebar)
+        """
+        self.y_loc = float(y_loc)
+        self.z_loc = float(z_loc)
+        self.area = float(area)
+        self.mat = mat
+        self._parameters = [self.y_loc, self.z_loc, self.area, self.mat.tag]
+        self.to_process(osi)
+
+
+class FiberSet(OpenSeesMultiObject):
+    op_base_type = "fiber"
+    op_type = None
+
+    def __init__(self, y_locs, z_locs, areas, mat_tags):
+        """
+        A set of fibers stored as arrays
+
+        Parameters
+        ----------
+        y_locs: array_like
+            Y-coordinate of each fiber (local coordinate system)
+        z_locs: array_like
+            Z-coordinate of each fiber (local coordinate system)
+        areas: array_like
+            Area of each fiber
+        mat_tags: int or array_like
+            Material tag of each fiber
+        """
+        import numpy as np
+        self.y_locs = np.asarray(y_locs, dtype=float).reshape(-1)
+        self.z_locs = np.asarray(z_locs, dtype=float).reshape(-1)
+        self.areas = np.asarray(areas, dtype=float).reshape(-1)
+        self.mat_tags = np.broadcast_to(np.asarray(mat_tags, dtype=int), self.y_locs.shape)
+
+    @property
+    def parameters_list(self):
+        if self._parameters_list is None:  # cached so the set can be processed for many sections
+            self._parameters_list = [list(x) for x in zip(self.y_locs.tolist(), self.z_locs.tolist(),
+                                                          self.areas.tolist(), self.mat_tags.tolist())]
+        return self._parameters_list
+
+    def __len__(self):
+        return len(self.y_locs)
+
+
+def build_fibers(osi, y_locs, z_locs, areas, mats):
+    """
+    Create many fibers in the current fiber section
+
+    Parameters
+    ----------
+    osi: o3seespy.OpenSeesInstance
+    y_locs: array_like
+        Y-coordinate of each fiber (local coordinate system)
+    z_locs: array_like
+        Z-coordinate of each fiber (local coordinate system)
+    areas: array_like
+        Area of each fiber
+    mats: obj or list
+        Material object of all fibers or of each fiber
+
+    Returns
+    -------
+    FiberSet
+    """
+    if hasattr(mats, 'tag'):
+        mat_tags = mats.tag
+    else:
+        mat_tags = [mat.tag for mat in mats]
+    fiber_set = FiberSet(y_locs, z_locs, areas, mat_tags)
+    fiber_set.to_process(osi)
+    return fiber_set
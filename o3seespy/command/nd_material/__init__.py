@@ -1,9 +1,16 @@
-from .base_material import NDMaterialBase
-from .concrete_walls import *
-from .contact import *
-from .other_material import *
-from .standard import *
-from .tsinghua_sand import *
-from .uc_san_diego_ud_soil import *
-from .uc_san_diego_soil import *
-from .wrapper import *
+from o3seespy.extensions import get_lazy_attrs as _get_lazy_attrs
+
+_lazy_modules = {  # submodule: names, imported on first access
+    'base_material': ['NDMaterialBase'],
+    'concrete_walls': ['PlaneStressUserMaterial', 'PlateFromPlaneStress', 'PlateRebar'],
+    'contact': ['ContactMaterial2D', 'ContactMaterial3D'],
+    'other_material': ['PM4Sand', 'update_material_stage'],
+    'standard': ['ElasticIsotropic', 'ElasticOrthotropic', 'J2Plasticity', 'DrukerPrager', 'Damage2p', 'PlaneStress',
+                 'PlaneStrain', 'MultiaxialCyclicPlasticity', 'BoundingCamClay', 'PlateFiber', 'FSAM',
+                 'ManzariDafalias', 'StressDensity', 'AcousticMedium'],
+    'tsinghua_sand': ['CycLiqCP', 'CycLiqCPSP'],
+    'uc_san_diego_ud_soil': ['FluidSolidPorousMaterial'],
+    'uc_san_diego_soil': ['PressureIndependMultiYield', 'PressureDependMultiYield', 'PressureDependMultiYield02'],
+    'wrapper': ['InitialStateAnalysisWrapper', 'InitStressNDMaterial', 'InitStrainNDMaterial'],
+}
+__getattr__, __dir__, __all__ = _get_lazy_attrs(__name__, _lazy_modules, globals())
@@ -1,9 +1,14 @@
-from o3seespy.base_model import OpenSeesObject
+from collections import OrderedDict
+from o3seespy.base_model import OpenSeesObject, OpenSeesMultiObject, lean_new
+
+_MASS_NAMES = {1: ['x_mass'], 2: ['x_mass', 'y_mass', 'z_rot_mass'],
+               3: ['x_mass', 'y_mass', 'z_mass', 'x_rot_mass', 'y_rot_mass', 'z_rot_mass']}
 
 
 class Node(OpenSeesObject):
     op_base_type = "node"
     op_type = "node"
+    __new__ = lean_new
     # x_con = None
     # y_con = None
     # z_con = None
@@ -79,3 +84,132 @@ class Node(OpenSeesObject):
         if self.acc is not None:
             self._parameters += ["-accel", self.acc]
         self.to_process(osi)
+
+    def _to_lean_record(self, osi, args, kwargs):
+        if len(self._parameters) > osi.ndm + 1:  # has masses, velocities or accelerations
+            return super(Node, self)._to_lean_record(osi, args, kwargs)
+        return NodeSetItem(self._tag, self.x, getattr(self, 'y', None), getattr(self, 'z', None))
+
+
+class NodeSetItem(object):
+    """A single node of a NodeSet, can be used in place of a Node object"""
+    __slots__ = ('tag', 'x', 'y', 'z')
+
+    def __init__(self, tag, x, y=None, z=None):
+        self.tag = tag
+        self.x = x
+        self.y = y
+        self.z = z
+
+
+class NodeSet(OpenSeesMultiObject):
+    op_base_type = "node"
+    op_type = "node"
+
+    def __init__(self, tags, coords, masses=None):
+        """
+        A set of OpenSEES nodes stored as arrays
+
+        Iterating or indexing the set returns `NodeSetItem` objects, so the set can be used in place of a list of
+        `Node` objects. Use `build_nodes` to create the nodes in OpenSees.
+
+        Parameters
+        ----------
+        tags: array_like
+            Node tags
+        coords: array_like (n, ndm)
+            Nodal coordinates
+        masses: array_like (n, ndf), optional
+            Nodal masses
+        """
+        import numpy as np
+        self.tags = np.asarray(tags, dtype=int)
+        self.coords = np.asarray(coords, dtype=float).reshape(len(self.tags), -1)
+        if masses is not None:
+            masses = np.asarray(masses, dtype=float)
+            if masses.ndim == 1:
+                masses = np.tile(masses, (len(self.tags), 1))
+        self.masses = masses
+
+    @property
+    def parameters_list(self):
+        tags = self.tags.tolist()
+        coords = self.coords.tolist()
+        if self.masses is None:
+            return [[tags[i], *coords[i]] for i in range(len(tags))]
+        masses = self.masses.tolist()
+        return [[tags[i], *coords[i], '-mass', *masses[i]] for i in range(len(tags))]
+
+    def to_dicts(self):
+        ndm = self.coords.shape[1]
+        coords = self.coords.tolist()
+        masses = None if self.masses is None else self.masses.tolist()
+        items = []
+        for i, tag in enumerate(self.tags.tolist()):
+            outputs = OrderedDict(zip(['x', 'y', 'z'][:ndm], coords[i]))
+            if masses is not None:
+                outputs.update(zip(_MASS_NAMES[ndm], masses[i]))
+            items.append((tag, outputs))
+        return items
+
+    def __len__(self):
+        return len(self.tags)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice) or hasattr(item, '__len__'):
+            masses = None if self.masses is None else self.masses[item]
+            return NodeSet(self.tags[item], self.coords[item], masses)
+        return NodeSetItem(int(self.tags[item]), *self.coords[item].tolist())
+
+    def __iter__(self):
+        coords = self.coords.tolist()
+        for i, tag in enumerate(self.tags.tolist()):
+            yield NodeSetItem(tag, *coords[i])
+
+    @property
+    def x(self):
+        return self.coords[:, 0]
+
+    @property
+    def y(self):
+        return self.coords[:, 1]
+
+    @property
+    def z(self):
+        return self.coords[:, 2]
+
+
+def build_nodes(osi, coords, masses=None):
+    """
+    Create many nodes from an array of coordinates
+
+    Tags are assigned as a contiguous range starting from `osi.n_node + 1`.
+
+    Parameters
+    ----------
+    osi: o3seespy.OpenSeesInstance
+    coords: array_like (n, ndm)
+        Nodal coordinates
+    masses: array_like (n, ndf) or (ndf,), optional
+        Nodal masses, if 1D then the same masses are applied to all nodes
+
+    Returns
+    -------
+    NodeSet
+    """
+    import numpy as np
+    coords = np.asarray(coords, dtype=float)
+    if coords.ndim == 1:
+        coords = coords.reshape(-1, osi.ndm)
+    if coords.shape[1] != osi.ndm:
+        raise ValueError(f'coords must have {osi.ndm} columns (ndm), not {coords.shape[1]}')
+    if masses is not None:
+        masses = np.asarray(masses, dtype=float)
+        if masses.shape not in [(osi.ndf,), (len(coords), osi.ndf)]:
+            raise ValueError(f'masses must have shape ({len(coords)}, {osi.ndf}) (n_nodes, ndf) or ({osi.ndf},), '
+                             f'not {masses.shape}')
+    tags = np.arange(osi.n_node + 1, osi.n_node + len(coords) + 1)
+    osi.n_node += len(coords)
+    node_set = NodeSet(tags, coords, masses)
+    node_set.to_process(osi)
+    return node_set
@@ -7,17 +7,44 @@ class RecorderBase(OpenSeesObject):
     op_base_type = "recorder"
     
     
-class RecorderToArrayCacheBase(RecorderBase):  # TODO: implement NodeToArray where data saved to memory and loaded as array without collect
+class RecorderToArrayCacheBase(RecorderBase):
     tmpfname = None
-    
-    def collect(self, unlink=True):
-        from numpy import loadtxt
+    binary = False
+    n_cols = None  # number of values recorded per step
+
+    def collect(self, unlink=True, mmap=False, usecols=None, start=0, stop=None):
+        """
+        Load the recorded values
+
+        Parameters
+        ----------
+        unlink: bool
+            If True then the recorder file is deleted after loading (ignored if `mmap` is True)
+        mmap: bool
+            If True then a read-only `numpy.memmap` view of the file is returned instead of loading the values
+            into memory (only for binary recorders)
+        usecols: int or list, optional
+            Indices of the columns to load
+        start: int
+            Index of the first recorded step to load
+        stop: int, optional
+            Index of the step to stop loading at (not included)
+        """
+        import numpy as np
+        if mmap and not self.binary:
+            raise ValueError('mmap=True requires recorder to be created with binary=True')
         try:
-            a = loadtxt(self.tmpfname, dtype=float)
+            if self.binary:
+                a = load_binary_file(self.tmpfname, self.n_cols, mmap=mmap)[start:stop]
+                if usecols is not None:
+                    a = a[:, usecols]
+            else:
+                a = load_text_file(self.tmpfname, self.n_cols, usecols=usecols, start=start, stop=stop)
+            a = np.squeeze(a)  # same shape for binary and text output, consistent with numpy.loadtxt
         except ValueError as e:
             print('Warning: Need to run opy.wipe() before collecting arrays')
             raise ValueError(e)
-        if unlink:
+        if unlink and not mmap:
             try:
                 os.unlink(self.tmpfname)
             except PermissionError:
@@ -25,10 +52,240 @@ class RecorderToArrayCacheBase(RecorderBase):  # TODO: implement NodeToArray whe
         return a
 
 
+def _get_output_pms(fname, nsd, dt, binary):
+    if binary:
+        pms = ['-binary', fname]
+    else:
+        pms = ['-file', fname, '-precision', nsd]
+    if dt is not None:
+        pms += ['-dT', dt]
+    return pms
+
+
+def _get_ele_n_cols(osi, ele_tags, pms):
+    """Number of values recorded per step from the current element responses"""
+    if osi.state not in [0, 3, 5]:
+        return None
+    resps = [osi.to_opensees('eleResponse', [tag, *pms]) for tag in ele_tags]  # not exported
+    n_cols = sum([len(x) for x in resps if x is not None])
+    if n_cols == 0:
+        return None
+    return n_cols
+
+
+def _read_line_blocks(f, chunk_size):
+    """Blocks of about `chunk_size` bytes of a binary file that contain whole lines"""
+    rest = b''
+    for block in iter(lambda: f.read(chunk_size), b''):
+        end = block.rfind(b'\n') + 1
+        if end == 0:
+            rest += block
+            continue
+        yield rest + block[:end]
+        rest = block[end:]
+    if rest.strip():
+        yield rest + b'\n'
+
+
+def load_text_file(ffp, n_cols=None, usecols=None, start=0, stop=None, chunk_size=2 ** 22):
+    """
+    Load the output of a recorder that was saved in text format
+
+    The file is read once in blocks of whole lines and each block is parsed in a single call, the output array
+    grows as the blocks are parsed. Rows before `start` are not parsed and rows after `stop` are not read.
+    The blocks are parsed with `numpy.loadtxt` if it uses the C parser of numpy>=1.23, otherwise with
+    `numpy.fromstring`.
+
+    Parameters
+    ----------
+    ffp: str
+        Full file path
+    n_cols: int, optional
+        Number of values recorded per step, if None then taken from the first line of the file
+    usecols: int or list, optional
+        Indices of the columns to load
+    start: int
+        Index of the first row to load
+    stop: int, optional
+        Index of the row to stop loading at (not included), rows after `stop` are not read
+    chunk_size: int
+        Approximate number of bytes parsed at a time
+
+    Returns
+    -------
+    array_like (n_rows, n_cols)
+    """
+    import io
+    import warnings
+    import numpy as np
+    if n_cols is None:
+        with open(ffp, 'rb') as f:
+            n_cols = len(f.readline().split())
+    c_loadtxt = tuple(int(x) for x in np.__version__.split('.')[:2]) >= (1, 23)
+    col_inds = None
+    n_out_cols = n_cols
+    if usecols is not None:
+        col_inds = np.atleast_1d(np.arange(n_cols)[usecols])
+        n_out_cols = len(col_inds)
+    vals = np.empty((0, n_out_cols))
+    n_loaded = 0
+    i = 0  # index of the first row of the block
+    with open(ffp, 'rb') as f:
+        for block in _read_line_blocks(f, chunk_size):
+            n_lines = block.count(b'\n')
+            if i + n_lines <= start:
+                i += n_lines
+                continue
+            if i < start or (stop is not None and i + n_lines > stop):
+                lines = block.splitlines(keepends=True)[max(start - i, 0):None if stop is None else stop - i]
+                block = b''.join(lines)
+                i = max(i, start)
+                n_lines = len(lines)
+            first = block[:block.find(b'\n')]
+            last = block[block.rfind(b'\n', 0, len(block) - 1) + 1:]
+            if len(first.split()) != n_cols or len(last.split()) != n_cols:
+                raise ValueError(f'Expected {n_cols} values on each line of {ffp}')
+            if c_loadtxt:
+                chunk = np.loadtxt(io.BytesIO(block), dtype=float, usecols=col_inds, ndmin=2)
+            else:
+                with warnings.catch_warnings():  # invalid values stop the parsing, which is checked below
+                    warnings.simplefilter('ignore', DeprecationWarning)
+                    chunk = np.fromstring(block, sep=' ')
+                if len(chunk) != n_lines * n_cols:
+                    raise ValueError(f'Expected {n_cols} values on each line of {ffp}')
+                chunk = chunk.reshape(n_lines, n_cols)
+                if col_inds is not None:
+                    chunk = chunk[:, col_inds]
+            if len(chunk) != n_lines:
+                raise ValueError(f'Expected {n_lines} lines of values in {ffp}')
+            if n_loaded + n_lines > len(vals):  # at least double the size
+                new_vals = np.empty((max(2 * len(vals), n_loaded + n_lines), n_out_cols))
+                new_vals[:n_loaded] = vals[:n_loaded]
+                vals = new_vals
+            vals[n_loaded: n_loaded + n_lines] = chunk
+            n_loaded += n_lines
+            i += n_lines
+            if stop is not None and i >= stop:
+                break
+    return vals[:n_loaded]
+
+
+def load_binary_file(ffp, n_cols, mmap=False):
+    """
+    Load the output of a recorder that was saved in binary format
+
+    Parameters
+    ----------
+    ffp: str
+        Full file path
+    n_cols: int
+        Number of values recorded per step
+    mmap: bool
+        If True then a read-only `numpy.memmap` view of the file is returned
+
+    Returns
+    -------
+    array_like (n_steps, n_cols)
+    """
+    import numpy as np
+    if n_cols is None:
+        raise ValueError('Number of recorded values per step (n_cols) is unknown')
+    # each step is written as n_cols doubles followed by a new line character
+    dtype = np.dtype([('vals', float, (n_cols,)), ('eol', 'S1')])
+    n_rows = os.path.getsize(ffp) // dtype.itemsize
+    if n_rows == 0:
+        return np.empty((0, n_cols))
+    if mmap:
+        return np.memmap(ffp, dtype=dtype, mode='r', shape=(n_rows,))['vals']
+    return np.fromfile(ffp, dtype=dtype, count=n_rows)['vals']
+
+
+class ArrayBuffer(object):
+    def __init__(self, n_cols=None, n_rows=1000):
+        """
+        A preallocated 2D numpy array that grows as rows are appended
+
+        Parameters
+        ----------
+        n_cols: int, optional
+            Number of columns, if None then set from the first row appended
+        n_rows: int
+            Initial number of rows to allocate
+        """
+        self.n_cols = n_cols
+        self.n_rows = 0
+        self._init_rows = max(int(n_rows), 1)
+        self._data = None
+        if n_cols is not None:
+            self._allocate(n_cols)
+
+    def _allocate(self, n_cols):
+        import numpy as np
+        self.n_cols = int(n_cols)
+        self._data = np.empty((self._init_rows, self.n_cols))
+
+    def append(self, values):
+        if self._data is None:
+            self._allocate(len(values))
+        if self.n_rows == len(self._data):
+            import numpy as np
+            self._data = np.concatenate([self._data, np.empty_like(self._data)])  # double capacity
+        self._data[self.n_rows] = values
+        self.n_rows += 1
+
+    @property
+    def values(self):
+        """View of the filled rows"""
+        if self._data is None:
+            import numpy as np
+            return np.empty((0, 0))
+        return self._data[:self.n_rows]
+
+
+class RecorderToArrayBase(object):
+    """
+    Base class for recorders that store results directly in memory
+
+    The responses are requested from the OpenSees domain after each analysis step (see `o3seespy.analyze`),
+    so no recorder command is sent to OpenSees and no file is written. The requests are not exported.
+    Subclasses define `_get_values(osi)`, which returns the current responses as a list.
+    """
+    op_type = None
+    dt = None
+    _last_time = None
+    _buffer = None
+
+    def _register(self, osi, n_rows):
+        self._buffer = ArrayBuffer(n_rows=n_rows)
+        self._last_time = None
+        osi.array_recorders.append(self)
+
+    def record(self, osi, time=None):
+        """Append the current response to the buffer, called after each analysis step"""
+        if self.dt is not None:
+            if time is None:
+                time = osi.to_opensees('getTime', [])
+            if self._last_time is not None and time - self._last_time < self.dt * (1 - 1.0e-6):
+                return
+            self._last_time = time
+        self._buffer.append(self._get_values(osi))
+
+    def collect(self):
+        """
+        Recorded values as an array, one row per recorded step
+
+        If a single response is recorded then a 1D array is returned.
+        """
+        vals = self._buffer.values
+        if vals.ndim == 2 and vals.shape[1] == 1:
+            return vals[:, 0]
+        return vals
+
+
 class NodeToFile(RecorderBase):
     op_type = "Node"
 
-    def __init__(self, osi, fname, node, dofs, res_type, nsd=8, dt=None):
+    def __init__(self, osi, fname, node, dofs, res_type, nsd=8, dt=None, binary=False):
         """
         Records properties of a node and saves the results to a file
 
@@ -46,11 +303,10 @@ class NodeToFile(RecorderBase):
             Number of significant figures
         dt: float
             Time step
+        binary: bool
+            If True then results are saved in binary format (faster to write and read)
         """
-        self._parameters = [self.op_type, '-file', fname, '-precision', nsd, '-node', node.tag]
-        if dt is not None:
-            self._parameters.insert(5, '-dT')
-            self._parameters.insert(6, dt)
+        self._parameters = [self.op_type, *_get_output_pms(fname, nsd, dt, binary), '-node', node.tag]
         self._parameters += ['-dof', *dofs, res_type]
         self.to_process(osi)
 
@@ -58,7 +314,7 @@ class NodeToFile(RecorderBase):
 class NodesToFile(RecorderBase):
     op_type = "Node"
 
-    def __init__(self, osi, fname, nodes, dofs, res_type, nsd=8, dt=None):
+    def __init__(self, osi, fname, nodes, dofs, res_type, nsd=8, dt=None, binary=False):
         """
         Records properties of several nodes and saves the results to a file
 
@@ -77,22 +333,22 @@ class NodesToFile(RecorderBase):
             Number of significant figures
         dt: float
             Time step
+        binary: bool
+            If True then results are saved in binary format (faster to write and read)
         """
         if nodes == 'all':
             node_tags = osi.to_process('getNodeTags', [])
         else:
             node_tags = [x.tag for x in nodes]
-        self._parameters = [self.op_type, '-file', fname, '-precision', nsd, '-node', *node_tags, '-dof', *dofs, res_type]
-        if dt is not None:
-            self._parameters.insert(5, '-dT')
-            self._parameters.insert(6, dt)
+        self._parameters = [self.op_type, *_get_output_pms(fname, nsd, dt, binary), '-node', *node_tags,
+                            '-dof', *dofs, res_type]
         self.to_process(osi)
 
 
-class NodeToArrayCache(RecorderToArrayCacheBase):  # TODO: implement NodeToArray where data saved to memory and loaded as array without collect
+class NodeToArrayCache(RecorderToArrayCacheBase):
     op_type = "Node"
 
-    def __init__(self, osi, node, dofs, res_type, nsd=8, dt=None):
+    def __init__(self, osi, node, dofs, res_type, nsd=8, dt=None, binary=False):
         """
         Records properties of a node and saves results to a numpy array
 
@@ -108,20 +364,21 @@ class NodeToArrayCache(RecorderToArrayCacheBase):  # TODO: implement NodeToArray
             Number of significant figures
         dt: float
             Time step
+        binary: bool
+            If True then results are saved in binary format (faster to write and read)
         """
         self.tmpfname = tempfile.NamedTemporaryFile(delete=False).name
-        self._parameters = [self.op_type, '-file', self.tmpfname, '-precision', nsd, '-node', node.tag]
-        if dt is not None:
-            self._parameters.insert(5, '-dT')
-            self._parameters.insert(6, dt)
+        self.binary = binary
+        self.n_cols = len(dofs)
+        self._parameters = [self.op_type, *_get_output_pms(self.tmpfname, nsd, dt, binary), '-node', node.tag]
         self._parameters += ['-dof', *dofs, res_type]
         self.to_process(osi)
 
 
-class NodesToArrayCache(RecorderToArrayCacheBase):  # TODO: implement NodeToArray where data saved to memory and loaded as array without collect
+class NodesToArrayCache(RecorderToArrayCacheBase):
     op_type = "Node"
 
-    def __init__(self, osi, nodes, dofs, res_type, nsd=8, dt=None, ffp=None):
+    def __init__(self, osi, nodes, dofs, res_type, nsd=8, dt=None, ffp=None, binary=False):
         """
        Records properties of several nodes and saves results to a numpy array
 
@@ -138,6 +395,8 @@ class NodesToArrayCache(RecorderToArrayCacheBase):  # TODO: implement NodeToArra
            Number of significant figures
        dt: float
            Time step
+       binary: bool
+           If True then results are saved in binary format (faster to write and read)
        """
         if isinstance(nodes, str) and nodes == 'all':
             node_tags = osi.to_process('getNodeTags', [])
@@ -147,17 +406,87 @@ class NodesToArrayCache(RecorderToArrayCacheBase):  # TODO: implement NodeToArra
             self.tmpfname = tempfile.NamedTemporaryFile(delete=False).name
         else:
             self.tmpfname = ffp
-        self._parameters = [self.op_type, '-file', self.tmpfname, '-precision', nsd, '-node', *node_tags, '-dof', *dofs, res_type]
-        if dt is not None:
-            self._parameters.insert(5,'-dT')
-            self._parameters.insert(6, dt)
+        self.binary = binary
+        self.n_cols = len(node_tags) * len(dofs)
+        self._parameters = [self.op_type, *_get_output_pms(self.tmpfname, nsd, dt, binary), '-node', *node_tags,
+                            '-dof', *dofs, res_type]
         self.to_process(osi)
 
 
+class NodeToArray(RecorderToArrayBase):
+    op_type = "Node"
+    _res_op_types = {'disp': 'nodeDisp', 'vel': 'nodeVel', 'accel': 'nodeAccel', 'reaction': 'nodeReaction'}
+
+    def __init__(self, osi, node, dofs, res_type, dt=None, n_steps=1000):
+        """
+        Records properties of a node and stores the results in memory as a numpy array
+
+        Parameters
+        ----------
+        osi: o3seespy.OpenSeesInstance
+        node: o3seespy.node.Node
+        dofs: list
+            A list of integers representing the degrees-of-freedom
+        res_type: str
+            Response type, either 'disp', 'vel', 'accel' or 'reaction'
+        dt: float
+            Time step
+        n_steps: int
+            Number of steps to preallocate memory for
+        """
+        self._init_nodes(osi, [node], dofs, res_type, dt, n_steps)
+
+    def _init_nodes(self, osi, nodes, dofs, res_type, dt, n_steps):
+        if res_type not in self._res_op_types:
+            raise ValueError(f"res_type must be one of: {list(self._res_op_types)}")
+        if isinstance(nodes, str) and nodes == 'all':
+            self.node_tags = osi.to_process('getNodeTags', [])
+        else:
+            self.node_tags = [x.tag for x in nodes]
+        self.dofs = [int(x) for x in dofs]
+        self.res_type = res_type
+        self.dt = dt
+        self._res_op_type = self._res_op_types[res_type]
+        self._pms = [[tag] for tag in self.node_tags]
+        self._dof_inds = [x - 1 for x in self.dofs]
+        self._register(osi, n_steps)
+
+    def _get_values(self, osi):
+        if self.res_type == 'reaction':
+            osi.to_opensees('reactions', [])
+        resps = osi.to_opensees_many(self._res_op_type, self._pms)
+        return [resp[i] for resp in resps for i in self._dof_inds]
+
+
+class NodesToArray(NodeToArray):
+
+    def __init__(self, osi, nodes, dofs, res_type, dt=None, n_steps=1000):
+        """
+        Records properties of several nodes and stores the results in memory as a numpy array
+
+        Columns are ordered by node then by degree-of-freedom (same as `NodesToArrayCache`).
+
+        Parameters
+        ----------
+        osi: o3seespy.OpenSeesInstance
+        nodes: list or 'all'
+            A list of o3seespy.node.Node objects
+        dofs: list
+            A list of integers representing the degrees-of-freedom
+        res_type: str
+            Response type, either 'disp', 'vel', 'accel' or 'reaction'
+        dt: float
+            Time step
+        n_steps: int
+            Number of steps to preallocate memory for
+        """
+        self._init_nodes(osi, nodes, dofs, res_type, dt, n_steps)
+
+
 class ElementToFile(RecorderBase):
     op_type = "Element"
 
-    def __init__(self, osi, fname, ele, material=None, arg_vals=None, nsd=8, dt=None):
+    def __init__(self, osi, fname, ele, material=None, arg_vals=None, nsd=8, dt=None, binary=False):
         """
         Records properties of an element and saves the results to a file
 
@@ -175,23 +504,23 @@ class ElementToFile(RecorderBase):
             Number of significant figures
         dt: float
             Time step
+        binary: bool
+            If True then results are saved in binary format (faster to write and read)
         """
         if arg_vals is None:
             arg_vals = []
         extra_pms = []
         if material is not None:
             extra_pms += ['material', material]
-        self._parameters = [self.op_type, '-file', fname, '-precision', nsd, '-ele', ele.tag, *extra_pms, *arg_vals]
-        if dt is not None:
-            self._parameters.insert(5, '-dT')
-            self._parameters.insert(6, dt)
+        self._parameters = [self.op_type, *_get_output_pms(fname, nsd, dt, binary), '-ele', ele.tag,
+                            *extra_pms, *arg_vals]
         self.to_process(osi)
 
 
-class ElementToArrayCache(RecorderToArrayCacheBase):  # TODO: implement ElementToArray where data saved to memory and loaded as array without collect
+class ElementToArrayCache(RecorderToArrayCacheBase):
     op_type = "Element"
 
-    def __init__(self, osi, ele, material=None, arg_vals=None, nsd=8, fname=None, dt=None):
+    def __init__(self, osi, ele, material=None, arg_vals=None, nsd=8, fname=None, dt=None, binary=False):
         if arg_vals is None:
             arg_vals = []
         self.arg_vals = [str(x) for x in arg_vals]
@@ -203,10 +532,10 @@ class ElementToArrayCache(RecorderToArrayCacheBase):  # TODO: implement ElementT
         else:
             self.tmpfname = fname
         self.ele = ele
-        self._parameters = [self.op_type, '-file', self.tmpfname, '-precision', nsd, '-ele', ele.tag, *extra_pms, *self.arg_vals]
-        if dt is not None:
-            self._parameters.insert(5, '-dT')
-            self._parameters.insert(6, dt)
+        self.binary = binary
+        self.n_cols = _get_ele_n_cols(osi, [ele.tag], [*extra_pms, *self.arg_vals])  # used to check the output
+        self._parameters = [self.op_type, *_get_output_pms(self.tmpfname, nsd, dt, binary), '-ele', ele.tag,
+                            *extra_pms, *self.arg_vals]
         self.to_process(osi)
 
     # def collect(self):
@@ -226,7 +555,7 @@ class ElementToArrayCache(RecorderToArrayCacheBase):  # TODO: implement ElementT
 class ElementsToArrayCache(RecorderToArrayCacheBase):
     op_type = "Element"
 
-    def __init__(self, osi, eles, material=None, arg_vals=None, nsd=8, fname=None, dt=None):
+    def __init__(self, osi, eles, material=None, arg_vals=None, nsd=8, fname=None, dt=None, binary=False):
         if arg_vals is None:
             arg_vals = []
         extra_pms = []
@@ -237,11 +566,10 @@ class ElementsToArrayCache(RecorderToArrayCacheBase):
         else:
             self.tmpfname = fname
         self.ele_tags = [x.tag for x in eles]
-
-        self._parameters = [self.op_type, '-file', self.tmpfname, '-precision', nsd, '-ele', *self.ele_tags, *extra_pms, *arg_vals]
-        if dt is not None:
-            self._parameters.insert(5, '-dT')
-            self._parameters.insert(6, dt)
+        self.binary = binary
+        self.n_cols = _get_ele_n_cols(osi, self.ele_tags, [*extra_pms, *arg_vals])  # used to check the output
+        self._parameters = [self.op_type, *_get_output_pms(self.tmpfname, nsd, dt, binary), '-ele', *self.ele_tags,
+                            *extra_pms, *arg_vals]
         self.to_process(osi)
 
     # def collect(self):
@@ -258,6 +586,69 @@ class ElementsToArrayCache(RecorderToArrayCacheBase):
     #     return a
 
 
+class ElementToArray(RecorderToArrayBase):
+    op_type = "Element"
+
+    def __init__(self, osi, ele, material=None, arg_vals=None, dt=None, n_steps=1000):
+        """
+        Records properties of an element and stores the results in memory as a numpy array
+
+        Parameters
+        ----------
+        osi: o3seespy.OpenSeesInstance
+        ele: o3seespy.element.BaseElement
+            An o3seespy element
+        material: -
+        arg_vals: list
+            Extra arguments passed to element response method
+        dt: float
+            Time step
+        n_steps: int
+            Number of steps to preallocate memory for
+        """
+        self._init_eles(osi, [ele], material, arg_vals, dt, n_steps)
+
+    def _init_eles(self, osi, eles, material, arg_vals, dt, n_steps):
+        if arg_vals is None:
+            arg_vals = []
+        self.arg_vals = [str(x) for x in arg_vals]
+        extra_pms = []
+        if material is not None:
+            extra_pms += ['material', material]
+        self.ele_tags = [x.tag for x in eles]
+        self.dt = dt
+        self._pms = [[tag, *extra_pms, *self.arg_vals] for tag in self.ele_tags]
+        self._register(osi, n_steps)
+
+    def _get_values(self, osi):
+        resps = osi.to_opensees_many('eleResponse', self._pms)
+        return [val for resp in resps for val in resp]
+
+
+class ElementsToArray(ElementToArray):
+
+    def __init__(self, osi, eles, material=None, arg_vals=None, dt=None, n_steps=1000):
+        """
+        Records properties of several elements and stores the results in memory as a numpy array
+
+        Columns are ordered by element then by response component (same as `ElementsToArrayCache`).
+
+        Parameters
+        ----------
+        osi: o3seespy.OpenSeesInstance
+        eles: list
+            A list of o3seespy elements
+        material: -
+        arg_vals: list
+            Extra arguments passed to element response method
+        dt: float
+            Time step
+        n_steps: int
+            Number of steps to preallocate memory for
+        """
+        self._init_eles(osi, eles, material, arg_vals, dt, n_steps)
+
+
 def load_recorder_options():
     folder_path = os.path.dirname(os.path.realpath(__file__))
     return open(folder_path + '/mat_recorder_options.csv')
@@ -1,8 +1,9 @@
-from o3seespy.base_model import OpenSeesObject
+from o3seespy.base_model import OpenSeesObject, lean_new
 
 
 class TimeSeriesBase(OpenSeesObject):
     op_base_type = "timeSeries"
+    __new__ = lean_new
 
 
 class Constant(TimeSeriesBase):
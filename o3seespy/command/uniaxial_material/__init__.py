@@ -1,5 +1,20 @@
-from .concrete import *
-from .other import *
-from .pytz import *
-from .standard import *
-from .steel import *
+from o3seespy.extensions import get_lazy_attrs as _get_lazy_attrs
+
+_lazy_modules = {  # submodule: names, imported on first access
+    'base_material': ['UniaxialMaterialBase'],
+    'concrete': ['Concrete01', 'Concrete02', 'Concrete04', 'Concrete06', 'Concrete07', 'Concrete01WithSITC',
+                 'ConfinedConcrete01', 'ConcreteD', 'FRPConfinedConcrete', 'FRPConfinedConcrete02JacketC',
+                 'FRPConfinedConcrete02Ultimate', 'ConcreteCM', 'TDConcrete', 'TDConcreteEXP', 'TDConcreteMC10',
+                 'TDConcreteMC10NL'],
+    'other': ['Hardening', 'Cast', 'ViscousDamper', 'BilinearOilDamper', 'Bilin', 'ModIMKPeakOriented',
+              'ModIMKPinching', 'SAWS', 'BarSlip', 'BondSP01', 'Fatigue', 'ImpactMaterial', 'HyperbolicGapMaterial',
+              'LimitState', 'MinMax', 'ElasticBilin', 'ElasticMultiLinear', 'MultiLinear', 'InitStrainMaterial',
+              'InitStressMaterial', 'PathIndependent', 'ECC01', 'SelfCentering', 'Viscous', 'BoucWen', 'BWBN',
+              'AxialSp', 'AxialSpHD', 'CFSWSWP', 'CFSSSWP'],
+    'pytz': ['PySimple1', 'TzSimple1', 'QzSimple1', 'PyLiq1', 'TzLiq1'],
+    'standard': ['Elastic', 'ElasticPP', 'ElasticPPGap', 'ENT', 'Parallel', 'Series'],
+    'steel': ['Steel01', 'Steel02', 'Hysteretic', 'ReinforcingSteelGABuck', 'ReinforcingSteelDMBuck',
+              'ReinforcingSteelCMFatigue', 'ReinforcingSteelIsoHard', 'ReinforcingSteelMPCurveParams', 'DoddRestrepo',
+              'RambergOsgoodSteel', 'SteelMPF', 'Steel01Thermal'],
+}
+__getattr__, __dir__, __all__ = _get_lazy_attrs(__name__, _lazy_modules, globals())
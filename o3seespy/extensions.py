@@ -1,33 +1,179 @@
-from inspect import signature
+import numbers
 from collections import OrderedDict
 
 
-def to_commands(op_base_type, parameters):
-    para = []
-    for i, e in enumerate(parameters):
-        if isinstance(e, str):
-            e = "'%s'" % e
-        elif isinstance(e, float):
-            e = '%.6g' % e
-            if '.' not in e and 'e' not in e:
-                e += '.0'
-        para.append(str(e))
-        if i > 40:  # avoid verbose print output
-            break
-    p_str = ', '.join(para)
+def get_lazy_attrs(package, lazy_modules, module_globals):
+    """
+    Module level `__getattr__` and `__dir__` functions that import submodules on first access
+
+    Parameters
+    ----------
+    package: str
+        Name of the package (i.e. `__name__`)
+    lazy_modules: dict
+        Submodule (absolute or relative to the package): list of names to import from it
+    module_globals: dict
+        Namespace of the package (i.e. `globals()`), names are stored once imported
+    """
+    import importlib
+    names = {}
+    for module_name in lazy_modules:
+        names[module_name.split('.')[-1]] = (module_name, None)
+        for name in lazy_modules[module_name]:
+            names[name] = (module_name, name)
+
+    def __getattr__(name):
+        if name not in names:
+            raise AttributeError(f"module '{package}' has no attribute '{name}'")
+        module_name, attr = names[name]
+        if module_name[0] != '.' and not module_name.startswith('o3seespy'):
+            module_name = '.' + module_name
+        module = importlib.import_module(module_name, package)
+        val = module if attr is None else getattr(module, attr)
+        module_globals[name] = val
+        return val
+
+    def __dir__():
+        return sorted(set(module_globals) | set(names))
+
+    return __getattr__, __dir__, [x for x in names if names[x][1] is not None]
+
+
+def _to_command_str(e):
+    if isinstance(e, str):
+        return repr(str(e))
+    elif isinstance(e, bool):
+        return str(bool(e))
+    elif isinstance(e, float):
+        return float.__repr__(e)  # shortest string that round-trips exactly
+    return str(e)
+
+
+def _get_numeric_type(e):
+    if isinstance(e, bool):
+        return None
+    if isinstance(e, numbers.Integral):
+        return int
+    if isinstance(e, numbers.Real):
+        return float
+    return None
+
+
+def to_commands(op_base_type, parameters, max_params=None):
+    """
+    openseespy command as a string
+
+    Parameters
+    ----------
+    op_base_type: str
+        Name of the openseespy function
+    parameters: list
+        Parameters of the command
+    max_params: int, optional
+        If set then only the first `max_params` parameters are included followed by '...' (e.g. for error messages)
+    """
+    if max_params is not None and len(parameters) > max_params:
+        p_str = ', '.join([_to_command_str(e) for e in parameters[:max_params]]) + ', ...'
+    else:
+        p_str = ', '.join([_to_command_str(e) for e in parameters])
     return 'opy.%s(%s)' % (op_base_type, p_str)
 
 
 def to_py_file(osi, ofile='ofile.py', w_analyze=False):
+    """Write the exported commands of `osi` (state 1, 3 or 4) to a python file, line by line"""
     ofile = open(ofile, 'w')
-    pstr = 'import openseespy.opensees as opy\n' + '\n'.join(osi.commands)
+    ofile.write('import openseespy.opensees as opy\n')
+    for command in osi.commands:
+        ofile.write(command)
+        ofile.write('\n')
     if w_analyze:
-        pstr += '\nopy.analyze(1, 0.1)\n'
-    ofile.write(pstr)
+        ofile.write('opy.analyze(1, 0.1)\n')
     ofile.close()
 
 
+class PyFileExporter(object):
+    def __init__(self, ofile, npy_dir=None, min_array_len=100):
+        """
+        Writes openseespy commands to a python file as they are produced
+
+        Attach to an OpenSeesInstance with `osi.export_to_file`. Runs of at least `min_array_len` numeric parameters
+        of the same type (e.g. the values of a Path time series) are written to side-car .npy files in `npy_dir`
+        and loaded by the script, otherwise all parameters are written in full. Floats are written with their
+        shortest exact representation so that the script rebuilds the same model.
+
+        Parameters
+        ----------
+        ofile: str or file object
+            Full file path of the python file, or an open file
+        npy_dir: str, optional
+            Directory for the .npy files, relative to the python file, if None then arrays are written in the script
+        min_array_len: int
+            Minimum number of consecutive numeric parameters to write to a .npy file
+        """
+        import os
+        if isinstance(ofile, str):
+            self.ffp = ofile
+            self.ofile = open(ofile, 'w')
+            self._close_file = True
+        else:
+            self.ffp = getattr(ofile, 'name', None)
+            self.ofile = ofile
+            self._close_file = False
+        self.npy_dir = npy_dir
+        self.min_array_len = min_array_len
+        self.n_arrays = 0
+        if npy_dir is not None:
+            if self.ffp is None:
+                raise ValueError('ofile must be a file path or a named file to use npy_dir')
+            self._npy_ffp = os.path.join(os.path.dirname(os.path.abspath(self.ffp)), npy_dir)
+            os.makedirs(self._npy_ffp, exist_ok=True)
+            self.ofile.write('import os\nimport numpy as np\nimport openseespy.opensees as opy\n'
+                             'sdir = os.path.dirname(os.path.abspath(__file__))\n')
+        else:
+            self.ofile.write('import openseespy.opensees as opy\n')
+
+    def write_line(self, line):
+        self.ofile.write(line)
+        self.ofile.write('\n')
+
+    def write(self, op_base_type, parameters):
+        if self.npy_dir is None or len(parameters) < self.min_array_len:
+            self.write_line(to_commands(op_base_type, parameters))
+            return
+        # split into runs of numeric parameters of the same type
+        kinds = [_get_numeric_type(e) for e in parameters]
+        strs = []
+        i = 0
+        n = len(parameters)
+        while i < n:
+            j = i + 1
+            if kinds[i] is not None:
+                while j < n and kinds[j] is kinds[i]:
+                    j += 1
+            if kinds[i] is not None and j - i >= self.min_array_len:
+                strs.append(self._save_array(parameters[i:j], kinds[i]))
+            else:
+                strs += [_to_command_str(e) for e in parameters[i:j]]
+            i = j
+        self.write_line('opy.%s(%s)' % (op_base_type, ', '.join(strs)))
+
+    def _save_array(self, values, ptype):
+        import os
+        import numpy as np
+        fname = f'a{self.n_arrays}.npy'
+        self.n_arrays += 1
+        np.save(os.path.join(self._npy_ffp, fname), np.array(values, dtype=ptype))
+        return f"*np.load(os.path.join(sdir, {repr(self.npy_dir)}, '{fname}')).tolist()"
+
+    def close(self):
+        if self._close_file:
+            self.ofile.close()
+        else:
+            self.ofile.flush()
+
+
 def get_o3_kwargs_from_obj(obj, o3_obj, custom=None, overrides=None):
+    from inspect import signature
     if custom is None:
         custom = {}
     if overrides is None:
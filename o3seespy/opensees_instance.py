@@ -1,9 +1,11 @@
-try:
-    import custom_openseespy.opensees as opy
-except ModuleNotFoundError:
-    import openseespy.opensees as opy
 from collections import OrderedDict
 from o3seespy import exceptions, extensions
+from o3seespy.backend import get_backend, _tag_index as _queue_tag_index
+
+
+# commands that are not objects but modify the model, stored in the history
+_history_commands = {'model', 'wipe', 'mass', 'equalDOF', 'equalDOF_Mixed', 'rigidDiaphragm', 'rigidLink', 'remove',
+                     'setParameter', 'updateMaterialStage', 'loadConst', 'setTime', 'wipeAnalysis'}
 
 
 class OpenSeesInstance(object):  # TODO: allow custom (self compiled opensees)
@@ -19,9 +21,25 @@ class OpenSeesInstance(object):  # TODO: allow custom (self compiled opensees)
     n_transformation = 0
     n_region = 0
 
-    def __init__(self, ndm: int, ndf=None, state=0):
+    def __init__(self, ndm: int, ndf=None, state=0, lean=False, history=False, backend=None, isolated=False,
+                 intern=False):
         self.ndm = ndm
         self._state = state  # 0=execute line by line, 1=export to raw openseespy, 2=export reloadable json
+        # 3=export and execute, 4=export only, 5=queue objects and execute on `flush`
+        # if lean, nodes, elements and time series are replaced by compact records (`NodeSetItem`, `LeanRecord`)
+        # after being sent to opensees in state 0, other attributes and parameters are rebuilt on access
+        self.lean = lean
+        # if intern, materials and sections with the same type and parameters as an existing one are not sent to
+        # opensees and are given its tag, `interned` stores (op_base_type, parameters without the tag): tag
+        self.interned = {} if intern else None
+        # target of the commands, 'opensees' (openseespy domain of this process), 'recording' (no domain,
+        # commands are only recorded) or 'remote' (openseespy domain of a worker process), see `o3seespy.backend`
+        # if isolated, the model is built in its own worker process so it is not affected by other instances
+        if isolated:
+            if backend is not None:
+                raise ValueError('backend must not be set if isolated=True')
+            backend = 'remote'
+        self.backend = get_backend(backend)
         parameters = ['BasicBuilder', '-ndm', ndm]
         if ndf is not None:
             if ndf not in [1, 2, 3, 6]:
@@ -35,10 +53,15 @@ class OpenSeesInstance(object):  # TODO: allow custom (self compiled opensees)
                 self.ndf = 3
             else:
                 self.ndf = 6
-        opy.wipe()
-        opy.model(*parameters)
+        self.backend.get_func('wipe')()
+        self.backend.get_func('model')(*parameters)
+        # if history, the (op_base_type, parameters) of each object and model command are stored, used for snapshots
+        self.history = [('model', parameters)] if history else None
         self.commands = []
+        self.exporter = None  # if set then exported commands are written to it instead of stored in `commands`
+        self.queue = []  # (op_base_type, parameters) of objects waiting to be sent to opensees (state 5)
         self.dict = OrderedDict()
+        self.array_recorders = []  # recorders that store results in memory, updated by analyze
 
         if state == 1:
             self.commands.append('opy.wipe()')
@@ -47,63 +70,207 @@ class OpenSeesInstance(object):  # TODO: allow custom (self compiled opensees)
             self.dict['ndm'] = ndm
             self.dict['ndf'] = ndf
             # base_types = ['node', 'element', 'section', 'uniaxial_material']
-        elif state == 3:
+        elif state in [3, 4]:
             self.commands.append('opy.wipe()')
             self.commands.append(f"opy.model('basic', '-ndm', {ndm}, '-ndf', {self.ndf})")
 
     def reset_model_params(self, ndm, ndf):
-        opy.model('BasicBuilder', '-ndm', ndm, '-ndf', ndf)
+        if self.queue:
+            self.flush()
+        self.backend.get_func('model')('BasicBuilder', '-ndm', ndm, '-ndf', ndf)
+        if self.history is not None:
+            self.history.append(('model', ['BasicBuilder', '-ndm', ndm, '-ndf', ndf]))
         self.ndm = ndm
         self.ndf = ndf
         if self._state == 1:
-            self.commands.append(f"opy.model('basic', '-ndm', {ndm}, '-ndf', {ndf})")
+            self.to_commands(f"opy.model('basic', '-ndm', {ndm}, '-ndf', {ndf})")
         if self._state == 2:
             self.dict['ndm'] = ndm
             self.dict['ndf'] = ndf
             # base_types = ['node', 'element', 'section', 'uniaxial_material']
-        elif self._state == 3:
-            self.commands.append(f"opy.model('basic', '-ndm', {ndm}, '-ndf', {ndf})")
+        elif self._state in [3, 4]:
+            self.to_commands(f"opy.model('basic', '-ndm', {ndm}, '-ndf', {ndf})")
 
     def to_commands(self, os_command):
-        self.commands.append(os_command)
+        if self.exporter is not None:
+            self.exporter.write_line(os_command)
+        else:
+            self.commands.append(os_command)
+
+    def to_export(self, op_base_type, parameters):
+        if self.exporter is not None:
+            self.exporter.write(op_base_type, parameters)
+        else:
+            self.commands.append(extensions.to_commands(op_base_type, parameters))
+
+    def to_export_many(self, op_base_type, parameters_list):
+        if self.exporter is not None:
+            for parameters in parameters_list:
+                self.exporter.write(op_base_type, parameters)
+        else:
+            self.commands.append('\n'.join([extensions.to_commands(op_base_type, pms) for pms in parameters_list]))
+
+    def export_to_file(self, ofile, npy_dir=None, min_array_len=100):
+        """
+        Write exported commands (state 1, 3 or 4) to a python file as they are produced
+
+        Commands already in `commands` are written first. Call `close_export` once the model is complete.
+
+        Parameters
+        ----------
+        ofile: str or file object
+            Full file path of the python file, or an open file
+        npy_dir: str, optional
+            Directory for .npy files of long numeric parameter lists, relative to the python file
+        min_array_len: int
+            Minimum number of consecutive numeric parameters to write to a .npy file
+        """
+        self.close_export()
+        self.exporter = extensions.PyFileExporter(ofile, npy_dir=npy_dir, min_array_len=min_array_len)
+        for command in self.commands:
+            self.exporter.write_line(command)
+        self.commands = []
+
+    def close_export(self):
+        if self.exporter is not None:
+            self.exporter.close()
+            self.exporter = None
 
     def to_dict(self, os_model):
         if os_model.op_type not in self.dict:
             self.dict[os_model.op_type] = OrderedDict()
         self.dict[os_model.op_type][os_model.tag] = os_model.to_dict()
 
+    def to_dict_many(self, op_type, items):
+        if op_type not in self.dict:
+            self.dict[op_type] = OrderedDict()
+        for tag, outputs in items:
+            self.dict[op_type][tag] = outputs
+
     def to_process(self, op_base_type, parameters):
-        if self.state == 0:
+        if self.history is not None and op_base_type in _history_commands:
+            self.history.append((op_base_type, parameters))
+        if self._state == 0:
             return self.to_opensees(op_base_type, parameters)
         # if self.state == 1:
         #     self.to_commands(extensions.to_commands(op_base_type, parameters))
         # elif self.state == 2:
         #     self.to_dict(self)
         #     return self.to_opensees(op_base_type, parameters)
-        elif self.state == 3:
-            self.to_commands(extensions.to_commands(op_base_type, parameters))
+        elif self._state == 3:
+            self.to_export(op_base_type, parameters)
+            return self.to_opensees(op_base_type, parameters)
+        elif self._state == 5:  # commands that are not objects (e.g. analyze, nodeDisp) are run after a flush
             return self.to_opensees(op_base_type, parameters)
 
-    def to_opensees(self, op_base_type, parameters):
+    def to_queue(self, op_base_type, parameters):
+        self.queue.append((op_base_type, parameters))
+
+    def flush(self):
+        """
+        Send all queued objects to opensees (state 5)
+
+        Consecutive objects of the same type are sent together using the cached openseespy function,
+        duplicate tags are checked for all queued objects before any are sent.
+        The queue is flushed automatically before any command that is executed directly (e.g. analyze).
+        If a command fails then it and the objects after it are kept in the queue.
+        """
+        import numpy as np
+        from itertools import groupby
+        queue = self.queue
+        if not len(queue):
+            return
+        tags = {}
+        for op_base_type, parameters in queue:
+            if op_base_type in _queue_tag_index:
+                tags.setdefault(op_base_type, []).append(parameters[_queue_tag_index[op_base_type]])
+        for op_base_type in tags:
+            vals, counts = np.unique(np.asarray(tags[op_base_type]), return_counts=True)
+            if np.any(counts > 1):
+                raise ValueError(f'Duplicate {op_base_type} tags in queue: {vals[counts > 1].tolist()}')
+        self.queue = []  # so that to_opensees_many does not flush again
+        n_sent = 0
         try:
+            for op_base_type, group in groupby(queue, key=lambda x: x[0]):
+                parameters_list = [x[1] for x in group]
+                if self.backend.batched:  # errors are reported later by the backend
+                    self.to_opensees_many(op_base_type, parameters_list)
+                    n_sent += len(parameters_list)
+                    continue
+                func = self.backend.get_func(op_base_type)
+                for parameters in parameters_list:
+                    try:
+                        func(*parameters)
+                    except self.backend.error as e:
+                        com = ','.join(str(x) for x in parameters)
+                        raise ValueError(f'opensees.{op_base_type}({com}) caused error "{e}"')
+                    n_sent += 1
+        finally:
+            if n_sent < len(queue):
+                self.queue = queue[n_sent:] + self.queue
+
+    def to_process_many(self, op_base_type, parameters_list):
+        """
+        Process the same command for several sets of parameters
+
+        In state 0 the openseespy function is resolved once and called directly for each set of parameters,
+        which avoids the per-call overhead of `to_process`.
+
+        Parameters
+        ----------
+        op_base_type: str
+            Name of the openseespy function
+        parameters_list: iterable
+            Sequence of parameter lists
+
+        Returns
+        -------
+        list
+            Return value of each command
+        """
+        if self._state not in [0, 5]:
+            return [self.to_process(op_base_type, parameters) for parameters in parameters_list]
+        return self.to_opensees_many(op_base_type, parameters_list)
+
+    def get_opy_func(self, op_base_type):
+        """Get the function of the backend, can be called directly to avoid the overhead of `to_process`"""
+        return self.backend.get_func(op_base_type)
+
+    def to_opensees_many(self, op_base_type, parameters_list):
+        if self.queue:
+            self.flush()
+        if self.backend.batched:
             try:
-                return getattr(opy, op_base_type)(*parameters)
-            except opy.OpenSeesError as e:
+                return self.backend.call_many(op_base_type, parameters_list)
+            except self.backend.error as e:
+                raise ValueError('opensees.{0} caused error "{1}"'.format(op_base_type, e))
+        func = self.backend.get_func(op_base_type)
+        outputs = []
+        for parameters in parameters_list:
+            try:
+                outputs.append(func(*parameters))
+            except self.backend.error as e:
                 raise ValueError('opensees.{0}({1}) caused error "{2}"'.format(op_base_type,
                                                                                ','.join(str(x) for x in parameters), e))
+        return outputs
 
-        except SystemError as e:
+    def to_opensees(self, op_base_type, parameters):
+        if self.queue:
+            self.flush()
+        try:
+            func = self.backend.funcs[op_base_type]
+        except KeyError:
+            func = self.backend.get_func(op_base_type)
+        try:
+            return func(*parameters)
+        except self.backend.error as e:
+            raise ValueError('opensees.{0}({1}) caused error "{2}"'.format(op_base_type,
+                                                                           ','.join(str(x) for x in parameters), e))
+        except SystemError:
             if None in parameters:
                 print(parameters)
-                raise exceptions.ModelError("%s of type: %s contains 'None'" % (op_base_type))
-            else:
-                raise SystemError(e)
-        except AttributeError as e:
-            print(e)
-            print('opensees.{0}({1}) caused error "{2}"'.format(op_base_type,
-                                                                               ','.join(str(x) for x in parameters),
-                                                                                        e))
-            raise exceptions.ModelError("op_base_type: '%s' does not exist in opensees module" % op_base_type)
+                raise exceptions.ModelError("%s contains 'None'" % op_base_type)
+            raise
 
     @property
     def state(self):
@@ -115,6 +282,7 @@ class OpenSeesInstance(object):  # TODO: allow custom (self compiled opensees)
 
 
 class OpenseesInstance(OpenSeesInstance):
-    def __init__(self, ndm: int, ndf=None, state=0):
+    def __init__(self, ndm: int, ndf=None, state=0, lean=False, history=False, backend=None, isolated=False,
+                 intern=False):
         print('Please use OpenSeesInstance instead of OpenseesInstance')
-        super(OpenseesInstance, self).__init__(ndm, ndf, state)
+        super(OpenseesInstance, self).__init__(ndm, ndf, state, lean, history, backend, isolated, intern)
@@ -0,0 +1,211 @@
+import json
+import numbers
+from operator import itemgetter
+
+SNAPSHOT_VERSION = 1
+_tag_counters = ['n_node', 'n_con', 'n_ele', 'n_mat', 'n_sect', 'n_tseries', 'n_pat', 'n_fix', 'n_integ',
+                 'n_transformation', 'n_region']
+
+
+def _get_signature(parameters):
+    """Type of each parameter, strings are part of the signature since they are the same within a block"""
+    sig = []
+    for pm in parameters:
+        if isinstance(pm, str):
+            sig.append('s' + pm)
+        elif isinstance(pm, bool):
+            sig.append('b')
+        elif isinstance(pm, numbers.Integral):
+            sig.append('i')
+        elif isinstance(pm, numbers.Real):
+            sig.append('f')
+        else:
+            raise ValueError(f'Cannot save parameter of type {type(pm)} in snapshot: {parameters}')
+    return tuple(sig)
+
+
+def _get_getter(inds):
+    """Function that returns a tuple of the parameters at `inds`"""
+    if len(inds) == 0:
+        return lambda x: ()
+    if len(inds) == 1:
+        ind = inds[0]
+        return lambda x: (x[ind],)
+    return itemgetter(*inds)
+
+
+def get_blocks(history):
+    """
+    Group consecutive commands of the same type and signature into blocks of typed arrays
+
+    Parameters
+    ----------
+    history: list
+        (op_base_type, parameters) of each command, e.g. `osi.history`
+
+    Returns
+    -------
+    list of tuple
+        (op_base_type, signature, int and bool values (n, n_ints), float values (n, n_floats))
+    """
+    import numpy as np
+    blocks = []  # [op_base_type, signature, ints, floats, get_ints, get_floats, types, get_strs, strs]
+    block = None
+    for op_base_type, parameters in history:
+        types = tuple(map(type, parameters))
+        if block is None or op_base_type != block[0] or types != block[6] or block[7](parameters) != block[8]:
+            sig = _get_signature(parameters)
+            get_strs = _get_getter([i for i, x in enumerate(sig) if x[0] == 's'])
+            if block is None or op_base_type != block[0] or sig != block[1]:
+                get_ints = _get_getter([i for i, x in enumerate(sig) if x in ['i', 'b']])
+                get_floats = _get_getter([i for i, x in enumerate(sig) if x == 'f'])
+                block = [op_base_type, sig, [], [], get_ints, get_floats, None, None, None]
+                blocks.append(block)
+            block[6:] = [types, get_strs, get_strs(parameters)]  # for fast comparison of the next command
+        block[2].append(block[4](parameters))
+        block[3].append(block[5](parameters))
+    out = []
+    for op_base_type, sig, ints, floats in [x[:4] for x in blocks]:
+        ints = np.array(ints, dtype=np.int64).reshape(len(ints), -1)
+        floats = np.array(floats, dtype=float).reshape(len(floats), -1)
+        out.append((op_base_type, sig, ints, floats))
+    return out
+
+
+def to_arrays(osi):
+    """
+    Arrays of a snapshot of the model, see `save`
+
+    Parameters
+    ----------
+    osi: o3seespy.OpenSeesInstance
+        Must have been created with `history=True`
+
+    Returns
+    -------
+    dict
+        Name: array, 'meta' is a json string
+    """
+    import numpy as np
+    if osi.history is None:
+        raise ValueError('osi must be created with history=True to save a snapshot')
+    blocks = get_blocks(osi.history)
+    meta = {'version': SNAPSHOT_VERSION, 'ndm': osi.ndm, 'ndf': osi.ndf,
+            'counters': {name: int(getattr(osi, name)) for name in _tag_counters}, 'blocks': []}
+    arrays = {}
+    for i, (op_base_type, sig, ints, floats) in enumerate(blocks):
+        meta['blocks'].append({'op': op_base_type, 'sig': list(sig), 'n': len(ints)})
+        if ints.shape[1]:
+            arrays[f'b{i}_i'] = ints
+        if floats.shape[1]:
+            arrays[f'b{i}_f'] = floats
+    arrays['meta'] = np.array(json.dumps(meta))
+    return arrays
+
+
+def from_arrays(data, state=0, lean=False, history=False):
+    """
+    Build a model from the arrays of a snapshot, see `load`
+
+    Parameters
+    ----------
+    data: dict or numpy.lib.npyio.NpzFile
+        Output of `to_arrays`
+    state: int
+        State of the new OpenSeesInstance
+    lean: bool
+        Lean mode of the new OpenSeesInstance
+    history: bool
+        If True then the commands of the snapshot are stored in `osi.history`
+
+    Returns
+    -------
+    osi: o3seespy.OpenSeesInstance
+    """
+    from itertools import repeat
+    from o3seespy.opensees_instance import OpenSeesInstance
+    meta = json.loads(str(data['meta']))
+    if meta['version'] > SNAPSHOT_VERSION:
+        raise ValueError(f"Snapshot version {meta['version']} not supported, update o3seespy")
+    osi = OpenSeesInstance(meta['ndm'], meta['ndf'], state=state, lean=lean)
+    commands = []
+    for i, block in enumerate(meta['blocks']):
+        sig = block['sig']
+        n = block['n']
+        ints = data[f'b{i}_i'] if f'b{i}_i' in data else None
+        floats = data[f'b{i}_f'] if f'b{i}_f' in data else None
+        cols = []
+        n_i = 0
+        n_f = 0
+        for x in sig:  # build each column of the parameters then combine to rows
+            if x == 'i':
+                cols.append(ints[:, n_i].tolist())
+                n_i += 1
+            elif x == 'b':
+                cols.append(ints[:, n_i].astype(bool).tolist())
+                n_i += 1
+            elif x == 'f':
+                cols.append(floats[:, n_f].tolist())
+                n_f += 1
+            else:
+                cols.append(repeat(x[1:], n))
+        parameters_list = list(zip(*cols)) if len(cols) else [()] * n
+        osi.to_process_many(block['op'], parameters_list)
+        if history:
+            commands += [(block['op'], list(pms)) for pms in parameters_list]
+    osi.ndm = meta['ndm']
+    osi.ndf = meta['ndf']
+    for name in meta['counters']:
+        setattr(osi, name, meta['counters'][name])
+    if history:
+        osi.history = commands
+    return osi
+
+
+def save(osi, ffp, compress=False):
+    """
+    Save the model to a binary snapshot (.npz) that can be reloaded with `load`
+
+    Commands are stored in blocks of consecutive commands with the same type and signature (e.g. all nodes,
+    all elements of the same type and properties), with the numeric parameters of each block as typed arrays.
+
+    Parameters
+    ----------
+    osi: o3seespy.OpenSeesInstance
+        Must have been created with `history=True`
+    ffp: str
+        Full file path of the snapshot
+    compress: bool
+        If True then the arrays are compressed, smaller file but slower to save and load
+    """
+    import numpy as np
+    arrays = to_arrays(osi)
+    if compress:
+        np.savez_compressed(ffp, **arrays)
+    else:
+        np.savez(ffp, **arrays)
+
+
+def load(ffp, state=0, lean=False, history=False):
+    """
+    Build a model from a binary snapshot
+
+    Parameters
+    ----------
+    ffp: str
+        Full file path of the snapshot
+    state: int
+        State of the new OpenSeesInstance
+    lean: bool
+        Lean mode of the new OpenSeesInstance
+    history: bool
+        If True then the commands of the snapshot are stored in `osi.history`
+
+    Returns
+    -------
+    osi: o3seespy.OpenSeesInstance
+        Instance with the tag counters set as they were when the snapshot was saved
+    """
+    import numpy as np
+    with np.load(ffp, allow_pickle=False) as data:
+        return from_arrays(data, state=state, lean=lean, history=history)
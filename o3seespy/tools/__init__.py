@@ -1 +1,18 @@
-from .uniaxial_drivers import *
+from o3seespy.extensions import get_lazy_attrs as _get_lazy_attrs
+
+_lazy_modules = {  # submodule: names, imported on first access
+    'uniaxial_drivers': ['run_uniaxial_disp_driver', 'run_uniaxial_force_driver', 'example_run_disp_gen',
+                         'example_run_force_gen'],
+    'motion_suite': ['run_motion_suite'],
+    'ida': ['HuntFillSearch', 'run_uniform_excitation', 'run_ida', 'get_collapse_scales', 'IDA_DTYPE'],
+    'transient': ['NodeOutput', 'EleOutput', 'run_transient'],
+    'build_cache': ['BuildCache'],
+    'script_import': ['get_o3_class_map', 'get_o3_class', 'parse_tcl_lines', 'parse_py_lines', 'import_script'],
+    'mesh': ['get_node_depths', 'get_shear_vel', 'get_wave_ele_h', 'get_wave_node_depths', 'SoilMesh',
+             'build_soil_mesh'],
+    'frame': ['Frame2D', 'build_frame_2d'],
+    'fiber_section': ['get_quad_patch_fibers', 'get_rect_patch_fibers', 'get_circ_patch_fibers',
+                      'get_straight_layer_fibers', 'get_circ_layer_fibers', 'FiberLayout', 'build_fiber_section',
+                      'run_moment_curvature'],
+}
+__getattr__, __dir__, __all__ = _get_lazy_attrs(__name__, _lazy_modules, globals())
@@ -0,0 +1,157 @@
+import os
+import hashlib
+import inspect
+import pickle
+from collections import OrderedDict
+import numpy as np
+from o3seespy import snapshot
+from o3seespy.__about__ import __version__
+from o3seespy.opensees_instance import OpenSeesInstance
+
+
+class BuildCache(object):
+    def __init__(self, cache_dir, max_size=2 ** 30, n_memory=4, version=None):
+        """
+        Cache of models built by a builder function, repeat builds replay the cached commands
+
+        Snapshots are identified by the name and source code of the builder, its inputs and the o3seespy version.
+        Only the source code of the builder itself is tracked, changes to functions called by the builder do not
+        invalidate the cache, so `version` should be changed (or the cache cleared) when they change.
+
+        The commands of each build are stored as a snapshot (see `o3seespy.snapshot`) in `cache_dir`, least
+        recently used snapshots are deleted once the total size exceeds `max_size`. The most recently used snapshots
+        are also kept in memory, each worker process has its own memory tier.
+
+        Parameters
+        ----------
+        cache_dir: str
+            Directory to store the snapshots, can be shared by several processes
+        max_size: int
+            Maximum total size of the snapshots on disk (bytes)
+        n_memory: int
+            Number of snapshots to keep in memory
+        version: str, optional
+            Version of the user code that builds the model, included in the key of the snapshots
+
+        Examples
+        --------
+        >>> def build_mesh(osi, n_eles, e_mod):
+        >>>     ...
+        >>> cache = o3.tools.BuildCache('cache')
+        >>> osi = cache.build(build_mesh, ndm=2, ndf=2, kwargs={'n_eles': 100, 'e_mod': 1.0e5})
+        >>> o3.analyze(osi, 10, 0.01)
+        """
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self.n_memory = n_memory
+        self.version = version
+        self._memory = OrderedDict()  # key: snapshot arrays
+        self.n_hits = 0
+        self.n_misses = 0
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def get_key(self, builder, ndm, ndf, args, kwargs):
+        """Hash of the builder (name and source code), its inputs, the o3seespy version and `version`"""
+        try:
+            source = inspect.getsource(builder)
+        except (OSError, TypeError):
+            source = None
+        inputs = (snapshot.SNAPSHOT_VERSION, __version__, self.version, builder.__module__, builder.__qualname__,
+                  source, ndm, ndf, args, sorted(kwargs.items()))
+        try:
+            return hashlib.sha1(pickle.dumps(inputs, protocol=4)).hexdigest()
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            raise TypeError(f'Inputs of {builder.__qualname__} must be picklable to be cached: {e}')
+
+    def _get_ffp(self, key):
+        return os.path.join(self.cache_dir, key + '.npz')
+
+    def build(self, builder, ndm, ndf=None, args=None, kwargs=None, lean=False):
+        """
+        Build the model using the cached commands if available, otherwise run the builder and cache its commands
+
+        Parameters
+        ----------
+        builder: callable
+            Function that builds the model, called as `builder(osi, *args, **kwargs)`.
+            The return value is not cached, objects should be referenced by their tags after a cached build.
+        ndm: int
+            Number of dimensions of the model
+        ndf: int, optional
+            Number of degrees-of-freedom of the model
+        args: list, optional
+            Positional inputs of the builder
+        kwargs: dict, optional
+            Keyword inputs of the builder
+        lean: bool
+            Lean mode of the new OpenSeesInstance
+
+        Returns
+        -------
+        osi: o3seespy.OpenSeesInstance
+            Instance with the model built and the tag counters set
+        """
+        if args is None:
+            args = []
+        if kwargs is None:
+            kwargs = {}
+        key = self.get_key(builder, ndm, ndf, list(args), kwargs)
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            self.n_hits += 1
+            return snapshot.from_arrays(self._memory[key], lean=lean)
+        ffp = self._get_ffp(key)
+        try:
+            with np.load(ffp, allow_pickle=False) as data:
+                arrays = {name: data[name] for name in data.files}
+            os.utime(ffp)  # mark as recently used
+        except (OSError, ValueError):  # not cached or removed by another process
+            arrays = None
+        if arrays is not None:
+            self.n_hits += 1
+            self._add_to_memory(key, arrays)
+            return snapshot.from_arrays(arrays, lean=lean)
+        self.n_misses += 1
+        osi = OpenSeesInstance(ndm, ndf, lean=lean, history=True)
+        builder(osi, *args, **kwargs)
+        arrays = snapshot.to_arrays(osi)
+        tmp_ffp = os.path.join(self.cache_dir, f'tmp-{os.getpid()}-{key}.npz')
+        np.savez(tmp_ffp, **arrays)
+        os.replace(tmp_ffp, ffp)  # atomic so other processes never read a partial file
+        self._add_to_memory(key, arrays)
+        self.evict()
+        osi.history = None
+        return osi
+
+    def _add_to_memory(self, key, arrays):
+        self._memory[key] = arrays
+        while len(self._memory) > self.n_memory:
+            self._memory.popitem(last=False)
+
+    def evict(self):
+        """Delete the least recently used snapshots until the total size is less than `max_size`"""
+        files = []
+        for fname in os.listdir(self.cache_dir):
+            if fname.endswith('.npz') and not fname.startswith('tmp-'):
+                ffp = os.path.join(self.cache_dir, fname)
+                try:
+                    stat = os.stat(ffp)
+                except OSError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, ffp))
+        total = sum([x[1] for x in files])
+        for mtime, size, ffp in sorted(files):
+            if total <= self.max_size:
+                break
+            try:
+                os.remove(ffp)
+            except OSError:
+                pass
+            total -= size
+
+    def clear(self):
+        """Delete all snapshots from memory and disk"""
+        self._memory.clear()
+        for fname in os.listdir(self.cache_dir):
+            if fname.endswith('.npz'):
+                os.remove(os.path.join(self.cache_dir, fname))
@@ -0,0 +1,343 @@
+import numpy as np
+import o3seespy as o3
+from o3seespy.command import section as _section
+from o3seespy.command import patch as _patch
+from o3seespy.command import layer as _layer
+from o3seespy.command.fiber import FiberSet
+
+
+def _get_quad_cell_fibers(verts):
+    """Centroids and areas of quadrilateral cells, `verts` has shape (4, ..., 2) with vertices counter-clockwise"""
+    xs = verts[..., 0]
+    ys = verts[..., 1]
+    xs1 = np.roll(xs, -1, axis=0)
+    ys1 = np.roll(ys, -1, axis=0)
+    cross = xs * ys1 - xs1 * ys
+    areas = cross.sum(axis=0) / 2
+    cys = ((xs + xs1) * cross).sum(axis=0) / (6 * areas)
+    czs = ((ys + ys1) * cross).sum(axis=0) / (6 * areas)
+    return cys.reshape(-1), czs.reshape(-1), areas.reshape(-1)
+
+
+def get_quad_patch_fibers(num_subdiv_ij, num_subdiv_jk, crds_i, crds_j, crds_k, crds_l):
+    """
+    Fibers of a quadrilateral patch (see `o3seespy.patch.Quad`), in the same order as OpenSees
+
+    The patch is divided with a bilinear mapping and each fiber is located at the centroid of its cell.
+
+    Returns
+    -------
+    y_locs: array_like
+    z_locs: array_like
+    areas: array_like
+    """
+    crds = np.array([crds_i, crds_j, crds_k, crds_l], dtype=float)
+    xi, eta = np.meshgrid(np.linspace(-1.0, 1.0, int(num_subdiv_ij) + 1),
+                          np.linspace(-1.0, 1.0, int(num_subdiv_jk) + 1))  # natural coordinates of the cell vertices
+    shape_funcs = np.array([(1 - xi) * (1 - eta), (1 + xi) * (1 - eta), (1 + xi) * (1 + eta),
+                            (1 - xi) * (1 + eta)]) / 4
+    pts = np.einsum('kji,kd->jid', shape_funcs, crds)  # (jk, ij, 2)
+    verts = np.array([pts[:-1, :-1], pts[:-1, 1:], pts[1:, 1:], pts[1:, :-1]])
+    return _get_quad_cell_fibers(verts)
+
+
+def get_rect_patch_fibers(num_subdiv_y, num_subdiv_z, crds_i, crds_j):
+    """
+    Fibers of a rectangular patch (see `o3seespy.patch.Rect`), in the same order as OpenSees
+
+    Returns
+    -------
+    y_locs: array_like
+    z_locs: array_like
+    areas: array_like
+    """
+    return get_quad_patch_fibers(num_subdiv_y, num_subdiv_z, crds_i, [crds_j[0], crds_i[1]], crds_j,
+                                 [crds_i[0], crds_j[1]])
+
+
+def get_circ_patch_fibers(num_subdiv_circ, num_subdiv_rad, center, rad, ang):
+    """
+    Fibers of a circular patch (see `o3seespy.patch.Circ`), in the same order as OpenSees
+
+    Each fiber is located at the centroid of its annular sector.
+
+    Returns
+    -------
+    y_locs: array_like
+    z_locs: array_like
+    areas: array_like
+    """
+    rads = np.linspace(rad[0], rad[1], int(num_subdiv_rad) + 1)
+    d_ang = np.radians(ang[1] - ang[0]) / int(num_subdiv_circ)
+    angs = np.radians(ang[0]) + d_ang * (np.arange(int(num_subdiv_circ)) + 0.5)
+    r_0 = rads[:-1, np.newaxis]
+    r_1 = rads[1:, np.newaxis]
+    areas = np.broadcast_to(d_ang / 2 * (r_1 ** 2 - r_0 ** 2), (len(r_0), len(angs)))
+    r_cs = 2.0 / 3 * (r_1 ** 3 - r_0 ** 3) / (r_1 ** 2 - r_0 ** 2) * np.sin(d_ang / 2) / (d_ang / 2)
+    y_locs = center[0] + r_cs * np.cos(angs)
+    z_locs = center[1] + r_cs * np.sin(angs)
+    return y_locs.reshape(-1), z_locs.reshape(-1), areas.reshape(-1)
+
+
+def get_straight_layer_fibers(num_fiber, area_fiber, start, end):
+    """
+    Fibers of a straight layer (see `o3seespy.layer.Straight`), a single fiber is placed at the middle of the line
+
+    Returns
+    -------
+    y_locs: array_like
+    z_locs: array_like
+    areas: array_like
+    """
+    num_fiber = int(num_fiber)
+    start = np.asarray(start, dtype=float)
+    end = np.asarray(end, dtype=float)
+    if num_fiber == 1:
+        crds = ((start + end) / 2)[np.newaxis]
+    else:
+        crds = start + np.linspace(0.0, 1.0, num_fiber)[:, np.newaxis] * (end - start)
+    return crds[:, 0], crds[:, 1], np.full(num_fiber, float(area_fiber))
+
+
+def get_circ_layer_fibers(num_fiber, area_fiber, center, radius, ang=None):
+    """
+    Fibers of a circular layer (see `o3seespy.layer.Circ`)
+
+    If the arc is a full circle (360 degrees or more) then the fibers are spaced at 360 / `num_fiber` degrees,
+    otherwise they are spaced evenly from the start to the end of the arc.
+
+    Returns
+    -------
+    y_locs: array_like
+    z_locs: array_like
+    areas: array_like
+    """
+    num_fiber = int(num_fiber)
+    if ang is None:
+        ang = [0.0, 360.0 - 360.0 / num_fiber]
+    span = ang[1] - ang[0]
+    if num_fiber == 1:
+        d_ang = 0.0
+    elif span >= 360.0:
+        d_ang = 360.0 / num_fiber
+    else:
+        d_ang = span / (num_fiber - 1)
+    angs = np.radians(ang[0] + d_ang * np.arange(num_fiber))
+    y_locs = center[0] + radius * np.cos(angs)
+    z_locs = center[1] + radius * np.sin(angs)
+    return y_locs, z_locs, np.full(num_fiber, float(area_fiber))
+
+
+class FiberLayout(object):
+    def __init__(self):
+        """
+        Fibers of a fiber section, defined by patches and layers and stored as arrays
+
+        The location and area of the fibers of each patch and layer are computed in the same way as in OpenSees,
+        so the section properties can be obtained without OpenSees and the same layout can be used for many sections
+        (see `build_fiber_section`).
+
+        Examples
+        --------
+        >>> layout = o3.tools.FiberLayout()
+        >>> layout.add_rect_patch(conc, 10, 1, [-0.25, -0.25], [0.25, 0.25])
+        >>> layout.add_straight_layer(steel, 3, 4.9e-4, [0.2, -0.2], [0.2, 0.2])
+        >>> layout.add_straight_layer(steel, 3, 4.9e-4, [-0.2, -0.2], [-0.2, 0.2])
+        >>> sects = [o3.tools.build_fiber_section(osi, layout, as_fibers=True) for i in range(1000)]
+        """
+        self.components = []  # (patch or layer class, mat, inputs)
+        self.mats = []  # unique materials
+        self._y_locs = []
+        self._z_locs = []
+        self._areas = []
+        self._mat_inds = []
+        self._arrays = None
+        self._fiber_sets = {}  # material tags: FiberSet
+
+    def _add(self, cls, mat, inputs, fibers):
+        self.components.append((cls, mat, inputs))
+        for i, other in enumerate(self.mats):
+            if other is mat:
+                mat_ind = i
+                break
+        else:
+            mat_ind = len(self.mats)
+            self.mats.append(mat)
+        y_locs, z_locs, areas = fibers
+        self._y_locs.append(y_locs)
+        self._z_locs.append(z_locs)
+        self._areas.append(areas)
+        self._mat_inds.append(np.full(len(areas), mat_ind))
+        self._arrays = None
+        self._fiber_sets = {}
+
+    def add_quad_patch(self, mat, num_subdiv_ij, num_subdiv_jk, crds_i, crds_j, crds_k, crds_l):
+        """Add a quadrilateral patch, see `o3seespy.patch.Quad`"""
+        inputs = [num_subdiv_ij, num_subdiv_jk, crds_i, crds_j, crds_k, crds_l]
+        self._add(_patch.Quad, mat, inputs, get_quad_patch_fibers(*inputs))
+
+    def add_rect_patch(self, mat, num_subdiv_y, num_subdiv_z, crds_i, crds_j):
+        """Add a rectangular patch, see `o3seespy.patch.Rect`"""
+        inputs = [num_subdiv_y, num_subdiv_z, crds_i, crds_j]
+        self._add(_patch.Rect, mat, inputs, get_rect_patch_fibers(*inputs))
+
+    def add_circ_patch(self, mat, num_subdiv_circ, num_subdiv_rad, center, rad, ang):
+        """Add a circular patch, see `o3seespy.patch.Circ`"""
+        inputs = [num_subdiv_circ, num_subdiv_rad, center, rad, ang]
+        self._add(_patch.Circ, mat, inputs, get_circ_patch_fibers(*inputs))
+
+    def add_straight_layer(self, mat, num_fiber, area_fiber, start, end):
+        """Add a straight layer, see `o3seespy.layer.Straight`"""
+        inputs = [num_fiber, area_fiber, start, end]
+        self._add(_layer.Straight, mat, inputs, get_straight_layer_fibers(*inputs))
+
+    def add_circ_layer(self, mat, num_fiber, area_fiber, center, radius, ang=None):
+        """Add a circular layer, see `o3seespy.layer.Circ`"""
+        inputs = [num_fiber, area_fiber, center, radius, ang]
+        self._add(_layer.Circ, mat, inputs, get_circ_layer_fibers(*inputs))
+
+    def _get_arrays(self):
+        if self._arrays is None:
+            if not len(self.components):
+                self._arrays = (np.zeros(0), np.zeros(0), np.zeros(0), np.zeros(0, dtype=int))
+            else:
+                self._arrays = (np.concatenate(self._y_locs), np.concatenate(self._z_locs),
+                                np.concatenate(self._areas), np.concatenate(self._mat_inds))
+        return self._arrays
+
+    @property
+    def y_locs(self):
+        return self._get_arrays()[0]
+
+    @property
+    def z_locs(self):
+        return self._get_arrays()[1]
+
+    @property
+    def areas(self):
+        return self._get_arrays()[2]
+
+    @property
+    def mat_inds(self):
+        """Index of the material of each fiber in `mats`"""
+        return self._get_arrays()[3]
+
+    @property
+    def n_fibers(self):
+        return len(self.areas)
+
+    def get_area(self, mat=None):
+        """Total area of the fibers, or of the fibers of a material"""
+        if mat is None:
+            return np.sum(self.areas)
+        return np.sum(self.areas[self.mat_inds == self._get_mat_ind(mat)])
+
+    def get_centroid(self):
+        """Y & z-coordinates of the centroid of the fibers"""
+        area = self.get_area()
+        return np.sum(self.areas * self.y_locs) / area, np.sum(self.areas * self.z_locs) / area
+
+    def _get_mat_ind(self, mat):
+        for i, other in enumerate(self.mats):
+            if other is mat:
+                return i
+        raise ValueError('mat is not used in the layout')
+
+    def get_fiber_set(self):
+        """FiberSet of the fibers, cached for the current material tags"""
+        mat_tags = tuple([mat.tag for mat in self.mats])
+        if mat_tags not in self._fiber_sets:
+            self._fiber_sets[mat_tags] = FiberSet(self.y_locs, self.z_locs, self.areas,
+                                                  np.array(mat_tags, dtype=int)[self.mat_inds])
+        return self._fiber_sets[mat_tags]
+
+
+def build_fiber_section(osi, layout, gj=None, torsion_mat=None, as_fibers=False):
+    """
+    Create a fiber section from a fiber layout
+
+    Parameters
+    ----------
+    osi: o3seespy.OpenSeesInstance
+    layout: FiberLayout
+    gj: float, optional
+        Linear-elastic torsional stiffness assigned to the section
+    torsion_mat: obj, optional
+        Uniaxialmaterial assigned to the section for torsional response
+    as_fibers: bool
+        If True then the fibers are created directly with `fiber` commands sent in bulk (the parameters are cached
+        in the layout so are only computed once for many sections), otherwise the patches and layers are created
+
+    Returns
+    -------
+    o3seespy.section.Fiber
+    """
+    sect = _section.Fiber(osi, gj=gj, torsion_mat=torsion_mat)
+    if as_fibers:
+        layout.get_fiber_set().to_process(osi)
+    else:
+        for cls, mat, inputs in layout.components:
+            cls(osi, mat, *inputs)
+    return sect
+
+
+def run_moment_curvature(osi, sect, max_curv, axial_load=0.0, n_steps=100):
+    """
+    Moment-curvature response of a section under constant axial load (2D)
+
+    The section is assigned to a zero length section element with the axial load applied first,
+    then the curvature is increased under displacement control.
+
+    Parameters
+    ----------
+    osi: o3seespy.OpenSeesInstance
+        Must have ndm=2 and ndf=3, should not contain another model
+    sect: o3seespy.section.SectionBase
+        Section with axial force and moment about the z-axis
+    max_curv: float
+        Maximum curvature
+    axial_load: float
+        Axial load (negative for compression)
+    n_steps: int
+        Number of curvature increments
+
+    Returns
+    -------
+    curvs: array_like
+        Curvature at each step, the analysis stops at the first step that fails to converge
+    moments: array_like
+        Moment at each step
+    """
+    if osi.ndm != 2 or osi.ndf != 3:
+        raise ValueError('osi must have ndm=2 and ndf=3')
+    nodes = [o3.node.Node(osi, 0.0, 0.0), o3.node.Node(osi, 0.0, 0.0)]
+    o3.Fix3DOF(osi, nodes[0], o3.cc.FIXED, o3.cc.FIXED, o3.cc.FIXED)
+    o3.Fix3DOF(osi, nodes[1], o3.cc.FREE, o3.cc.FIXED, o3.cc.FREE)
+    o3.element.ZeroLengthSection(osi, nodes, sect)
+
+    ts = o3.time_series.Linear(osi, factor=1)
+    o3.pattern.Plain(osi, ts)
+    o3.Load(osi, nodes[1], [axial_load, 0.0, 0.0])
+    o3.constraints.Plain(osi)
+    o3.numberer.Plain(osi)
+    o3.system.BandGeneral(osi)
+    o3.test_check.NormDispIncr(osi, abs(max_curv) * 1.0e-10, 20)
+    o3.algorithm.Newton(osi)
+    o3.integrator.LoadControl(osi, 1.0)
+    o3.analysis.Static(osi)
+    if o3.analyze(osi, 1) != 0:
+        raise ValueError('axial load could not be applied')
+    o3.load_constant(osi, time=0.0)
+
+    ts = o3.time_series.Linear(osi, factor=1)
+    o3.pattern.Plain(osi, ts)
+    o3.Load(osi, nodes[1], [0.0, 0.0, 1.0])
+    o3.integrator.DisplacementControl(osi, nodes[1], o3.cc.DOF2D_ROTZ, max_curv / n_steps)
+    curvs = [0.0]
+    moments = [0.0]
+    for i in range(n_steps):
+        if o3.analyze(osi, 1) != 0:
+            break
+        curvs.append(o3.get_node_disp(osi, nodes[1], o3.cc.DOF2D_ROTZ))
+        moments.append(o3.get_time(osi))  # load factor of the unit moment
+    return np.array(curvs), np.array(moments)
@@ -0,0 +1,201 @@
+import numpy as np
+from o3seespy import cc
+from o3seespy.command import node as _node
+from o3seespy.command import element as _element
+from o3seespy.command import section as _section
+from o3seespy.command import beam_integration as _beam_integration
+from o3seespy.command import geom_transf as _geom_transf
+from o3seespy.command import uniaxial_material as _uniaxial_material
+from o3seespy.command.common import build_equal_dofs, build_fixities
+
+
+class Frame2D(object):
+    """
+    2D moment resisting frame built by `build_frame_2d`
+
+    Node tags are stored in a grid of (storey, column), storey 0 is the base. Column element tags are stored in a
+    grid of (storey, column) and beam element tags in a grid of (storey, bay), storey 0 is the first storey.
+    """
+
+    def __init__(self, nodes, node_tags, col_tags, beam_tags):
+        self.nodes = nodes
+        self.node_tags = node_tags
+        self.col_tags = col_tags
+        self.beam_tags = beam_tags
+        self.sections = []  # unique sections
+        self.integrations = []  # unique beam integrations
+        self.transfs = []
+        self.ele_sets = []  # one ElementSet per integration
+        self.ties = None  # rigid floor diaphragms
+        self.fixities = None
+
+    @property
+    def n_storeys(self):
+        return self.node_tags.shape[0] - 1
+
+    @property
+    def n_cols(self):
+        return self.node_tags.shape[1]
+
+    def get_node(self, storey, col):
+        """Node at a storey and column, can be used in place of a Node object"""
+        return self.nodes[int(self.node_tags[storey, col] - self.nodes.tags[0])]
+
+
+def _get_unique_rows(values):
+    """Unique rows and the index of the unique row of each row"""
+    uniq, inv = np.unique(values, axis=0, return_inverse=True)
+    return uniq, inv.reshape(-1)
+
+
+def _build_members(osi, frame, conn, e_mod, areas, izs, lps, hinge_props, transf):
+    """Create the unique sections and integrations of a set of members, then the elements grouped by integration"""
+    n = len(conn)
+    props = np.column_stack([np.broadcast_to(e_mod, n), areas, izs])
+    uniq, sect_inds = _get_unique_rows(props)
+    sects = [_section.Elastic2D(osi, *row.tolist()) for row in uniq]
+    if hinge_props is None:
+        hinge_inds = sect_inds
+    else:
+        uniq, hinge_inds = _get_unique_rows(hinge_props)
+        hinge_inds = hinge_inds + len(sects)
+        for row in uniq.tolist():
+            mat = _uniaxial_material.ElasticBilin(osi, *row)
+            sects.append(_section.Uniaxial(osi, mat, quantity=cc.M_Z))
+    frame.sections += sects
+
+    if lps is None:
+        uniq, integ_inds = _get_unique_rows(sect_inds[:, np.newaxis])
+        integs = [_beam_integration.Lobatto(osi, sects[int(row[0])], 5) for row in uniq]
+    else:
+        uniq, integ_inds = _get_unique_rows(np.column_stack([hinge_inds, lps, sect_inds]))
+        integs = []
+        for row in uniq.tolist():
+            sec_h = sects[int(row[0])]
+            integs.append(_beam_integration.HingeMidpoint(osi, sec_h, row[1], sec_h, row[1], sects[int(row[2])]))
+    frame.integrations += integs
+
+    tags = np.zeros(n, dtype=int)
+    for i, integ in enumerate(integs):
+        inds = np.where(integ_inds == i)[0]
+        ele_set = _element.ForceBeamColumn.build_many(osi, conn[inds], transf, integ)
+        frame.ele_sets.append(ele_set)
+        tags[inds] = ele_set.tags
+    return tags
+
+
+def build_frame_2d(osi, bay_lengths, storey_heights, e_mod, col_areas, col_izs, beam_areas, beam_izs, col_lps=None,
+                   beam_lps=None, col_hinge_props=None, beam_hinge_props=None, storey_masses=None, p_delta=False,
+                   diaphragm=True):
+    """
+    Build a 2D moment resisting frame with force-based beam-column elements
+
+    Identical sections, materials and beam integrations are only created once, then the nodes, masses,
+    floor diaphragm `equalDOF`s, base fixities and elements (grouped by integration) are created in bulk.
+    Member properties can be a single value or an array of (storey, column) for columns
+    and (storey, bay) for beams.
+
+    Parameters
+    ----------
+    osi: o3seespy.OpenSeesInstance
+        Must have ndm=2 and ndf=3
+    bay_lengths: array_like
+        Length of each bay
+    storey_heights: array_like
+        Interstorey height of each storey, from the first storey up
+    e_mod: float
+        Young's modulus of the members
+    col_areas: float or array_like (n_storeys, n_cols)
+        Cross-section area of the columns
+    col_izs: float or array_like (n_storeys, n_cols)
+        Second moment of area of the columns
+    beam_areas: float or array_like (n_storeys, n_bays)
+        Cross-section area of the beams
+    beam_izs: float or array_like (n_storeys, n_bays)
+        Second moment of area of the beams
+    col_lps: float or array_like (n_storeys, n_cols), optional
+        Plastic hinge length of the columns, if None then elastic sections with Lobatto integration are used,
+        otherwise `HingeMidpoint` integration
+    beam_lps: float or array_like (n_storeys, n_bays), optional
+        Plastic hinge length of the beams
+    col_hinge_props: array_like (n_storeys, n_cols, 3), optional
+        `ElasticBilin` inputs (ep1, ep2, eps_p2) of the moment-curvature of the column hinges,
+        if None then the hinges are elastic, requires `col_lps`
+    beam_hinge_props: array_like (n_storeys, n_bays, 3), optional
+        `ElasticBilin` inputs (ep1, ep2, eps_p2) of the moment-curvature of the beam hinges, requires `beam_lps`
+    storey_masses: float or array_like, optional
+        Mass of each storey, applied in the x-direction to the nodes of the storey in proportion to their
+        tributary length
+    p_delta: bool
+        If True then the columns use a P-Delta transformation
+    diaphragm: bool
+        If True then the nodes of each storey are tied in the x-direction (rigid floor diaphragm)
+
+    Returns
+    -------
+    Frame2D
+
+    Examples
+    --------
+    >>> osi = o3.OpenSeesInstance(ndm=2, ndf=3)
+    >>> frame = o3.tools.build_frame_2d(osi, [6.0] * 10, [3.4] * 40, 30.0e6, 0.25, 2.6e-3, 0.2, 1.7e-3,
+    >>>                                 col_lps=0.4, beam_lps=0.5, storey_masses=[4.0e4] * 40)
+    >>> o3.get_node_disp(osi, frame.get_node(40, 0), o3.cc.X)
+    """
+    if osi.ndm != 2 or osi.ndf != 3:
+        raise ValueError('osi must have ndm=2 and ndf=3')
+    if col_hinge_props is not None and col_lps is None:
+        raise ValueError('col_lps must be set to use col_hinge_props')
+    if beam_hinge_props is not None and beam_lps is None:
+        raise ValueError('beam_lps must be set to use beam_hinge_props')
+    bay_lengths = np.asarray(bay_lengths, dtype=float)
+    storey_heights = np.asarray(storey_heights, dtype=float)
+    n_storeys = len(storey_heights)
+    n_bays = len(bay_lengths)
+    n_cols = n_bays + 1
+    col_shape = (n_storeys, n_cols)
+    beam_shape = (n_storeys, n_bays)
+
+    def to_col(values):
+        return None if values is None else np.broadcast_to(np.asarray(values, dtype=float), col_shape).reshape(-1)
+
+    def to_beam(values):
+        return None if values is None else np.broadcast_to(np.asarray(values, dtype=float), beam_shape).reshape(-1)
+
+    # nodes
+    xs = np.insert(np.cumsum(bay_lengths), 0, 0.0)
+    ys = np.insert(np.cumsum(storey_heights), 0, 0.0)
+    coords = np.column_stack([np.tile(xs, n_storeys + 1), np.repeat(ys, n_cols)])
+    masses = None
+    if storey_masses is not None:
+        trib_lengths = np.zeros(n_cols)
+        trib_lengths[:-1] += bay_lengths / 2
+        trib_lengths[1:] += bay_lengths / 2
+        masses = np.zeros((len(coords), 3))
+        storey_masses = np.broadcast_to(np.asarray(storey_masses, dtype=float), (n_storeys,))
+        node_masses = np.outer(storey_masses, trib_lengths / np.sum(bay_lengths))
+        masses[n_cols:, 0] = node_masses.reshape(-1)
+    nodes = _node.build_nodes(osi, coords, masses)
+    node_tags = nodes.tags.reshape(n_storeys + 1, n_cols)
+
+    beam_transf = _geom_transf.Linear2D(osi, [])
+    col_transf = _geom_transf.PDelta2D(osi, []) if p_delta else beam_transf
+    frame = Frame2D(nodes, node_tags, None, None)
+    frame.transfs = [beam_transf] if col_transf is beam_transf else [beam_transf, col_transf]
+
+    # columns then beams
+    col_conn = np.column_stack([node_tags[:-1].reshape(-1), node_tags[1:].reshape(-1)])
+    col_hinges = None if col_hinge_props is None else np.broadcast_to(col_hinge_props, col_shape + (3,)).reshape(-1, 3)
+    frame.col_tags = _build_members(osi, frame, col_conn, e_mod, to_col(col_areas), to_col(col_izs), to_col(col_lps),
+                                    col_hinges, col_transf).reshape(col_shape)
+    beam_conn = np.column_stack([node_tags[1:, :-1].reshape(-1), node_tags[1:, 1:].reshape(-1)])
+    beam_hinges = None
+    if beam_hinge_props is not None:
+        beam_hinges = np.broadcast_to(beam_hinge_props, beam_shape + (3,)).reshape(-1, 3)
+    frame.beam_tags = _build_members(osi, frame, beam_conn, e_mod, to_beam(beam_areas), to_beam(beam_izs),
+                                     to_beam(beam_lps), beam_hinges, beam_transf).reshape(beam_shape)
+
+    if diaphragm and n_cols > 1:
+        frame.ties = build_equal_dofs(osi, np.repeat(node_tags[1:, 0], n_bays), node_tags[1:, 1:], [cc.X])
+    frame.fixities = build_fixities(osi, node_tags[0], [cc.FIXED, cc.FIXED, cc.FIXED])
+    return frame
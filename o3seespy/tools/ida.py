@@ -0,0 +1,281 @@
+import numpy as np
+import o3seespy as o3
+from o3seespy.tools.motion_suite import _run_motion
+from o3seespy.tools.transient import NodeOutput, run_transient
+
+IDA_DTYPE = [('record', int), ('scale', float), ('max_drift', float), ('peak_accel', float), ('converged', bool),
+             ('collapsed', bool), ('run_time', float)]
+
+
+class HuntFillSearch(object):
+    def __init__(self, first_scale=0.1, step=0.1, step_incr=0.05, resolution=0.02, max_scale=None, max_runs=12):
+        """
+        Hunt-and-fill search for the collapse scale factor of a single record (Vamvatsikos and Cornell, 2004)
+
+        The hunt phase increases the scale factor with increasing steps until collapse, then the gap between the
+        highest non-collapse and lowest collapse scale factors is bisected, then the largest gaps between
+        the non-collapse scale factors are filled until `max_runs` is reached.
+
+        Parameters
+        ----------
+        first_scale: float
+            Scale factor of the first run
+        step: float
+            Initial increase in scale factor during the hunt phase
+        step_incr: float
+            Increase in step after each run during the hunt phase
+        resolution: float
+            Stop bisecting or filling once gaps are less than this value
+        max_scale: float, optional
+            Scale factor at which to stop the hunt phase if collapse has not occurred
+        max_runs: int
+            Maximum number of analyses for the record
+        """
+        self.first_scale = first_scale
+        self.step = step
+        self.step_incr = step_incr
+        self.resolution = resolution
+        self.max_scale = max_scale
+        self.max_runs = max_runs
+        self.collapsed = {}  # scale: bool
+        self.n_hunt = 0
+
+    @property
+    def n_runs(self):
+        return len(self.collapsed)
+
+    def add_result(self, scale, collapsed):
+        self.collapsed[round(float(scale), 10)] = bool(collapsed)
+
+    def get_bracket(self):
+        """Highest non-collapse scale below the lowest collapse scale, and the lowest collapse scale"""
+        c_scales = [x for x in self.collapsed if self.collapsed[x]]
+        if not len(c_scales):
+            return None
+        hi = min(c_scales)
+        lo = max([0.0] + [x for x in self.collapsed if not self.collapsed[x] and x < hi])
+        return lo, hi
+
+    def next_scale(self):
+        """Scale factor of the next run, or None if search is complete"""
+        if self.n_runs >= self.max_runs:
+            return None
+        bracket = self.get_bracket()
+        if bracket is None:  # hunt
+            if not self.n_runs:
+                return self.first_scale
+            scale = max(self.collapsed) + self.step + self.n_hunt * self.step_incr
+            if self.max_scale is not None and max(self.collapsed) >= self.max_scale:
+                return self._fill(max(self.collapsed))
+            if self.max_scale is not None:
+                scale = min(scale, self.max_scale)
+            self.n_hunt += 1
+            return scale
+        lo, hi = bracket
+        if hi - lo > self.resolution:  # bracket
+            return (lo + hi) / 2
+        return self._fill(lo)
+
+    def _fill(self, upper):
+        scales = sorted([0.0] + [x for x in self.collapsed if not self.collapsed[x] and x <= upper])
+        gaps = np.diff(scales)
+        if not len(gaps) or max(gaps) <= self.resolution:
+            return None
+        i = int(np.argmax(gaps))
+        return (scales[i] + scales[i + 1]) / 2
+
+
+def _to_row(record, scale, result, collapse_drift):
+    outputs = result['outputs'] if result['status'] == 'ok' else None
+    if not isinstance(outputs, dict):
+        outputs = {}
+    max_drift = float(outputs.get('max_drift', np.nan))
+    peak_accel = float(outputs.get('peak_accel', np.nan))
+    converged = result['status'] == 'ok' and bool(outputs.get('converged', True))
+    collapsed = not converged or (collapse_drift is not None and max_drift >= collapse_drift)
+    run_time = result['run_time'] if result['run_time'] is not None else np.nan
+    return record, scale, max_drift, peak_accel, converged, collapsed, run_time
+
+
+def run_uniform_excitation(motion, scale=1.0, model_builder=None, dt=0.01, analysis_dt=None, extra_time=0.0,
+                           tol=1.0e-4, max_iter=10):
+    """
+    Default analysis of `run_ida`, applies a scaled ground motion at the base and records the interstorey drifts
+
+    The motion is applied in the X direction with `time_series.Path` and `pattern.UniformExcitation` and a
+    Newmark transient analysis is run with `run_transient`, the floor displacements are collected after each step.
+
+    Parameters
+    ----------
+    motion: array_like
+        Ground acceleration values
+    scale: float
+        Scale factor of the motion
+    model_builder: callable
+        Function that builds the model (nodes, elements, masses, damping and any gravity analysis), called with
+        no arguments. Must return the `OpenSeesInstance` and one node per floor from the base to the roof.
+        Must be defined at the module level so that it can be sent to the worker processes.
+    dt: float
+        Time step of the motion
+    analysis_dt: float, optional
+        Time step of the analysis, if None then `dt`
+    extra_time: float
+        Time to analyse after the end of the motion
+    tol: float
+        Tolerance of the energy increment test
+    max_iter: int
+        Maximum number of iterations of the energy increment test
+
+    Returns
+    -------
+    dict:
+        'max_drift': peak interstorey drift ratio, 'peak_accel': peak absolute acceleration of the roof,
+        'converged': False if an analysis step failed
+    """
+    if model_builder is None:
+        raise ValueError('model_builder must be set in builder_kwargs when run_ida is used without a builder')
+    if analysis_dt is None:
+        analysis_dt = dt
+    osi, floor_nodes = model_builder()
+    floor_nodes = list(floor_nodes)
+    heights = np.array([o3.get_node_coords(osi, x)[osi.ndm - 1] for x in floor_nodes])
+    values = np.asarray(motion, dtype=float) * scale
+    acc_series = o3.time_series.Path(osi, dt=dt, values=-values)
+    o3.pattern.UniformExcitation(osi, dir=o3.cc.X, accel_series=acc_series)
+    o3.wipe_analysis(osi)
+    o3.algorithm.Newton(osi)
+    o3.system.SparseGeneral(osi)
+    o3.numberer.RCM(osi)
+    o3.constraints.Transformation(osi)
+    o3.integrator.Newmark(osi, 0.5, 0.25)
+    o3.analysis.Transient(osi)
+    o3.test_check.EnergyIncr(osi, tol, max_iter)
+    n_steps = int(round(((len(values) - 1) * dt + extra_time) / analysis_dt))
+    outputs = {'disp': NodeOutput(floor_nodes, o3.cc.X, 'disp'),
+               'roof_accel': NodeOutput(floor_nodes[-1], o3.cc.X, 'accel')}
+    status, res = run_transient(osi, n_steps, analysis_dt, outputs=outputs)
+    o3.wipe(osi)
+    drifts = np.diff(res['disp'].reshape(len(res['time']), -1), axis=1) / np.diff(heights)
+    ground_accel = np.interp(res['time'], np.arange(len(values)) * dt, values, right=0.0)
+    abs_accel = res['roof_accel'] + ground_accel
+    return {'max_drift': float(np.max(np.abs(drifts), initial=0.0)),
+            'peak_accel': float(np.max(np.abs(abs_accel), initial=0.0)), 'converged': status == 0}
+
+
+def run_ida(builder, motions, collapse_drift=None, search=None, n_workers=None, builder_kwargs=None,
+            previous=None, callback=None):
+    """
+    Run an incremental dynamic analysis (IDA) using a hunt-and-fill search for each record
+
+    Records are searched in parallel, each worker process runs one (record, scale) analysis at a time
+    and the next scale factor of a record is submitted as soon as its previous analysis is complete.
+
+    Parameters
+    ----------
+    builder: callable or None
+        Function that builds and runs the model, called as `builder(motion, scale=scale, **builder_kwargs)`.
+        Must return a dict with 'max_drift' and optionally 'peak_accel' and 'converged' (bool).
+        An exception in the builder is treated as non-convergence.
+        Must be defined at the module level so that it can be sent to the worker processes.
+        If None then `run_uniform_excitation` is used, which requires 'model_builder' in `builder_kwargs`.
+    motions: list
+        Ground motions, passed to `builder`
+    collapse_drift: float, optional
+        Drift at which the structure is considered collapsed, non-converged analyses are always collapsed
+    search: dict, optional
+        Keyword arguments for `HuntFillSearch`
+    n_workers: int, optional
+        Number of worker processes, if None then the number of processors, if 1 then run in the current process
+    builder_kwargs: dict, optional
+        Extra keyword arguments passed to `builder`
+    previous: array_like, optional
+        Table from a previous call, completed (record, scale) runs are reused instead of being rerun
+    callback: callable, optional
+        Called with each new row of the table as analyses finish
+
+    Returns
+    -------
+    table: numpy structured array
+        One row per analysis with fields: 'record', 'scale', 'max_drift', 'peak_accel', 'converged',
+        'collapsed', 'run_time'
+    """
+    if builder is None:
+        builder = run_uniform_excitation
+    if builder_kwargs is None:
+        builder_kwargs = {}
+    if search is None:
+        search = {}
+    searches = [HuntFillSearch(**search) for i in range(len(motions))]
+    done = {}
+    if previous is not None:
+        for row in previous:
+            done[(int(row['record']), round(float(row['scale']), 10))] = tuple(row)
+    rows = []
+
+    def get_next_job(i):  # next scale to run for record i, reusing previous results
+        while True:
+            scale = searches[i].next_scale()
+            if scale is None:
+                return None
+            key = (i, round(float(scale), 10))
+            if key not in done:
+                return scale
+            rows.append(done[key])
+            searches[i].add_result(scale, done[key][5])
+
+    def add_result(i, scale, result):
+        row = _to_row(i, scale, result, collapse_drift)
+        rows.append(row)
+        searches[i].add_result(scale, row[5])
+        if callback is not None:
+            callback(row)
+
+    if n_workers == 1:
+        for i, motion in enumerate(motions):
+            scale = get_next_job(i)
+            while scale is not None:
+                add_result(i, scale, _run_motion(builder, i, motion, scale, builder_kwargs))
+                scale = get_next_job(i)
+    else:
+        from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            running = {}
+            for i, motion in enumerate(motions):
+                scale = get_next_job(i)
+                if scale is not None:
+                    running[executor.submit(_run_motion, builder, i, motion, scale, builder_kwargs)] = (i, scale)
+            while running:
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    i, scale = running.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception:  # e.g. worker process crashed
+                        result = {'status': 'failed', 'outputs': None, 'run_time': None}
+                    add_result(i, scale, result)
+                    scale = get_next_job(i)
+                    if scale is not None:
+                        fut = executor.submit(_run_motion, builder, i, motions[i], scale, builder_kwargs)
+                        running[fut] = (i, scale)
+    return np.array(rows, dtype=IDA_DTYPE)
+
+
+def get_collapse_scales(table, n_records=None):
+    """
+    Lowest collapse scale factor of each record from an IDA table, NaN if collapse was not reached
+
+    Parameters
+    ----------
+    table: numpy structured array
+        Output of `run_ida`
+    n_records: int, optional
+        Number of records, if None then inferred from the table
+    """
+    if n_records is None:
+        n_records = int(table['record'].max()) + 1 if len(table) else 0
+    scales = np.full(n_records, np.nan)
+    for i in range(n_records):
+        c_scales = table['scale'][(table['record'] == i) & table['collapsed']]
+        if len(c_scales):
+            scales[i] = c_scales.min()
+    return scales
@@ -0,0 +1,294 @@
+import numpy as np
+from o3seespy.command import node as _node
+from o3seespy.command import element as _element
+from o3seespy.command import uniaxial_material as _uniaxial_material
+from o3seespy.command.common import build_equal_dofs, build_fixities
+
+_soil_ele_types = {2: ['Quad', 'SSPquad'], 3: ['StdBrick', 'SSPbrick']}
+
+
+def get_node_depths(thicknesses, ele_h):
+    """
+    Depths of the rows of nodes of a layered deposit
+
+    Each layer is divided into equal elements that are no taller than the target element height of the layer.
+
+    Parameters
+    ----------
+    thicknesses: array_like
+        Thickness of each layer
+    ele_h: float or array_like
+        Target element height, a single value or one per layer
+
+    Returns
+    -------
+    depths: array_like
+        Depth of each row of nodes, starting at 0.0
+    ele_layers: array_like (int)
+        Index of the layer of each row of elements
+    """
+    thicknesses = np.asarray(thicknesses, dtype=float)
+    ele_h = np.broadcast_to(np.asarray(ele_h, dtype=float), thicknesses.shape)
+    n_eles = np.maximum(np.ceil(thicknesses / ele_h - 1.0e-9), 1).astype(int)
+    heights = np.repeat(thicknesses / n_eles, n_eles)
+    depths = np.insert(np.cumsum(heights), 0, 0.0)
+    depths[np.insert(np.cumsum(n_eles), 0, 0)] = np.insert(np.cumsum(thicknesses), 0, 0.0)  # exact layer bounds
+    return depths, np.repeat(np.arange(len(thicknesses)), n_eles)
+
+
+def get_shear_vel(mat):
+    """
+    Small-strain shear wave velocity of an nDMaterial from its shear modulus and density
+
+    Supports materials with `g_mod_ref` (e.g. `PressureIndependMultiYield`, at the reference pressure) or
+    `e_mod` and `nu` (e.g. `ElasticIsotropic`), the density (`rho`) must be set.
+    """
+    if hasattr(mat, 'g_mod_ref'):
+        g_mod = mat.g_mod_ref
+    elif hasattr(mat, 'e_mod') and hasattr(mat, 'nu'):
+        g_mod = mat.e_mod / (2 * (1 + mat.nu))
+    else:
+        raise ValueError(f'Cannot get the shear modulus of {mat.__class__.__name__}, set shear_vels instead')
+    if not getattr(mat, 'rho', 0.0) > 0.0:
+        raise ValueError(f'rho of {mat.__class__.__name__} must be set to get the shear wave velocity')
+    return np.sqrt(g_mod / mat.rho)
+
+
+def get_wave_ele_h(shear_vels, f_max, n_per_wave=10, max_ele_h=None):
+    """
+    Largest element height that propagates a shear wave of frequency `f_max`
+
+    The element height is limited to `n_per_wave` elements per wavelength (Kuhlemeyer and Lysmer, 1973),
+    i.e. `shear_vel / (n_per_wave * f_max)`.
+
+    Parameters
+    ----------
+    shear_vels: float or array_like
+        Shear wave velocity of each layer, reduce for the expected strain level in nonlinear analyses
+    f_max: float
+        Highest frequency of interest (Hz)
+    n_per_wave: int
+        Number of elements per wavelength
+    max_ele_h: float, optional
+        Upper limit of the element height
+
+    Returns
+    -------
+    array_like
+        Target element height of each layer
+    """
+    ele_h = np.asarray(shear_vels, dtype=float) / (n_per_wave * f_max)
+    if max_ele_h is not None:
+        ele_h = np.minimum(ele_h, max_ele_h)
+    return ele_h
+
+
+def get_wave_node_depths(thicknesses, shear_vels, f_max, n_per_wave=10, max_ele_h=None):
+    """
+    Depths of the rows of nodes of the coarsest mesh that propagates a shear wave of frequency `f_max`
+
+    See `get_wave_ele_h` and `get_node_depths`.
+
+    Returns
+    -------
+    depths: array_like
+        Depth of each row of nodes, starting at 0.0
+    ele_layers: array_like (int)
+        Index of the layer of each row of elements
+    """
+    return get_node_depths(thicknesses, get_wave_ele_h(shear_vels, f_max, n_per_wave, max_ele_h))
+
+
+def _get_ele_args(ele_type, mat, thick, otype, body_force):
+    if ele_type == 'Quad':
+        return [thick, otype, mat], {'b1': body_force[0], 'b2': body_force[1]}
+    if ele_type == 'SSPquad':
+        return [mat, otype, thick, body_force[0], body_force[1]], {}
+    return [mat, *body_force], {}  # bricks
+
+
+class SoilMesh(object):
+    """
+    Structured mesh of a layered soil deposit, see `build_soil_mesh`
+
+    Node and element tags are stored in grids, with the first index the row (from the surface down),
+    then the column (x-direction) for 2D, or the y-direction then x-direction for 3D.
+    """
+
+    def __init__(self, nodes, node_tags, depths, xs, ys, ele_sets, ele_tags, ele_layers):
+        self.nodes = nodes
+        self.node_tags = node_tags
+        self.depths = depths
+        self.xs = xs
+        self.ys = ys
+        self.ele_sets = ele_sets  # one ElementSet per layer
+        self.ele_tags = ele_tags
+        self.ele_layers = ele_layers
+        self.ties = None  # lateral ties
+        self.base_ties = None
+        self.fixities = []
+        self.base_node = None
+        self.dashpot_node = None
+        self.dashpot = None
+        self.c_base = None
+
+    def get_node(self, *index):
+        """Node at a position in the `node_tags` grid, can be used in place of a Node object"""
+        return self.nodes[int(self.node_tags[index] - self.nodes.tags[0])]
+
+    @property
+    def surface_nodes(self):
+        return self.nodes[:self.node_tags[0].size]
+
+
+def build_soil_mesh(osi, thicknesses, mats, ele_h=None, width=1.0, length=None, ele_w=None, ele_type=None, thick=1.0,
+                    otype='PlaneStrain', body_forces=None, tie_lateral=True, base_imp=None, f_max=None,
+                    n_per_wave=10, shear_vels=None):
+    """
+    Build a structured quad (ndm=2) or brick (ndm=3) mesh of a layered soil deposit
+
+    All nodes, elements and constraints are created in bulk. The surface is at zero elevation and
+    the vertical axis is y (ndm=2) or z (ndm=3).
+    If `tie_lateral` then the boundary nodes at each depth are tied to the first node of the row (`equalDOF` of the
+    translational degrees-of-freedom), which gives a simple shear (free-field) response.
+    The base is fixed, or if `base_imp` is set then it is compliant: the base nodes are fixed vertically and tied
+    horizontally, and a horizontal dashpot (Lysmer and Kuhlemeyer, 1969) connects `base_node` to a fixed node.
+
+    Parameters
+    ----------
+    osi: o3seespy.OpenSeesInstance
+    thicknesses: array_like
+        Thickness of each layer, from the surface down
+    mats: list
+        nDMaterial of each layer
+    ele_h: float or array_like, optional
+        Target element height, a single value or one per layer, see `get_node_depths`
+    width: float
+        Width of the mesh (x-direction)
+    length: float, optional
+        Length of the mesh (y-direction, ndm=3 only), default is `width`
+    ele_w: float, optional
+        Target element width (and length), default is the smallest element height
+    ele_type: str, optional
+        'Quad' or 'SSPquad' (ndm=2, default 'SSPquad'), 'StdBrick' or 'SSPbrick' (ndm=3, default 'SSPbrick')
+    thick: float
+        Out-of-plane thickness of the elements (ndm=2 only)
+    otype: str
+        'PlaneStrain' or 'PlaneStress' (ndm=2 only)
+    body_forces: array_like (n_layers, ndm), optional
+        Body forces of the elements of each layer
+    tie_lateral: bool
+        If True then the lateral boundaries are tied
+    base_imp: float, optional
+        Impedance (density times shear wave velocity) of the underlying half-space, if set the base is compliant
+    f_max: float, optional
+        Highest frequency of interest, if set then the element heights are limited to `n_per_wave` elements per
+        shear wavelength (see `get_wave_ele_h`), as well as by `ele_h`
+    n_per_wave: int
+        Number of elements per wavelength
+    shear_vels: array_like, optional
+        Shear wave velocity of each layer, if None then obtained from `mats` (see `get_shear_vel`)
+
+    Returns
+    -------
+    SoilMesh
+
+    Examples
+    --------
+    >>> osi = o3.OpenSeesInstance(ndm=2, ndf=2)
+    >>> mats = [o3.nd_material.ElasticIsotropic(osi, 2.0e5, 0.3, rho=1.8), ...]
+    >>> mesh = o3.tools.build_soil_mesh(osi, [4.0, 6.0], mats, width=1.0, base_imp=1.8 * 300, f_max=25.0)
+    >>> ts = o3.time_series.Path(osi, dt=dt, values=-vels, factor=mesh.c_base)
+    >>> o3.pattern.Plain(osi, ts)
+    >>> o3.Load(osi, mesh.base_node, [1.0, 0.0])
+    """
+    ndm = osi.ndm
+    if ndm not in _soil_ele_types:
+        raise ValueError(f'osi.ndm must be 2 or 3, not {ndm}')
+    if ele_type is None:
+        ele_type = _soil_ele_types[ndm][1]
+    if ele_type not in _soil_ele_types[ndm]:
+        raise ValueError(f'ele_type must be one of {_soil_ele_types[ndm]} for ndm={ndm}, not {ele_type}')
+    if len(mats) != len(thicknesses):
+        raise ValueError('mats must have one material per layer')
+    if body_forces is None:
+        body_forces = np.zeros((len(thicknesses), ndm))
+    body_forces = np.asarray(body_forces, dtype=float).reshape(len(thicknesses), ndm)
+
+    if f_max is not None:
+        if shear_vels is None:
+            shear_vels = [get_shear_vel(mat) for mat in mats]
+        ele_h = get_wave_ele_h(shear_vels, f_max, n_per_wave, max_ele_h=ele_h)
+    elif ele_h is None:
+        raise ValueError('ele_h or f_max must be set')
+    depths, ele_layers = get_node_depths(thicknesses, ele_h)
+    if ele_w is None:
+        ele_w = np.min(np.diff(depths))
+    xs = np.linspace(0.0, width, max(int(np.ceil(width / ele_w - 1.0e-9)), 1) + 1)
+    if ndm == 2:
+        ys = None
+        grid_shape = (len(depths), len(xs))
+        coords = np.column_stack([np.tile(xs, len(depths)), np.repeat(-depths, len(xs))])
+    else:
+        if length is None:
+            length = width
+        ys = np.linspace(0.0, length, max(int(np.ceil(length / ele_w - 1.0e-9)), 1) + 1)
+        grid_shape = (len(depths), len(ys), len(xs))
+        coords = np.column_stack([np.tile(xs, len(depths) * len(ys)), np.tile(np.repeat(ys, len(xs)), len(depths)),
+                                  np.repeat(-depths, len(xs) * len(ys))])
+    nodes = _node.build_nodes(osi, coords)
+    node_tags = nodes.tags.reshape(grid_shape)
+
+    tt = node_tags
+    if ndm == 2:  # counter-clockwise from the bottom left
+        conn = np.stack([tt[1:, :-1], tt[1:, 1:], tt[:-1, 1:], tt[:-1, :-1]], axis=-1)
+    else:  # bottom face then top face
+        conn = np.stack([tt[1:, :-1, :-1], tt[1:, :-1, 1:], tt[1:, 1:, 1:], tt[1:, 1:, :-1],
+                         tt[:-1, :-1, :-1], tt[:-1, :-1, 1:], tt[:-1, 1:, 1:], tt[:-1, 1:, :-1]], axis=-1)
+    ele_cls = getattr(_element, ele_type)
+    ele_sets = []
+    first_ele_tag = osi.n_ele + 1
+    for i in range(len(thicknesses)):
+        rows = np.where(ele_layers == i)[0]
+        args, kwargs = _get_ele_args(ele_type, mats[i], thick, otype, body_forces[i].tolist())
+        ele_sets.append(ele_cls.build_many(osi, conn[rows].reshape(-1, conn.shape[-1]), *args, **kwargs))
+    ele_tags = np.arange(first_ele_tag, osi.n_ele + 1).reshape(conn.shape[:-1])
+    mesh = SoilMesh(nodes, node_tags, depths, xs, ys, ele_sets, ele_tags, ele_layers)
+
+    # constraints
+    dofs = list(range(1, ndm + 1))
+    perimeter = np.ones(grid_shape[1:], dtype=bool)
+    if ndm == 2:
+        perimeter[1:-1] = False
+    else:
+        perimeter[1:-1, 1:-1] = False
+    is_tied = np.zeros(grid_shape, dtype=bool)  # constrained by a lateral tie
+    if tie_lateral and perimeter.sum() > 1:
+        is_tied[:] = perimeter
+        is_tied[(slice(None),) + (0,) * (ndm - 1)] = False  # first node of each row is retained
+        n_tied_rows = len(depths) if base_imp is not None else len(depths) - 1
+        is_tied[n_tied_rows:] = False
+        masters = node_tags[(slice(0, n_tied_rows),) + (0,) * (ndm - 1)]
+        n_per_row = int(is_tied[0].sum())
+        mesh.ties = build_equal_dofs(osi, np.repeat(masters, n_per_row), node_tags[is_tied], dofs)
+    base_tags = node_tags[-1].reshape(-1)
+    base_tied = is_tied[-1].reshape(-1)
+    base_node = mesh.get_node(*((-1,) + (0,) * (ndm - 1)))
+    mesh.base_node = base_node
+    if base_imp is None:
+        mesh.fixities.append(build_fixities(osi, base_tags, [1] * osi.ndf))
+        return mesh
+    fixities = [0] * osi.ndf
+    fixities[ndm - 1] = 1  # vertical
+    mesh.fixities.append(build_fixities(osi, base_tags[~base_tied], fixities))
+    free_base = base_tags[~base_tied][1:]  # base nodes that are not tied laterally move with the base node
+    if len(free_base):
+        mesh.base_ties = build_equal_dofs(osi, base_node.tag, free_base, dofs[:-1])
+    mesh.dashpot_node = _node.Node(osi, *coords[base_node.tag - nodes.tags[0]].tolist())
+    mesh.fixities.append(build_fixities(osi, [mesh.dashpot_node.tag], [1] * osi.ndf))
+    base_area = width * thick if ndm == 2 else width * length
+    mesh.c_base = base_imp * base_area
+    dashpot_mat = _uniaxial_material.Viscous(osi, mesh.c_base, alpha=1.)
+    mesh.dashpot = _element.ZeroLength(osi, [mesh.dashpot_node, base_node], mats=[dashpot_mat] * (ndm - 1),
+                                       dirs=dofs[:-1])
+    return mesh
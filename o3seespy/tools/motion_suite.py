@@ -0,0 +1,91 @@
+import time
+import traceback
+import numpy as np
+
+
+def _run_motion(builder, index, motion, scale, builder_kwargs):
+    """Run the builder for a single motion and return the results, errors are caught and returned"""
+    result = {'index': index, 'scale': scale, 'status': 'ok', 'error': None, 'outputs': None}
+    start = time.time()
+    try:
+        if scale is None:
+            outputs = builder(motion, **builder_kwargs)
+        else:
+            outputs = builder(motion, scale=scale, **builder_kwargs)
+        if isinstance(outputs, dict):
+            result['outputs'] = {item: np.asarray(outputs[item]) for item in outputs}
+        else:
+            result['outputs'] = np.asarray(outputs)
+    except Exception:
+        result['status'] = 'failed'
+        result['error'] = traceback.format_exc()
+    result['run_time'] = time.time() - start
+    return result
+
+
+def run_motion_suite(builder, motions, scales=None, n_workers=None, builder_kwargs=None):
+    """
+    Run an analysis for each motion in a suite of ground motions using several processes
+
+    Since openseespy only supports one model per process, each analysis is run in a worker process that
+    builds, runs and collects its own model.
+
+    Parameters
+    ----------
+    builder: callable
+        Function that builds and runs the model for a motion and returns the outputs as a dict of arrays
+        (e.g. from `o3seespy.recorder.NodeToArray.collect()`), called as `builder(motion, **builder_kwargs)`,
+        or as `builder(motion, scale=scale, **builder_kwargs)` if `scales` is set.
+        Must be defined at the module level so that it can be sent to the worker processes.
+    motions: list
+        Ground motions (e.g. arrays of accelerations or `eqsig.AccSignal` objects), passed to `builder`
+    scales: list, optional
+        Scale factors, if set then each motion is run at each scale factor
+    n_workers: int, optional
+        Number of worker processes, if None then the number of processors, if 1 then run in the current process
+    builder_kwargs: dict, optional
+        Extra keyword arguments passed to `builder`
+
+    Returns
+    -------
+    results: list of dict
+        One dict per analysis (ordered by motion then scale) with keys:
+        'index' (index of motion), 'scale', 'status' ('ok' or 'failed'), 'error' (traceback if failed),
+        'outputs' (dict of arrays returned by the builder) and 'run_time' (seconds)
+
+    Examples
+    --------
+    >>> def run_column(acc, scale=1.0, dt=0.01):
+    >>>     osi = o3.OpenSeesInstance(ndm=2, ndf=2)
+    >>>     ...
+    >>>     na = o3.recorder.NodeToArray(osi, top_node, [o3.cc.X], 'accel')
+    >>>     o3.analyze(osi, len(acc), dt)
+    >>>     return {'top_acc': na.collect()}
+    >>> results = run_motion_suite(run_column, [acc1, acc2], scales=[0.5, 1.0], builder_kwargs={'dt': 0.01})
+    """
+    if builder_kwargs is None:
+        builder_kwargs = {}
+    jobs = []
+    for i, motion in enumerate(motions):
+        if scales is None:
+            jobs.append((i, motion, None))
+        else:
+            for scale in scales:
+                jobs.append((i, motion, scale))
+    if n_workers == 1:
+        return [_run_motion(builder, i, motion, scale, builder_kwargs) for i, motion, scale in jobs]
+
+    from concurrent.futures import ProcessPoolExecutor
+    results = [None] * len(jobs)
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        futures = {}
+        for j, (i, motion, scale) in enumerate(jobs):
+            futures[executor.submit(_run_motion, builder, i, motion, scale, builder_kwargs)] = j
+        for future in futures:
+            j = futures[future]
+            try:
+                results[j] = future.result()
+            except Exception:  # e.g. worker process crashed
+                results[j] = {'index': jobs[j][0], 'scale': jobs[j][2], 'status': 'failed',
+                              'error': traceback.format_exc(), 'outputs': None, 'run_time': None}
+    return results
@@ -0,0 +1,295 @@
+import re
+import ast
+from itertools import groupby
+from o3seespy.base_model import OpenSeesObject, OpenSeesMultiObject
+from o3seespy.opensees_instance import OpenSeesInstance, _history_commands
+
+# position of the tag in the parameters and the tag counter of the OpenSeesInstance
+_tag_counters = {'node': (0, 'n_node'), 'element': (1, 'n_ele'), 'uniaxialMaterial': (1, 'n_mat'),
+                 'nDMaterial': (1, 'n_mat'), 'section': (1, 'n_sect'), 'timeSeries': (1, 'n_tseries'),
+                 'pattern': (1, 'n_pat'), 'geomTransf': (1, 'n_transformation'), 'beamIntegration': (1, 'n_integ'),
+                 'region': (0, 'n_region')}
+# commands that are ignored since they do not define the model
+_ignored_commands = {'wipe', 'puts', 'print', 'printModel', 'source', 'logFile', 'exit', 'return'}
+
+_class_map = None
+
+
+def _get_subclasses(cls):
+    for sub in cls.__subclasses__():
+        yield sub
+        yield from _get_subclasses(sub)
+
+
+def _import_all_commands():
+    """Import all lazily loaded command modules so that all classes are subclasses of OpenSeesObject"""
+    import o3seespy
+    for module_name in o3seespy._lazy_modules:
+        if '.command.' in module_name:
+            module = getattr(o3seespy, module_name.split('.')[-1])
+            for name in getattr(module, '_lazy_modules', []):
+                getattr(module, name)
+
+
+def get_o3_class_map():
+    """Dict of (op_base_type, op_type): o3seespy class, op_type is None for commands without a type"""
+    global _class_map
+    if _class_map is None:
+        _import_all_commands()
+        _class_map = {}
+        for cls in _get_subclasses(OpenSeesObject):
+            if cls.op_base_type == '<not-set>' or issubclass(cls, OpenSeesMultiObject):
+                continue
+            op_type = cls.op_type
+            if op_type in [None, '<not-set>', cls.op_base_type]:
+                op_type = None
+            _class_map.setdefault((cls.op_base_type, op_type), cls)
+        # typed commands (e.g. element) must match a type, untyped (e.g. node, fix) only the op_base_type
+        typed = set([x[0] for x in _class_map if x[1] is not None])
+        for op_base_type in typed:
+            _class_map.pop((op_base_type, None), None)
+    return _class_map
+
+
+def get_o3_class(op_base_type, parameters):
+    """o3seespy class of a command, None if not supported"""
+    class_map = get_o3_class_map()
+    if (op_base_type, None) in class_map:
+        return class_map[(op_base_type, None)]
+    if len(parameters) and isinstance(parameters[0], str):
+        return class_map.get((op_base_type, parameters[0]))
+    return None
+
+
+def _to_value(token):
+    if token.isdigit() or (token[0] == '-' and token[1:].isdigit()):
+        return int(token)
+    if token[0].isalpha():
+        return token
+    try:
+        return float(token)
+    except ValueError:
+        return token
+
+
+_tcl_var = re.compile(r'\$\{?(\w+)\}?')
+
+
+def parse_tcl_lines(lines):
+    """
+    Convert the lines of a Tcl script to openseespy commands
+
+    Supports comments, `;` separated commands, line continuation, `set` variables and `pattern` blocks
+    (including blocks written on a single line).
+    Other Tcl constructs (e.g. loops, procedures, `expr`) are reported as unsupported and blocks are skipped.
+
+    Returns
+    -------
+    commands: list
+        (line number, op_base_type, parameters)
+    unsupported: list
+        (line number, command) of unsupported commands
+    """
+    commands = []
+    unsupported = []
+    variables = {}
+    blocks = []  # 'pattern' or 'skip'
+    depth = 0  # brace depth of a skipped block
+    i = 0
+    n = len(lines)
+    while i < n:
+        line = lines[i].strip()
+        line_no = i + 1
+        i += 1
+        while line.endswith('\\') and i < n:
+            line = line[:-1] + ' ' + lines[i].strip()
+            i += 1
+        if len(blocks) and blocks[-1] == 'skip':
+            depth += line.count('{') - line.count('}')
+            if depth <= 0:
+                blocks.pop()
+            continue
+        if not line or line[0] == '#':
+            continue
+        if '{' in line and line.split()[:2] in [['pattern', 'Plain'], ['pattern', 'MultipleSupport']]:
+            # commands of the block can follow on the same line, e.g. 'pattern Plain 1 1 { load 3 1.0 0.0 }'
+            start = line.index('{') + 1
+            line = line[:start] + ';' + line[start:]
+            if line.endswith('}'):
+                line = line[:-1] + ';}'
+        for com in line.split(';') if ';' in line else [line]:
+            com = com.strip()
+            if not com or com[0] == '#':
+                continue
+            if com == '}':
+                if len(blocks):
+                    blocks.pop()
+                continue
+            raw = com
+            if '$' in com:
+                com = _tcl_var.sub(lambda m: variables.get(m.group(1), m.group(0)), com)
+            opens_block = False
+            if '{' in com or '}' in com:
+                n_open = com.count('{') - com.count('}')
+                if n_open > 0:
+                    opens_block = True
+                    com = com[:com.rindex('{')]
+                com = com.replace('{', ' ').replace('}', ' ')
+            tokens = com.replace('"', ' ').split()
+            op_base_type = tokens[0]
+            if op_base_type == 'set' and len(tokens) == 3:
+                variables[tokens[1]] = tokens[2]
+                continue
+            if '$' in com or '[' in com:
+                unsupported.append((line_no, raw))
+                if opens_block:
+                    blocks.append('skip')
+                    depth = 1
+                continue
+            if opens_block:
+                if op_base_type == 'pattern':
+                    blocks.append('pattern')
+                else:
+                    unsupported.append((line_no, raw))
+                    blocks.append('skip')
+                    depth = 1
+                    continue
+            commands.append((line_no, op_base_type, [_to_value(x) for x in tokens[1:]]))
+    return commands, unsupported
+
+
+_py_command = re.compile(r'^\w+\.(\w+)\((.*)\)\s*(#.*)?$')
+
+
+def _parse_py_args(args):
+    parameters = []
+    for token in args.split(','):
+        token = token.strip()
+        if not token:
+            continue
+        if token[0] in '\'"' and token[-1] == token[0] and len(token) > 1:
+            parameters.append(token[1:-1])
+            continue
+        val = _to_value(token)
+        if isinstance(val, str):  # not a simple literal, e.g. a list or expression
+            return list(ast.literal_eval('(' + args + ',)'))
+        parameters.append(val)
+    return parameters
+
+
+def parse_py_lines(lines):
+    """
+    Convert the lines of an openseespy script to openseespy commands
+
+    Supports top-level calls with literal arguments (e.g. `ops.node(1, 0.0, 0.0)`),
+    other statements (e.g. loops, variables) are reported as unsupported.
+
+    Returns
+    -------
+    commands: list
+        (line number, op_base_type, parameters)
+    unsupported: list
+        (line number, line) of unsupported statements
+    """
+    commands = []
+    unsupported = []
+    for i, line in enumerate(lines):
+        stripped = line.strip()
+        if not stripped or stripped[0] == '#' or stripped.startswith(('import ', 'from ')):
+            continue
+        match = None
+        if line[0] not in ' \t':  # indented lines are inside a block
+            match = _py_command.match(stripped)
+        if match is None:
+            unsupported.append((i + 1, stripped))
+            continue
+        try:
+            parameters = _parse_py_args(match.group(2))
+        except (ValueError, SyntaxError):
+            unsupported.append((i + 1, stripped))
+            continue
+        commands.append((i + 1, match.group(1), parameters))
+    return commands, unsupported
+
+
+def import_script(ffp, osi=None, state=0, history=False, verbose=1):
+    """
+    Build a model from a Tcl or openseespy script
+
+    Commands are checked against the o3seespy classes (by `op_base_type` and `op_type`), then consecutive
+    commands of the same type are sent to OpenSees together. The tag counters of the OpenSeesInstance are set from
+    the imported tags, so new o3seespy objects can be added to the model.
+    Analysis commands (e.g. `analyze`, `eigen`) are not run and are reported as unsupported.
+
+    Parameters
+    ----------
+    ffp: str
+        Full file path of the script, '.py' files are parsed as openseespy, others as Tcl
+    osi: o3seespy.OpenSeesInstance, optional
+        Instance to add the model to, if None then created from the `model` command of the script
+    state: int
+        State of the new OpenSeesInstance
+    history: bool
+        If True then the commands are stored in `osi.history` (e.g. to save a snapshot)
+    verbose: int
+        If 1 then print the number of unsupported commands
+
+    Returns
+    -------
+    osi: o3seespy.OpenSeesInstance
+    unsupported: list
+        (line number, command) of commands that were not imported
+    """
+    with open(ffp) as ifile:
+        lines = ifile.read().splitlines()
+    if ffp.endswith('.py'):
+        commands, unsupported = parse_py_lines(lines)
+    else:
+        commands, unsupported = parse_tcl_lines(lines)
+    supported = []
+    is_supported = {}  # (op_base_type, op_type): bool
+    for line_no, op_base_type, parameters in commands:
+        if op_base_type in _ignored_commands:
+            continue
+        key = (op_base_type, parameters[0] if len(parameters) and isinstance(parameters[0], str) else None)
+        if key not in is_supported:
+            is_supported[key] = bool(op_base_type == 'model' or op_base_type in _history_commands or
+                                     get_o3_class(op_base_type, parameters))
+        if is_supported[key]:
+            supported.append((op_base_type, parameters))
+        else:
+            unsupported.append((line_no, ' '.join([op_base_type] + [str(x) for x in parameters])))
+    unsupported.sort()
+
+    max_tags = {}
+    for op_base_type, group in groupby(supported, key=lambda x: x[0]):
+        parameters_list = [x[1] for x in group]
+        if op_base_type == 'model':
+            for parameters in parameters_list:
+                ndm = parameters[parameters.index('-ndm') + 1]
+                ndf = parameters[parameters.index('-ndf') + 1] if '-ndf' in parameters else None
+                if osi is None:
+                    osi = OpenSeesInstance(ndm, ndf, state=state, history=history)
+                else:
+                    osi.reset_model_params(ndm, ndf if ndf is not None else osi.ndf)
+            continue
+        if osi is None:
+            raise ValueError(f"The 'model' command must be before '{op_base_type}' commands")
+        prev_history = osi.history
+        osi.history = None  # to_process_many does not store all commands in the history
+        osi.to_process_many(op_base_type, parameters_list)
+        osi.history = prev_history
+        if osi.history is not None:
+            osi.history += [(op_base_type, x) for x in parameters_list]
+        if op_base_type in _tag_counters:
+            ind, name = _tag_counters[op_base_type]
+            tags = [x[ind] for x in parameters_list if len(x) > ind and isinstance(x[ind], int)]
+            if len(tags):
+                max_tags[name] = max(max_tags.get(name, 0), max(tags))
+    if osi is None:
+        raise ValueError(f'No model command found in {ffp}')
+    for name in max_tags:
+        setattr(osi, name, max(getattr(osi, name), max_tags[name]))
+    if verbose and len(unsupported):
+        print(f'{len(unsupported)} commands not imported, e.g. line {unsupported[0][0]}: {unsupported[0][1]}')
+    return osi, unsupported
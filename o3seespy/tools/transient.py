@@ -0,0 +1,157 @@
+import numpy as np
+
+
+class NodeOutput(object):
+    _res_op_types = {'disp': 'nodeDisp', 'vel': 'nodeVel', 'accel': 'nodeAccel', 'reaction': 'nodeReaction'}
+
+    def __init__(self, nodes, dofs, res_type):
+        """
+        Nodal response to collect during `run_transient`
+
+        Columns are ordered by node then by degree-of-freedom.
+
+        Parameters
+        ----------
+        nodes: o3seespy.node.Node or list
+            A node or a list of nodes
+        dofs: int or list
+            Degree(s)-of-freedom (e.g. o3.cc.X)
+        res_type: str
+            Response type, either 'disp', 'vel', 'accel' or 'reaction'
+        """
+        if res_type not in self._res_op_types:
+            raise ValueError(f"res_type must be one of: {list(self._res_op_types)}")
+        if hasattr(nodes, 'tag'):
+            nodes = [nodes]
+        self.node_tags = [x.tag for x in nodes]
+        if not hasattr(dofs, '__len__'):
+            dofs = [dofs]
+        self.dofs = [int(x) for x in dofs]
+        self.res_type = res_type
+
+    @property
+    def n_cols(self):
+        return len(self.node_tags) * len(self.dofs)
+
+    def get_calls(self, get_func):
+        func = get_func(self._res_op_types[self.res_type])
+        return [(func, [tag]) for tag in self.node_tags], [x - 1 for x in self.dofs]
+
+
+class EleOutput(object):
+
+    def __init__(self, eles, args):
+        """
+        Element response to collect during `run_transient`
+
+        Columns are ordered by element then by response component.
+
+        Parameters
+        ----------
+        eles: element object or list
+            An element or a list of elements
+        args: list
+            Arguments of the element response (e.g. ['force'] or ['section', 1, 'deformation'])
+        """
+        if hasattr(eles, 'tag'):
+            eles = [eles]
+        self.ele_tags = [x.tag for x in eles]
+        self.args = list(args)
+        self.res_type = None
+
+    def get_calls(self, get_func):
+        func = get_func('eleResponse')
+        return [(func, [tag, *self.args]) for tag in self.ele_tags], None
+
+
+def run_transient(osi, n_steps, dt, outputs=None):
+    """
+    Run a transient analysis and collect responses after each step into preallocated arrays
+
+    The openseespy functions are resolved once before the analysis, so the Python work per step is limited to
+    the `analyze` call and one call per node or element output.
+    If the commands are exported (`osi.state` 1, 3 or 4) then the analysis is exported as a single `analyze`
+    command, the responses are not exported. If the commands are not executed (`osi.state` 1, 2 or 4) then no steps
+    are run and the results are empty.
+
+    Parameters
+    ----------
+    osi: o3seespy.OpenSeesInstance
+    n_steps: int
+        Number of analysis steps
+    dt: float
+        Time step
+    outputs: dict
+        Output name: `NodeOutput` or `EleOutput` object
+
+    Returns
+    -------
+    status: int
+        0 if all steps were successful, else output of the failed `analyze` call
+    results: dict
+        'time' and one array (n_steps_completed, n_cols) per output, 1D if the output has a single column
+
+    Examples
+    --------
+    >>> status, res = o3.tools.run_transient(osi, 1000, 0.01, outputs={
+    >>>     'roof_disp': o3.tools.NodeOutput(top_node, o3.cc.X, 'disp'),
+    >>>     'base_shear': o3.tools.NodeOutput(base_nodes, o3.cc.X, 'reaction'),
+    >>>     'col_force': o3.tools.EleOutput(col, ['force'])})
+    """
+    if outputs is None:
+        outputs = {}
+    if osi.state in [1, 3, 4]:  # exported as a single command, the steps below are not exported
+        osi.to_export('analyze', [int(n_steps), float(dt)])
+    if osi.state not in [0, 3, 5]:  # not executed, so there are no responses
+        results = {'time': np.empty(0)}
+        results.update({name: np.empty((0, 0)) for name in outputs})
+        return 0, results
+    osi.flush()
+    get_func = osi.get_opy_func
+    analyze = get_func('analyze')
+    get_time = get_func('getTime')
+    reactions = None
+    if any([getattr(x, 'res_type', None) == 'reaction' for x in outputs.values()]):
+        reactions = get_func('reactions')
+    names = list(outputs)
+    calls = []
+    for name in names:
+        calls.append(outputs[name].get_calls(get_func))
+    bufs = [None] * len(names)
+    times = np.empty(n_steps)
+    recorders = osi.array_recorders
+    status = 0
+    i = 0
+    for i in range(n_steps):
+        res = analyze(1, dt)
+        if res != 0:
+            status = res
+            break
+        t = get_time()
+        times[i] = t
+        if reactions is not None:
+            reactions()
+        for j in range(len(names)):
+            ele_calls, inds = calls[j]
+            resps = [func(*pms) for func, pms in ele_calls]
+            if inds is None:
+                vals = [x for resp in resps for x in resp]
+            else:
+                vals = [resp[k] for resp in resps for k in inds]
+            if bufs[j] is None:
+                bufs[j] = np.empty((n_steps, len(vals)))
+            bufs[j][i] = vals
+        for recorder in recorders:
+            recorder.record(osi, t)
+    else:
+        i = n_steps
+    results = {'time': times[:i]}
+    for j, name in enumerate(names):
+        if bufs[j] is None:
+            vals = np.empty((0, 0))
+        else:
+            vals = bufs[j][:i]
+        if vals.ndim == 2 and vals.shape[1] == 1:
+            vals = vals[:, 0]
+        results[name] = vals
+    return status, results
@@ -33,3 +33,14 @@ def test_ss_pbrick():
     mat = o3.nd_material.ElasticIsotropic(osi, 1, 0.45)
     o3.element.SSPbrick(osi, ele_nodes=ele_nodes, mat=mat, b1=1.0, b2=1.0, b3=1.0)
 
+
+def test_std_brick_build_many():
+    osi = o3.OpenSeesInstance(ndm=3)
+    coords = [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [0, 0, 1], [1, 0, 1], [1, 1, 1], [0, 1, 1]]
+    nodes = o3.node.build_nodes(osi, coords + [[x, y, z + 1] for x, y, z in coords[4:]])
+    mat = o3.nd_material.ElasticIsotropic(osi, 1, 0.45)
+    conn = [nodes.tags[:8], nodes.tags[4:]]
+    eles = o3.element.StdBrick.build_many(osi, conn, mat=mat, b1=1.0, b2=1.0, b3=1.0)
+    assert len(eles) == 2
+    assert eles.connectivity.shape == (2, 8)
+    assert eles.properties['b1'] == 1.0
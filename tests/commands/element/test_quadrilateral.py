@@ -72,6 +72,23 @@ def test_ss_pquad():
     o3.element.SSPquad(osi, ele_nodes=ele_nodes, mat=obj, otype='PlaneStrain', thick=1.0, b1=0.0, b2=0.0)
 
 
+def test_ssp_quad_build_many():
+    osi = o3.OpenSeesInstance(ndm=2, ndf=2, state=3)
+    mat = o3.nd_material.ElasticIsotropic(osi, 1, 0.45)
+    o3.node.build_nodes(osi, [[0, 0], [1, 0], [2, 0], [0, 1], [1, 1], [2, 1]])
+    o3.element.SSPquad(osi, [o3.node.NodeSetItem(x, None) for x in [1, 2, 5, 4]], mat, 'PlaneStrain', 1.0, 0.0, 0.0)
+    eles = o3.element.SSPquad.build_many(osi, [[1, 2, 5, 4], [2, 3, 6, 5]], mat, 'PlaneStrain', 1.0, 0.0, 0.0)
+    assert list(eles.tags) == [2, 3]
+    assert osi.n_ele == 3
+    assert eles[1].tag == 3
+    assert [x.tag for x in eles[1].ele_nodes] == [2, 3, 6, 5]
+    assert eles.properties['mat'] is mat
+    assert osi.commands[-2] == "opy.element('SSPquad', 1, 1, 2, 5, 4, 1, 'PlaneStrain', 1.0, 0.0, 0.0)"
+    assert osi.commands[-1].split('\n')[0] == "opy.element('SSPquad', 2, 1, 2, 5, 4, 1, 'PlaneStrain', 1.0, 0.0, 0.0)"
+    assert o3.get_ele_tags(osi) == [1, 2, 3]
+    assert [x.tag for x in eles[:1]] == [2]
+
+
 if __name__ == '__main__':
     test_bbar_quad()
 
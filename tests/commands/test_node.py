@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+import o3seespy as o3  # for testing only
+
+
+def test_build_nodes():
+    osi = o3.OpenSeesInstance(ndm=2, ndf=2, state=3)
+    o3.node.Node(osi, 0.0, 0.0)
+    coords = np.array([[0.0, 1.0], [1.0, 1.0], [1.0, 0.0]])
+    nodes = o3.node.build_nodes(osi, coords, masses=[1.0, 2.0])
+    assert list(nodes.tags) == [2, 3, 4]
+    assert osi.n_node == 4
+    assert osi.commands[-1] == "opy.node(2, 0.0, 1.0, '-mass', 1.0, 2.0)\nopy.node(3, 1.0, 1.0, '-mass', 1.0, 2.0)\n" \
+                               "opy.node(4, 1.0, 0.0, '-mass', 1.0, 2.0)"
+    assert len(nodes) == 3
+    assert nodes[1].tag == 3
+    assert nodes[1].x == 1.0
+    assert [x.tag for x in nodes[1:]] == [3, 4]
+    assert np.isclose(o3.get_node_coords(osi, nodes[0]), [0.0, 1.0]).all()
+    mat = o3.nd_material.ElasticIsotropic(osi, 1, 0.45)
+    o3.element.SSPquad(osi, [o3.node.NodeSetItem(1, 0.0, 0.0), *nodes[::-1]], mat, o3.cc.PLANE_STRAIN, 1.0, 0.0, 0.0)
+    tags, disps = o3.get_all_node_disps_as_array(osi, nodes)
+    assert disps.shape == (3, 2)
+
+
+def test_build_nodes_export():
+    osi = o3.OpenSeesInstance(ndm=3, state=1)
+    nodes = o3.node.build_nodes(osi, np.arange(6))
+    assert nodes.coords.shape == (2, 3)
+    assert osi.commands[-1:] == ['opy.node(1, 0.0, 1.0, 2.0)\nopy.node(2, 3.0, 4.0, 5.0)']
+
+
+def test_build_nodes_checks_masses():
+    osi = o3.OpenSeesInstance(ndm=2, ndf=3, state=4)
+    with pytest.raises(ValueError):
+        o3.node.build_nodes(osi, [[0.0, 0.0], [1.0, 0.0]], masses=[1.0, 2.0])
+    assert osi.n_node == 0
+
+
+def test_build_many_to_dict():
+    osi = o3.OpenSeesInstance(ndm=2, ndf=2, state=2)
+    mat = o3.nd_material.ElasticIsotropic(osi, 1, 0.45)
+    nodes = o3.node.build_nodes(osi, [[0, 0], [1, 0], [1, 1], [0, 1]], masses=[1.0, 2.0])
+    node = o3.node.Node(osi, 0.0, 1.0, x_mass=1.0, y_mass=2.0)
+    assert osi.dict['node'][4] == osi.dict['node'][5] == node.to_dict()
+    ele = o3.element.SSPquad(osi, list(nodes), mat, o3.cc.PLANE_STRAIN, 1.0, 0.0, 0.0)
+    o3.element.SSPquad.build_many(osi, [[1, 2, 3, 4]], mat, o3.cc.PLANE_STRAIN, 1.0, 0.0, 0.0)
+    assert osi.dict['SSPquad'][2] == ele.to_dict()
+    osi = o3.OpenSeesInstance(ndm=2, ndf=2, state=2)
+    nodes = o3.node.build_nodes(osi, [[0, 0], [1, 0]])
+    with pytest.raises(ValueError):
+        o3.build_fixities(osi, nodes.tags, [o3.cc.FIXED, o3.cc.FIXED])
@@ -0,0 +1,43 @@
+import numpy as np
+import o3seespy as o3
+
+
+def build_soil_column(osi, n_eles=3, acc=None, dt=0.01, scale=None):
+    """
+    Builds a column of SSPquad elements excited at the base by an acceleration time series
+
+    If `acc` is not set a 50 value half sine is used.
+
+    Returns
+    -------
+    nodes: list
+        Pairs of nodes from the surface to the base
+    eles: list
+        Elements from the surface to the base
+    """
+    if acc is None:
+        acc = np.sin(np.linspace(0, np.pi, 50))
+    nodes = []
+    for yy in range(n_eles + 1):
+        nodes.append([o3.node.Node(osi, 0, -yy), o3.node.Node(osi, 1, -yy)])
+        o3.EqualDOF(osi, nodes[yy][0], nodes[yy][1], [o3.cc.X])
+    for nd in nodes[-1]:
+        o3.Fix2DOF(osi, nd, o3.cc.FIXED, o3.cc.FIXED)
+    for yy in range(n_eles):
+        for nd in nodes[yy]:
+            o3.Fix2DOF(osi, nd, o3.cc.FREE, o3.cc.FIXED)
+    soil_mat = o3.nd_material.ElasticIsotropic(osi, e_mod=1.0e5, nu=0.3, rho=1.8)
+    eles = []
+    for yy in range(n_eles):
+        ele_nodes = [nodes[yy + 1][0], nodes[yy + 1][1], nodes[yy][1], nodes[yy][0]]
+        eles.append(o3.element.SSPquad(osi, ele_nodes, soil_mat, o3.cc.PLANE_STRAIN, 1.0, 0.0, 0.0))
+    acc_series = o3.time_series.Path(osi, dt=dt, values=-np.asarray(acc), factor=scale)
+    o3.pattern.UniformExcitation(osi, dir=o3.cc.X, accel_series=acc_series)
+    o3.algorithm.Newton(osi)
+    o3.system.SparseGeneral(osi)
+    o3.numberer.RCM(osi)
+    o3.constraints.Transformation(osi)
+    o3.integrator.Newmark(osi, 0.5, 0.25)
+    o3.analysis.Transient(osi)
+    o3.test_check.EnergyIncr(osi, tol=1.0e-6, max_iter=10)
+    return nodes, eles
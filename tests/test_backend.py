@@ -0,0 +1,92 @@
+import os
+import sys
+import subprocess
+import pytest
+import o3seespy as o3
+from o3seespy import backend
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _build_column(osi, n_eles=3):
+    mat = o3.nd_material.ElasticIsotropic(osi, 1.0e5, 0.3)
+    nodes = [o3.node.Node(osi, 0.0, float(i)) for i in range(n_eles + 1)]
+    nodes += [o3.node.Node(osi, 1.0, float(i)) for i in range(n_eles + 1)]
+    o3.Fix2DOF(osi, nodes[0], o3.cc.FIXED, o3.cc.FIXED)
+    o3.Fix2DOF(osi, nodes[n_eles + 1], o3.cc.FIXED, o3.cc.FIXED)
+    for i in range(n_eles):
+        o3.element.SSPquad(osi, [nodes[i], nodes[n_eles + i + 1], nodes[n_eles + i + 2], nodes[i + 1]],
+                           mat, 'PlaneStrain', 1.0, 0.0, 0.0)
+    return nodes
+
+
+def test_openseespy_not_imported():
+    code = "import sys, o3seespy as o3; o3.node; print('openseespy.opensees' in sys.modules)"
+    res = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                         env=dict(os.environ, PYTHONPATH=ROOT_DIR), cwd=ROOT_DIR)
+    assert res.stdout.strip().splitlines()[-1] == 'False'
+
+
+def test_recording_backend():
+    osi = o3.OpenSeesInstance(ndm=2, ndf=2, backend='recording')
+    assert isinstance(osi.backend, backend.RecordingBackend)
+    nodes = _build_column(osi)
+    assert o3.get_node_tags(osi) == list(range(1, 9))
+    assert osi.backend.commands[:2] == [('wipe', []), ('model', ['BasicBuilder', '-ndm', 2, '-ndf', 2])]
+    assert len([x for x in osi.backend.commands if x[0] == 'element']) == 3
+    osi.n_node -= 1
+    with pytest.raises(ValueError) as e:
+        o3.node.Node(osi, 2.0, 0.0)
+    assert 'opy.node(8, 2.0, 0.0)' in str(e.value)
+    o3.wipe(osi)
+    o3.node.Node(osi, 2.0, 0.0)  # tags cleared by wipe
+    assert nodes[0].tag == 1
+
+
+def test_recording_backend_does_not_change_domain():
+    osi = o3.OpenSeesInstance(ndm=2, ndf=2)
+    o3.node.Node(osi, 0.0, 0.0)
+    rec_osi = o3.OpenSeesInstance(ndm=2, ndf=2, backend=backend.RecordingBackend(store=False))
+    _build_column(rec_osi)
+    assert rec_osi.backend.commands == []
+    assert o3.get_node_tags(osi) == [1]
+
+
+def test_recording_backend_export():
+    osi = o3.OpenSeesInstance(ndm=2, ndf=2, state=3, backend='recording')
+    _build_column(osi, n_eles=1)
+    assert osi.commands[2] == 'opy.nDMaterial(\'ElasticIsotropic\', 1, 100000.0, 0.3, 0.0)'
+    assert len(osi.commands) == len(osi.backend.commands)
+
+
+def test_remote_backend():
+    osi_local = o3.OpenSeesInstance(ndm=2, ndf=2)
+    o3.node.Node(osi_local, 0.0, 0.0)
+    osi = o3.OpenSeesInstance(ndm=2, ndf=2, backend='remote')
+    try:
+        _build_column(osi)
+        assert o3.get_node_tags(osi) == list(range(1, 9))
+        osi.n_node -= 1
+        o3.node.Node(osi, 2.0, 0.0)  # batched, so the error is raised by the next command with a reply
+        with pytest.raises(ValueError) as e:
+            o3.get_node_tags(osi)
+        assert 'opy.node(8, 2.0, 0.0)' in str(e.value)
+    finally:
+        osi.backend.close()
+    assert o3.get_node_tags(osi_local) == [1]
+
+
+def test_invalid_backend():
+    with pytest.raises(ValueError):
+        o3.OpenSeesInstance(ndm=2, ndf=2, backend='not_a_backend')
+
+
+def test_to_opensees_default_backend():
+    osi = o3.OpenSeesInstance(ndm=2, ndf=2)
+    osi_exp = o3.OpenSeesInstance(ndm=2, ndf=2, state=4)  # not sent to opensees
+    node = o3.node.Node(osi_exp, 1.0, 2.0)
+    node.to_opensees()
+    assert o3.get_node_coords(osi, node) == [1.0, 2.0]
+    node2 = o3.node.Node(osi_exp, 3.0, 2.0)
+    node2.to_opensees(osi)
+    assert o3.get_node_coords(osi, node2) == [3.0, 2.0]
@@ -0,0 +1,58 @@
+import os
+import numpy as np
+import o3seespy as o3
+from tests.helpers import build_soil_column
+
+
+def build_column(osi, n_eles):
+    build_soil_column(osi, n_eles=n_eles)
+
+
+def _run(osi):
+    assert o3.analyze(osi, 10, 0.01) == 0
+    return o3.get_node_disp(osi, o3.node.NodeSetItem(1, None), o3.cc.X)
+
+
+def test_build_cache_replays_commands(tmp_path):
+    cache = o3.tools.BuildCache(str(tmp_path), n_memory=1)
+    osi = cache.build(build_column, ndm=2, ndf=2, kwargs={'n_eles': 3})
+    expected = _run(osi)
+    n_ele = osi.n_ele
+    assert cache.n_misses == 1
+    osi = cache.build(build_column, ndm=2, ndf=2, kwargs={'n_eles': 3})  # from memory
+    assert cache.n_hits == 1
+    assert osi.n_ele == n_ele
+    assert np.isclose(_run(osi), expected)
+    cache.build(build_column, ndm=2, ndf=2, kwargs={'n_eles': 4})
+    assert cache.n_misses == 2
+    assert len(os.listdir(str(tmp_path))) == 2
+
+    cache = o3.tools.BuildCache(str(tmp_path))  # e.g. another process, read from disk
+    osi = cache.build(build_column, ndm=2, ndf=2, kwargs={'n_eles': 3})
+    assert (cache.n_hits, cache.n_misses) == (1, 0)
+    assert np.isclose(_run(osi), expected)
+
+
+def test_build_cache_evicts_least_recently_used(tmp_path):
+    cache = o3.tools.BuildCache(str(tmp_path))
+    cache.build(build_column, ndm=2, ndf=2, args=[3])
+    cache.build(build_column, ndm=2, ndf=2, args=[4])
+    ffps = [os.path.join(str(tmp_path), x) for x in os.listdir(str(tmp_path))]
+    size = max([os.path.getsize(x) for x in ffps])
+    key = cache.get_key(build_column, 2, 2, [3], {})
+    os.utime(cache._get_ffp(key), (0, 0))  # least recently used
+    cache.max_size = size
+    cache.evict()
+    assert not os.path.exists(cache._get_ffp(key))
+    assert len(os.listdir(str(tmp_path))) == 1
+    cache.clear()
+    assert len(os.listdir(str(tmp_path))) == 0
+
+
+def test_build_cache_key_includes_versions(tmp_path, monkeypatch):
+    from o3seespy.tools import build_cache
+    cache = o3.tools.BuildCache(str(tmp_path))
+    key = cache.get_key(build_column, 2, 2, [3], {})
+    assert o3.tools.BuildCache(str(tmp_path), version='2').get_key(build_column, 2, 2, [3], {}) != key
+    monkeypatch.setattr(build_cache, '__version__', '0.0.0')
+    assert cache.get_key(build_column, 2, 2, [3], {}) != key
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+import o3seespy as o3
+import openseespy.opensees as opy
+from tests.helpers import build_soil_column
+
+
+def _run_column(state):
+    osi = o3.OpenSeesInstance(ndm=2, ndf=2, state=state)
+    nodes, eles = build_soil_column(osi, n_eles=5)
+    if state == 5:
+        assert len(osi.queue)
+        assert opy.getNodeTags() == []  # nothing sent yet
+    assert o3.analyze(osi, 20, 0.01) == 0  # flushes the queue first
+    assert len(osi.queue) == 0
+    return o3.get_node_disp(osi, nodes[0][0], o3.cc.X)
+
+
+def test_deferred_matches_line_by_line():
+    assert np.isclose(_run_column(5), _run_column(0))
+
+
+def test_flush_sends_element_sets_and_checks_tags():
+    osi = o3.OpenSeesInstance(ndm=2, ndf=2, state=5)
+    o3.node.build_nodes(osi, [[0, 0], [1, 0], [2, 0], [0, 1], [1, 1], [2, 1]])
+    mat = o3.nd_material.ElasticIsotropic(osi, 1.0e5, 0.3)
+    o3.element.SSPquad.build_many(osi, [[1, 2, 5, 4], [2, 3, 6, 5]], mat, o3.cc.PLANE_STRAIN, 1.0, 0.0, 0.0)
+    osi.flush()
+    assert o3.get_ele_tags(osi) == [1, 2]
+    o3.node.Node(osi, 3.0, 0.0)
+    osi.n_node -= 1
+    o3.node.Node(osi, 3.0, 1.0)
+    with pytest.raises(ValueError) as e:
+        osi.flush()
+    assert 'Duplicate node tags in queue: [7]' in str(e.value)
+    assert len(opy.getNodeTags()) == 6  # checked before any were sent
+    assert len(osi.queue) == 2  # nothing was dropped
+    osi.queue.pop()
+    osi.flush()
+    assert len(opy.getNodeTags()) == 7
+
+
+def test_flush_keeps_objects_that_were_not_sent():
+    osi = o3.OpenSeesInstance(ndm=2, ndf=2, state=5)
+    o3.nd_material.ElasticIsotropic(osi, 1.0e5, 0.3)
+    osi.to_queue('nDMaterial', ['NotAMaterial', 2])
+    o3.node.build_nodes(osi, [[0, 0], [1, 0]])
+    with pytest.raises(ValueError):
+        osi.flush()
+    assert [x[0] for x in osi.queue] == ['nDMaterial', 'node', 'node']  # failed command and those after it
+    assert osi.queue[0][1][0] == 'NotAMaterial'
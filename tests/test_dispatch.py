@@ -0,0 +1,23 @@
+import pytest
+import o3seespy as o3
+from o3seespy import exceptions
+
+
+def test_error_message_on_failure():
+    osi = o3.OpenSeesInstance(ndm=2, ndf=2)
+    o3.node.Node(osi, 0.0, 0.0)
+    assert 'node' in osi.backend.funcs
+    osi.n_node -= 1  # duplicate tag
+    with pytest.raises(ValueError) as e:
+        o3.node.Node(osi, 1.0, 0.0)
+    assert 'opy.node(1, 1.0, 0.0)' in str(e.value)
+    with pytest.raises(ValueError) as e:
+        osi.to_process('node', [1, 2.0, 0.0])
+    assert 'opensees.node(1,2.0,0.0)' in str(e.value)
+
+
+def test_missing_function():
+    osi = o3.OpenSeesInstance(ndm=2, ndf=2)
+    with pytest.raises(exceptions.ModelError):
+        osi.to_process('not_a_command', [1])
+    assert 'not_a_command' not in osi.backend.funcs
@@ -0,0 +1,41 @@
+import os
+import runpy
+import numpy as np
+import openseespy.opensees as opy
+import o3seespy as o3
+from o3seespy import extensions
+from tests.helpers import build_soil_column
+
+
+def test_to_commands_is_exact_and_not_truncated():
+    vals = [0.1 + 0.2, 1.0e-17, 3.0, 12345678.901234567] * 20
+    com = extensions.to_commands('timeSeries', ['Path', 1, '-values', *vals])
+    assert com.count(',') == len(vals) + 2
+    assert eval(com[len('opy.timeSeries('):-1]) == ('Path', 1, '-values', *vals)
+    short = extensions.to_commands('timeSeries', ['Path', 1, '-values', *vals], max_params=4)
+    assert short == "opy.timeSeries('Path', 1, '-values', 0.30000000000000004, ...)"
+
+
+def _build_and_export(tmp_path, npy_dir):
+    ffp = str(tmp_path / 'model.py')
+    osi = o3.OpenSeesInstance(ndm=2, ndf=2, state=3)
+    osi.export_to_file(ffp, npy_dir=npy_dir, min_array_len=20)
+    nodes, eles = build_soil_column(osi)  # Path time series has 50 values
+    osi.close_export()
+    assert o3.analyze(osi, 20, 0.01) == 0
+    return ffp, o3.get_node_disp(osi, nodes[0][0], o3.cc.X)
+
+
+def test_export_to_file_with_npy_round_trips(tmp_path):
+    ffp, expected = _build_and_export(tmp_path, 'arrays')
+    assert os.path.exists(str(tmp_path / 'arrays' / 'a0.npy'))
+    runpy.run_path(ffp)
+    opy.analyze(20, 0.01)
+    assert opy.nodeDisp(1, 1) == expected
+
+
+def test_export_to_file_inline_round_trips(tmp_path):
+    ffp, expected = _build_and_export(tmp_path, None)
+    runpy.run_path(ffp)
+    opy.analyze(20, 0.01)
+    assert opy.nodeDisp(1, 1) == expected
@@ -0,0 +1,62 @@
+import numpy as np
+import o3seespy as o3
+
+
+def _get_fiber_data(osi, sect):
+    """Location and area of the fibers of a section from OpenSees"""
+    nodes = [o3.node.Node(osi, 0.0, 0.0, 0.0), o3.node.Node(osi, 0.0, 0.0, 0.0)]
+    ele = o3.element.ZeroLengthSection(osi, nodes, sect)
+    return np.array(o3.get_ele_response(osi, ele, 'section', extra_args=['fiberData'])).reshape(-1, 5)[:, :3]
+
+
+def _build_layout(osi):
+    conc = o3.uniaxial_material.Elastic(osi, 30.0e6)
+    steel = o3.uniaxial_material.Elastic(osi, 200.0e6)
+    layout = o3.tools.FiberLayout()
+    layout.add_quad_patch(conc, 4, 3, [-0.1, -0.2], [0.3, -0.25], [0.35, 0.4], [-0.2, 0.3])
+    layout.add_rect_patch(conc, 5, 3, [-0.1, -0.2], [0.3, 0.4])
+    layout.add_circ_patch(conc, 7, 3, [0.1, 0.2], [0.0, 0.5], [10.0, 300.0])
+    layout.add_straight_layer(steel, 4, 0.02, [0.0, 0.1], [1.0, -1.0])
+    layout.add_straight_layer(steel, 1, 0.02, [0.0, 0.1], [1.0, -1.0])
+    layout.add_circ_layer(steel, 6, 0.01, [0.1, 0.2], 0.4)
+    layout.add_circ_layer(steel, 5, 0.01, [0.1, 0.2], 0.4, [30.0, 150.0])
+    layout.add_circ_layer(steel, 5, 0.01, [0.1, 0.2], 0.4, [30.0, 390.0])
+    return layout
+
+
+def test_fibers_match_opensees():
+    for as_fibers in [False, True]:
+        osi = o3.OpenSeesInstance(ndm=3, ndf=6)
+        layout = _build_layout(osi)
+        sect = o3.tools.build_fiber_section(osi, layout, gj=1.0, as_fibers=as_fibers)
+        fiber_data = _get_fiber_data(osi, sect)
+        assert layout.n_fibers == len(fiber_data) == 12 + 15 + 21 + 4 + 1 + 6 + 5 + 5
+        assert np.allclose(fiber_data[:, 0], layout.y_locs)
+        assert np.allclose(fiber_data[:, 1], layout.z_locs)
+        assert np.allclose(fiber_data[:, 2], layout.areas)
+    assert layout.mats[layout.mat_inds[-1]].tag == 2
+    assert np.isclose(layout.get_area(layout.mats[1]), 5 * 0.02 + 16 * 0.01)
+
+
+def test_fiber_set_cached():
+    osi = o3.OpenSeesInstance(ndm=2, ndf=3, state=4)
+    layout = _build_layout(osi)
+    sects = [o3.tools.build_fiber_section(osi, layout, as_fibers=True) for i in range(3)]
+    assert [x.tag for x in sects] == [1, 2, 3]
+    assert layout.get_fiber_set() is layout.get_fiber_set()
+    assert '\n'.join(osi.commands).count('opy.fiber(') == 3 * layout.n_fibers
+
+
+def test_moment_curvature_elastic():
+    osi = o3.OpenSeesInstance(ndm=2, ndf=3)
+    mat = o3.uniaxial_material.Elastic(osi, 30.0e6)
+    layout = o3.tools.FiberLayout()
+    layout.add_rect_patch(mat, 20, 1, [-0.25, -0.15], [0.25, 0.15])
+    assert np.isclose(layout.get_area(), 0.15)
+    assert np.allclose(layout.get_centroid(), 0.0)
+    sect = o3.tools.build_fiber_section(osi, layout, as_fibers=True)
+    curvs, moments = o3.tools.run_moment_curvature(osi, sect, 0.01, axial_load=-100.0, n_steps=10)
+    assert len(curvs) == 11
+    e_i = 30.0e6 * np.sum(layout.areas * layout.y_locs ** 2)
+    assert np.isclose(e_i, 30.0e6 * 0.3 * 0.5 ** 3 / 12 * (1 - 1 / 20 ** 2))
+    assert np.allclose(moments, e_i * curvs)
@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+import o3seespy as o3
+
+
+def _build_frame_one_by_one(osi, bay_lengths, storey_heights, e_mod, col_props, beam_props, lp, hinge_props, mass):
+    xs = np.insert(np.cumsum(bay_lengths), 0, 0.0)
+    ys = np.insert(np.cumsum(storey_heights), 0, 0.0)
+    nd = {}
+    for ss in range(len(ys)):
+        for cc in range(len(xs)):
+            nd[(ss, cc)] = o3.node.Node(osi, xs[cc], ys[ss])
+    for cc in range(len(xs)):
+        o3.Fix3DOF(osi, nd[(0, cc)], o3.cc.FIXED, o3.cc.FIXED, o3.cc.FIXED)
+    trib_lengths = np.zeros(len(xs))
+    trib_lengths[:-1] += np.array(bay_lengths) / 2
+    trib_lengths[1:] += np.array(bay_lengths) / 2
+    for ss in range(1, len(ys)):
+        for cc in range(len(xs)):
+            o3.set_node_mass(osi, nd[(ss, cc)], mass * trib_lengths[cc] / sum(bay_lengths), 0., 0.)
+            if cc:
+                o3.set_equal_dof(osi, nd[(ss, 0)], nd[(ss, cc)], o3.cc.X)
+    transf = o3.geom_transf.Linear2D(osi, [])
+    for ss in range(len(storey_heights)):
+        for cc in range(len(xs)):
+            sect = o3.section.Elastic2D(osi, e_mod, *col_props)
+            integ = o3.beam_integration.HingeMidpoint(osi, sect, lp, sect, lp, sect)
+            o3.element.ForceBeamColumn(osi, [nd[(ss, cc)], nd[(ss + 1, cc)]], transf, integ)
+        for bb in range(len(bay_lengths)):
+            mat = o3.uniaxial_material.ElasticBilin(osi, *hinge_props)
+            hinge = o3.section.Uniaxial(osi, mat, quantity=o3.cc.M_Z)
+            sect = o3.section.Elastic2D(osi, e_mod, *beam_props)
+            integ = o3.beam_integration.HingeMidpoint(osi, hinge, lp, hinge, lp, sect)
+            o3.element.ForceBeamColumn(osi, [nd[(ss + 1, bb)], nd[(ss + 1, bb + 1)]], transf, integ)
+
+
+def test_build_frame_2d_matches_one_by_one():
+    inputs = ([6.0, 5.0, 6.0], [4.0, 3.4, 3.4], 30.0e6)
+    hinge_props = [5.0e4, 2.5e3, 0.06]
+    osi = o3.OpenSeesInstance(ndm=2, ndf=3)
+    frame = o3.tools.build_frame_2d(osi, *inputs, 0.25, 2.6e-3, 0.2, 1.7e-3, col_lps=0.4, beam_lps=0.4,
+                                    beam_hinge_props=hinge_props, storey_masses=100.0)
+    assert frame.node_tags.shape == (4, 4)
+    assert frame.col_tags.shape == (3, 4)
+    assert frame.beam_tags.shape == (3, 3)
+    assert len(frame.sections) == 3  # column, beam and beam hinge
+    assert len(frame.integrations) == 2
+    assert len(frame.ties) == 9
+    assert sorted(frame.col_tags.reshape(-1).tolist() + frame.beam_tags.reshape(-1).tolist()) == list(range(1, 22))
+    assert frame.get_node(3, 3).y == 10.8
+    eigs = o3.get_eigen(osi, solver='fullGenLapack', n=3)
+
+    osi = o3.OpenSeesInstance(ndm=2, ndf=3)
+    _build_frame_one_by_one(osi, *inputs, [0.25, 2.6e-3], [0.2, 1.7e-3], 0.4, hinge_props, 100.0)
+    assert np.allclose(eigs, o3.get_eigen(osi, solver='fullGenLapack', n=3))
+
+
+def test_build_frame_2d_member_props():
+    osi = o3.OpenSeesInstance(ndm=2, ndf=3)
+    col_areas = [[0.3, 0.3], [0.25, 0.25]]
+    frame = o3.tools.build_frame_2d(osi, [6.0], [3.0, 3.0], 30.0e6, col_areas, 2.6e-3, 0.2, 1.7e-3, p_delta=True)
+    assert len(frame.sections) == 3
+    assert len(frame.integrations) == 3  # Lobatto for each section
+    assert len(frame.transfs) == 2
+    assert frame.fixities.node_tags.tolist() == [1, 2]
+    with pytest.raises(ValueError):
+        o3.tools.build_frame_2d(o3.OpenSeesInstance(ndm=2, ndf=2), [6.0], [3.0], 30.0e6, 0.3, 2.6e-3, 0.2, 1.7e-3)
+
+
+def test_build_frame_2d_hinge_props_require_lps():
+    osi = o3.OpenSeesInstance(ndm=2, ndf=3)
+    hinge_props = [5.0e4, 2.5e3, 0.06]
+    with pytest.raises(ValueError) as e:
+        o3.tools.build_frame_2d(osi, [6.0], [3.0], 30.0e6, 0.3, 2.6e-3, 0.2, 1.7e-3, col_hinge_props=hinge_props)
+    assert 'col_lps' in str(e.value)
+    with pytest.raises(ValueError) as e:
+        o3.tools.build_frame_2d(osi, [6.0], [3.0], 30.0e6, 0.3, 2.6e-3, 0.2, 1.7e-3, col_lps=0.4,
+                                beam_hinge_props=hinge_props)
+    assert 'beam_lps' in str(e.value)
+    assert o3.get_node_tags(osi) == []  # checked before the model is built
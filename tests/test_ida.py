@@ -0,0 +1,68 @@
+import numpy as np
+import o3seespy as o3
+
+
+def linear_drift_model(flexibility, scale=1.0):
+    if scale * flexibility > 3.0:
+        raise ValueError('analysis did not converge')
+    return {'max_drift': scale * flexibility, 'peak_accel': scale}
+
+
+def test_hunt_fill_search():
+    search = o3.tools.HuntFillSearch(first_scale=0.1, step=0.1, step_incr=0.1, resolution=0.05, max_runs=10)
+    scales = []
+    scale = search.next_scale()
+    while scale is not None:
+        scales.append(scale)
+        search.add_result(scale, scale >= 0.8)
+        scale = search.next_scale()
+    assert np.isclose(scales[:5], [0.1, 0.2, 0.4, 0.7, 1.1]).all()  # hunt
+    assert np.isclose(scales[5:8], [0.9, 0.8, 0.75]).all()  # bracket
+    assert len(scales) == 10
+    lo, hi = search.get_bracket()
+    assert hi - lo <= 0.05
+
+
+def test_run_ida():
+    rows = []
+    search = {'first_scale': 0.1, 'step': 0.2, 'resolution': 0.01, 'max_runs': 14}
+    table = o3.tools.run_ida(linear_drift_model, [0.5, 2.0, 40.], collapse_drift=1.0, search=search, n_workers=2,
+                             callback=rows.append)
+    assert len(table) == len(rows)
+    c_scales = o3.tools.get_collapse_scales(table)
+    assert np.isclose(c_scales, [2.0, 0.5, 0.025], atol=0.01).all()
+    assert not table['converged'][table['record'] == 2][0]
+    assert table['collapsed'][table['record'] == 2][0]
+    # refine search, previous runs are reused
+    new_rows = []
+    search['max_runs'] = 18
+    table2 = o3.tools.run_ida(linear_drift_model, [0.5, 2.0, 40.], collapse_drift=1.0, search=search, n_workers=1,
+                              previous=table, callback=new_rows.append)
+    assert len(table2) == len(table) + len(new_rows)
+    assert 0 < len(new_rows) <= 12
+
+
+def build_elastic_column():
+    osi = o3.OpenSeesInstance(ndm=2, ndf=3)
+    nodes = o3.node.build_nodes(osi, [[0.0, 0.0], [0.0, 3.0], [0.0, 6.0]], masses=[10.0, 10.0, 0.0])
+    o3.Fix3DOF(osi, nodes[0], o3.cc.FIXED, o3.cc.FIXED, o3.cc.FIXED)
+    transf = o3.geom_transf.Linear2D(osi, [])
+    for i in range(2):
+        o3.element.ElasticBeamColumn2D(osi, [nodes[i], nodes[i + 1]], 0.1, 30.0e6, 1.0e-4, transf)
+    o3.rayleigh.Rayleigh(osi, alpha_m=0.0, beta_k=0.002, beta_k_init=0.0, beta_k_comm=0.0)
+    return osi, nodes
+
+
+def test_run_ida_w_default_runner():
+    motion = np.sin(np.linspace(0, 4 * np.pi, 100))
+    res = o3.tools.run_uniform_excitation(motion, 2.0, model_builder=build_elastic_column, dt=0.01)
+    res_1 = o3.tools.run_uniform_excitation(motion, model_builder=build_elastic_column, dt=0.01)
+    assert res['converged']
+    assert res['max_drift'] > 0
+    assert np.isclose(res['max_drift'], 2 * res_1['max_drift'])
+    assert np.isclose(res['peak_accel'], 2 * res_1['peak_accel'])
+    search = {'first_scale': 1.0, 'step': 1.0, 'resolution': 0.1, 'max_runs': 8}
+    table = o3.tools.run_ida(None, [motion], collapse_drift=2.5 * res_1['max_drift'], search=search, n_workers=1,
+                             builder_kwargs={'model_builder': build_elastic_column, 'dt': 0.01})
+    assert np.isclose(o3.tools.get_collapse_scales(table), 2.5, atol=0.1).all()
+    assert table['converged'].all()
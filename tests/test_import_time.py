@@ -0,0 +1,63 @@
+import os
+import sys
+import subprocess
+import importlib
+import o3seespy as o3
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _run(code):
+    env = dict(os.environ, PYTHONPATH=ROOT_DIR)
+    res = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, env=env, cwd=ROOT_DIR)
+    return eval(res.stdout.strip().splitlines()[-1])
+
+
+def _get_loaded(code, prefixes):
+    return _run(code + f"; import sys; print(sorted([m for m in sys.modules if m.startswith({tuple(prefixes)})]))")
+
+
+def test_import_loads_submodules_lazily():
+    loaded = _get_loaded('import o3seespy', ['o3seespy.', 'numpy'])
+    assert 'numpy' not in loaded
+    assert 'o3seespy.command.element' not in loaded
+    assert 'o3seespy.tools' not in loaded
+    assert not [m for m in loaded if m.startswith('o3seespy.command.uniaxial_material.')]
+    loaded = _get_loaded('import o3seespy as o3; o3.uniaxial_material.Steel01', ['o3seespy.command.', 'numpy'])
+    assert 'numpy' not in loaded
+    assert 'o3seespy.command.uniaxial_material.steel' in loaded
+    assert 'o3seespy.command.uniaxial_material.other' not in loaded
+    assert 'o3seespy.command.element' not in loaded
+
+
+def test_import_time():
+    # time of the lazy import against the time to import every submodule (i.e. the previous eager import)
+    lazy_time, eager_time = _run(
+        "import time; t0 = time.perf_counter(); import o3seespy as o3; t1 = time.perf_counter()\n"
+        "for pkg in [o3, o3.element, o3.uniaxial_material, o3.nd_material, o3.tools]:\n"
+        "    [getattr(pkg, name) for name in dir(pkg)]\n"
+        "print((t1 - t0, time.perf_counter() - t0))")
+    print(f"import o3seespy: {lazy_time * 1e3:.1f} ms, with all submodules: {eager_time * 1e3:.1f} ms")
+    assert lazy_time < 1.0
+    assert lazy_time < eager_time / 3
+
+
+def test_star_import_and_dir():
+    names = _run("from o3seespy import *; print(sorted(dir()))")
+    for name in ['OpenSeesInstance', 'cc', 'analyze', 'node', 'element', 'uniaxial_material', 'section', 'recorder',
+                 'tools', 'test_check']:
+        assert name in names
+    assert 'element' in dir(o3)
+    assert 'section' in dir(o3.command)
+    loaded = _get_loaded('import o3seespy.command as com; com.section', ['o3seespy.command.'])
+    assert 'o3seespy.command.section' in loaded
+
+
+def test_lazy_names_match_modules():
+    for package in [o3.element, o3.uniaxial_material, o3.nd_material, o3.tools]:
+        for module_name in package._lazy_modules:
+            module = importlib.import_module(f'{package.__name__}.{module_name}')
+            for name, obj in vars(module).items():
+                if not name.startswith('_') and getattr(obj, '__module__', None) == module.__name__:
+                    assert name in package._lazy_modules[module_name], (package.__name__, name)
+                    assert getattr(package, name) is obj
@@ -0,0 +1,78 @@
+import numpy as np
+import o3seespy as o3
+
+
+def test_intern_materials_and_sections():
+    osi = o3.OpenSeesInstance(ndm=2, ndf=3, intern=True)
+    sects = [o3.section.Elastic2D(osi, 30.0e6, 0.25, 2.6e-3) for i in range(10)]
+    assert [x.tag for x in sects] == [1] * 10
+    assert osi.n_sect == 1
+    sect = o3.section.Elastic2D(osi, 30.0e6, 0.2, 2.6e-3)
+    assert sect.tag == 2
+    mat = o3.uniaxial_material.Elastic(osi, 1.0e5)
+    mat2 = o3.uniaxial_material.Elastic(osi, 1.0e5)
+    assert mat2.tag == mat.tag == 1
+    # same parameters but different type of command
+    nd_mat = o3.nd_material.ElasticIsotropic(osi, 1.0e5, 0.3)
+    assert nd_mat.tag == 2
+    assert osi.n_mat == 2
+    # sections that reference interned materials are also interned
+    sects = [o3.section.Uniaxial(osi, o3.uniaxial_material.Elastic(osi, 1.0e5), quantity=o3.cc.M_Z)
+             for i in range(3)]
+    assert [x.tag for x in sects] == [3] * 3
+    assert osi.n_mat == 2
+
+
+def test_intern_fiber_section_and_wipe():
+    osi = o3.OpenSeesInstance(ndm=2, ndf=3, intern=True)
+    mat = o3.uniaxial_material.Elastic(osi, 1.0e5)
+    sect = o3.section.Fiber(osi)
+    o3.patch.Rect(osi, mat, 4, 4, [-0.1, -0.1], [0.1, 0.1])
+    sect2 = o3.section.Fiber(osi)
+    assert sect2.tag == sect.tag + 1
+    o3.wipe(osi)
+    osi.reset_model_params(2, 3)
+    mat2 = o3.uniaxial_material.Elastic(osi, 1.0e5)
+    assert mat2.tag == mat.tag + 1  # not reused since the model has been wiped
+
+
+def test_intern_export_and_lean():
+    osi = o3.OpenSeesInstance(ndm=2, ndf=3, state=4, intern=True)
+    for i in range(5):
+        o3.section.Elastic2D(osi, 30.0e6, 0.25, 2.6e-3)
+    assert len([x for x in osi.commands if x.startswith('opy.section')]) == 1
+
+    osi = o3.OpenSeesInstance(ndm=2, ndf=3, lean=True, intern=True)
+    mats = [o3.uniaxial_material.Steel01(osi, 300.0e3, 200.0e6, 0.01) for i in range(3)]
+    assert [x.tag for x in mats] == [1] * 3
+    assert mats[2].parameters[1] == 1
+    assert np.isclose(mats[2].fy, 300.0e3)
+
+
+def _build_cantilever(osi):
+    nodes = o3.node.build_nodes(osi, [[0.0, 0.0], [0.0, 3.0], [0.0, 6.0]])
+    o3.Fix3DOF(osi, nodes[0], o3.cc.FIXED, o3.cc.FIXED, o3.cc.FIXED)
+    transf = o3.geom_transf.Linear2D(osi, [])
+    for i in range(2):
+        sect = o3.section.Elastic2D(osi, 30.0e6, 0.25, 2.6e-3)
+        integ = o3.beam_integration.Lobatto(osi, sect, 5)
+        o3.element.ForceBeamColumn(osi, [nodes[i], nodes[i + 1]], transf, integ)
+    ts = o3.time_series.Linear(osi, factor=1)
+    o3.pattern.Plain(osi, ts)
+    o3.Load(osi, nodes[2], [1.0, 0.0, 0.0])
+    o3.constraints.Plain(osi)
+    o3.numberer.RCM(osi)
+    o3.system.BandGeneral(osi)
+    o3.test_check.NormDispIncr(osi, 1.0e-6, 10)
+    o3.algorithm.Newton(osi)
+    o3.integrator.LoadControl(osi, 1.0)
+    o3.analysis.Static(osi)
+    assert o3.analyze(osi, 1) == 0
+    return o3.get_node_disp(osi, nodes[2], o3.cc.X)
+
+
+def test_intern_same_response():
+    disp = _build_cantilever(o3.OpenSeesInstance(ndm=2, ndf=3))
+    osi = o3.OpenSeesInstance(ndm=2, ndf=3, intern=True)
+    assert np.isclose(_build_cantilever(osi), disp)
+    assert osi.n_sect == 1
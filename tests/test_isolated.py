@@ -0,0 +1,77 @@
+import os
+import numpy as np
+import pytest
+import o3seespy as o3
+from o3seespy import backend
+
+
+def _build_spring(osi, k):
+    nodes = [o3.node.Node(osi, 0.0), o3.node.Node(osi, 0.0)]
+    o3.Fix1DOF(osi, nodes[0], o3.cc.FIXED)
+    mat = o3.uniaxial_material.Elastic(osi, k)
+    o3.element.ZeroLength(osi, nodes, mats=[mat], dirs=[1])
+    ts = o3.time_series.Linear(osi, factor=1)
+    o3.pattern.Plain(osi, ts)
+    o3.Load(osi, nodes[1], [1.0])
+    o3.constraints.Plain(osi)
+    o3.numberer.RCM(osi)
+    o3.system.BandGeneral(osi)
+    o3.test_check.NormDispIncr(osi, 1.0e-6, 10)
+    o3.algorithm.Linear(osi)
+    o3.integrator.LoadControl(osi, 0.1)
+    o3.analysis.Static(osi)
+    return nodes
+
+
+def test_interleaved_models():
+    local_osi = o3.OpenSeesInstance(ndm=1, ndf=1)
+    local_nodes = _build_spring(local_osi, 5.0)
+    osis = [o3.OpenSeesInstance(ndm=1, ndf=1, isolated=True) for i in range(3)]
+    assert isinstance(osis[0].backend, backend.RemoteBackend)
+    nodes = [_build_spring(osi, 10.0 * (i + 1)) for i, osi in enumerate(osis)]
+    for j in range(10):  # each step of each model is run in turn
+        for osi in osis:
+            assert o3.analyze(osi, 1) == 0
+    for i, osi in enumerate(osis):
+        assert np.isclose(o3.get_node_disp(osi, nodes[i][1], 1), 1.0 / (10.0 * (i + 1)))
+        osi.backend.close()
+    assert o3.get_node_disp(local_osi, local_nodes[1], 1) == 0.0  # not analysed
+    with pytest.raises(ValueError):
+        o3.OpenSeesInstance(ndm=1, ndf=1, isolated=True, backend='recording')
+
+
+def test_shared_memory_outputs():
+    shm_dir = '/dev/shm'
+    blocks = set(os.listdir(shm_dir)) if os.path.isdir(shm_dir) else set()
+    osi = o3.OpenSeesInstance(ndm=1, ndf=1, backend=backend.RemoteBackend(batch_size=10, min_shared_size=5))
+    try:
+        nodes = [o3.node.Node(osi, float(i)) for i in range(20)]
+        disps = osi.to_process_many('nodeDisp', [[node.tag] for node in nodes])
+        assert isinstance(disps, np.ndarray)
+        assert disps.shape == (20, 1)
+        assert np.all(disps == 0.0)
+        coords = osi.to_process_many('nodeCoord', [[node.tag, 1] for node in nodes])
+        assert np.array_equal(coords, np.arange(20.0))
+        small = osi.to_process_many('nodeCoord', [[node.tag, 1] for node in nodes[:3]])  # not through shared memory
+        assert isinstance(small, np.ndarray)
+        assert np.array_equal(small, [0.0, 1.0, 2.0])
+        assert osi.to_process_many('getNodeTags', [[]]) == [list(range(1, 21))]  # not floats
+        osi.backend.sync()  # blocks are released before the next command is run
+        if os.path.isdir(shm_dir):
+            assert set(os.listdir(shm_dir)) <= blocks
+    finally:
+        osi.backend.close()
+    assert not osi.backend.process.is_alive()
+
+
+def test_batched_error():
+    osi = o3.OpenSeesInstance(ndm=1, ndf=1, isolated=True)
+    o3.node.Node(osi, 0.0)
+    osi.n_node -= 1
+    o3.node.Node(osi, 1.0)
+    o3.node.Node(osi, 2.0)  # not run since it is after the failed command
+    with pytest.raises(backend.BackendError) as e:
+        osi.backend.sync()
+    assert 'opy.node(1, 1.0)' in str(e.value)
+    assert '1 batched commands after it' in str(e.value)
+    assert o3.get_node_tags(osi) == [1]
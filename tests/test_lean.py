@@ -0,0 +1,77 @@
+import gc
+import tracemalloc
+import weakref
+import numpy as np
+import o3seespy as o3
+from o3seespy.base_model import LeanRecord
+
+
+def test_lean_objects_are_records():
+    osi = o3.OpenSeesInstance(ndm=2, lean=True)
+    values = np.sin(np.arange(100) * 0.1)
+    ts = o3.time_series.Path(osi, dt=0.01, values=values, factor=2.0)
+    ts2 = o3.time_series.Path(osi, 0.01, values)
+    assert isinstance(ts, LeanRecord)
+    assert ts2.tag == 2
+    assert ts.factor == 2.0
+    assert ts.op_type == 'Path'
+    assert ts2.parameters[:4] == ['Path', 2, '-dt', 0.01]
+    assert ts.to_dict()['dt'] == 0.01
+    node = o3.node.Node(osi, 2.0, y=1.0)
+    assert isinstance(node, o3.node.NodeSetItem)
+    assert node.x == 2.0 and node.y == 1.0
+    assert o3.get_node_coords(osi, node) == [2.0, 1.0]
+    osi = o3.OpenSeesInstance(ndm=1, lean=True)
+    node = o3.node.Node(osi, 3.0, x_mass=2.0)  # masses are kept in the record
+    assert isinstance(node, LeanRecord)
+    assert node.x_mass == 2.0
+    assert node.parameters == [1, 3.0, '-mass', 2.0]
+
+
+def test_lean_records_do_not_keep_input_objects():
+    osi = o3.OpenSeesInstance(ndm=3, ndf=3, lean=True, backend='recording')
+    nodes = o3.node.build_nodes(osi, np.random.random((20, 3)))
+    mat = o3.nd_material.ElasticIsotropic(osi, 1.0e5, 0.3)
+    ele = o3.element.Brick20N(osi, list(nodes), mat, 0.0, 0.0, 0.0, 2.0)
+    ele2 = o3.element.Brick20N(osi, list(nodes), mat, 0.0, 0.0, 0.0, 2.0)
+    assert isinstance(ele, LeanRecord)
+    assert ele.mat.tag == mat.tag
+    assert ele.mat.nu == 0.3  # taken from the material while it exists
+    assert ele._inputs[2] is ele2._inputs[2]  # reference to the material is shared
+    osi_ref = weakref.ref(osi)
+    mat_ref = weakref.ref(mat)
+    del osi, mat
+    gc.collect()
+    assert osi_ref() is None
+    assert mat_ref() is None
+    assert ele.parameters[-5:] == [1, 0.0, 0.0, 0.0, 2.0]  # rebuilt from the tag of the material
+
+
+def test_lean_memory():
+    def get_memory(lean):
+        osi = o3.OpenSeesInstance(ndm=2, ndf=2, lean=lean)
+        mat = o3.nd_material.ElasticIsotropic(osi, 1.0e5, 0.3)
+        n_x = 100
+        tracemalloc.start()
+        nodes = [o3.node.Node(osi, i % n_x, i // n_x) for i in range(100000)]
+        node_size = tracemalloc.get_traced_memory()[0]
+        eles = [o3.element.SSPquad(osi, [nodes[i], nodes[i + 1], nodes[i + n_x + 1], nodes[i + n_x]], mat,
+                                   'PlaneStrain', 1.0, 0.0, 0.0) for i in range(0, 10000)]
+        ele_size = tracemalloc.get_traced_memory()[0] - node_size
+        tracemalloc.stop()
+        o3.wipe(osi)
+        return node_size / len(nodes), ele_size / len(eles)
+
+    full_node, full_ele = get_memory(False)
+    lean_node, lean_ele = get_memory(True)
+    assert lean_node < full_node / 2
+    assert lean_ele < full_ele * 0.8
+
+
+def test_not_lean_by_default():
+    osi = o3.OpenSeesInstance(ndm=2)
+    node = o3.node.Node(osi, 1.0, 2.0)
+    assert isinstance(node, o3.node.Node)
+    assert 'x' in node.__dict__
+    osi = o3.OpenSeesInstance(ndm=2, lean=True, state=4)  # only records in state 0
+    assert isinstance(o3.node.Node(osi, 1.0, 2.0), o3.node.Node)
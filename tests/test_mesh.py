@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+import o3seespy as o3
+
+
+def test_get_node_depths():
+    depths, ele_layers = o3.tools.get_node_depths([1.0, 2.5], [0.5, 1.0])
+    assert np.allclose(depths, [0.0, 0.5, 1.0, 1.0 + 2.5 / 3, 1.0 + 5.0 / 3, 3.5])
+    assert list(ele_layers) == [0, 0, 1, 1, 1]
+
+
+def test_soil_column_2d_frequency():
+    vs = 200.0
+    rho = 1.8
+    g_mod = rho * vs ** 2
+    osi = o3.OpenSeesInstance(ndm=2, ndf=2)
+    mat = o3.nd_material.ElasticIsotropic(osi, 2 * g_mod * (1 + 0.3), 0.3, rho=rho)
+    mesh = o3.tools.build_soil_mesh(osi, [10.0, 10.0], [mat, mat], ele_h=0.5, width=0.5)
+    assert mesh.node_tags.shape == (41, 2)
+    assert mesh.ele_tags.shape == (40, 1)
+    assert len(mesh.ties) == 40  # all rows except the fixed base
+    assert len(mesh.fixities[0]) == 2
+    omegas = np.sqrt(o3.get_eigen(osi, solver='fullGenLapack', n=1))
+    assert np.isclose(omegas[0] / (2 * np.pi), vs / (4 * 20.0), rtol=0.01)
+
+
+def test_soil_mesh_compliant_base():
+    osi = o3.OpenSeesInstance(ndm=2, ndf=2)
+    mats = [o3.nd_material.ElasticIsotropic(osi, 1.0e5, 0.3, rho=1.8) for i in range(2)]
+    mesh = o3.tools.build_soil_mesh(osi, [2.0, 3.0], mats, ele_h=[1.0, 0.5], width=4.0, ele_w=1.0,
+                                    ele_type='Quad', body_forces=[[0.0, -9.8], [0.0, -9.8]], base_imp=1.8 * 300)
+    assert mesh.node_tags.shape == (9, 5)
+    assert [len(x) for x in mesh.ele_sets] == [8, 24]
+    assert mesh.ele_sets[1].properties['b2'] == -9.8
+    assert len(mesh.ties) == 9  # right column tied to left column, including the base
+    assert len(mesh.base_ties) == 3  # interior base nodes
+    assert mesh.c_base == 1.8 * 300 * 4.0
+    assert mesh.base_node.tag == mesh.node_tags[-1, 0]
+    assert mesh.dashpot_node.tag == mesh.nodes.tags[-1] + 1
+    conn = mesh.ele_sets[0].connectivity[0]  # counter-clockwise from the bottom left
+    assert list(conn) == [mesh.node_tags[1, 0], mesh.node_tags[1, 1], mesh.node_tags[0, 1], mesh.node_tags[0, 0]]
+    assert np.allclose(mesh.surface_nodes.y, 0.0)
+
+
+def test_soil_mesh_3d():
+    osi = o3.OpenSeesInstance(ndm=3, ndf=3)
+    mat = o3.nd_material.ElasticIsotropic(osi, 1.0e5, 0.3, rho=1.8)
+    mesh = o3.tools.build_soil_mesh(osi, [2.0], [mat], ele_h=1.0, width=2.0, length=1.0, ele_w=1.0)
+    assert mesh.node_tags.shape == (3, 2, 3)
+    assert mesh.ele_tags.shape == (2, 1, 2)
+    assert len(mesh.ties) == 2 * 5  # perimeter nodes of the two free rows, except the retained node
+    node = mesh.get_node(1, 1, 2)
+    assert (node.x, node.y, node.z) == (2.0, 1.0, -1.0)
+    with pytest.raises(ValueError):
+        o3.tools.build_soil_mesh(osi, [2.0], [mat], ele_h=1.0, width=2.0, ele_type='SSPquad')
+
+
+def test_wave_ele_h():
+    osi = o3.OpenSeesInstance(ndm=2, ndf=2)
+    soft = o3.nd_material.ElasticIsotropic(osi, 2 * 1.8 * 100.0 ** 2 * 1.25, 0.25, rho=1.8)
+    rec_osi = o3.OpenSeesInstance(ndm=2, ndf=2, backend='recording')  # only the inputs are used
+    stiff = o3.nd_material.PressureIndependMultiYield(rec_osi, 2, 2.0, 2.0 * 400.0 ** 2, 1.0e6, 2000.0, 0.02)
+    assert np.isclose(o3.tools.get_shear_vel(soft), 100.0)
+    assert np.isclose(o3.tools.get_shear_vel(stiff), 400.0)
+    assert np.allclose(o3.tools.get_wave_ele_h([100.0, 400.0], 10.0, max_ele_h=2.0), [1.0, 2.0])
+    depths, ele_layers = o3.tools.get_wave_node_depths([4.5, 10.0], [100.0, 400.0], 10.0)
+    assert list(np.bincount(ele_layers)) == [5, 3]  # coarsest mesh with at least 10 elements per wavelength
+    mesh = o3.tools.build_soil_mesh(rec_osi, [4.5, 10.0], [soft, stiff], width=1.0, f_max=10.0)
+    assert np.allclose(mesh.depths, depths)
+    mesh_0 = o3.tools.build_soil_mesh(osi, [4.5, 10.0], [soft, soft], ele_h=0.5, f_max=10.0,
+                                      shear_vels=[100.0, 400.0])
+    assert list(np.bincount(mesh_0.ele_layers)) == [9, 20]
+    with pytest.raises(ValueError):
+        o3.tools.build_soil_mesh(osi, [4.5], [soft], width=1.0)
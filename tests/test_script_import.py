@@ -0,0 +1,89 @@
+import numpy as np
+import o3seespy as o3
+from tests.helpers import build_soil_column
+
+TCL_MODEL = """# two node column
+wipe
+model basic -ndm 2 -ndf 2
+set E 1.0e5
+node 1 0.0 0.0; node 2 1.0 0.0
+node 3 0.0 -1.0
+node 4 1.0 -1.0
+equalDOF 1 2 1
+fix 3 1 1
+fix 4 1 1
+nDMaterial ElasticIsotropic 1 $E 0.3 1.8
+element SSPquad 1 3 4 2 1 1 PlaneStrain 1.0 \\
+    0.0 0.0
+timeSeries Linear 1
+pattern Plain 1 1 {
+    load 1 10.0 0.0
+}
+for {set i 0} {$i < 3} {incr i} {
+    node [expr 10 + $i] 0.0 0.0
+}
+element notAnElement 2 1 2
+constraints Transformation
+numberer RCM
+system SparseGeneral
+test EnergyIncr 1.0e-6 10
+algorithm Newton
+integrator LoadControl 0.1
+analysis Static
+analyze 10
+"""
+
+
+def test_import_tcl_script(tmp_path):
+    ffp = str(tmp_path / 'model.tcl')
+    with open(ffp, 'w') as ofile:
+        ofile.write(TCL_MODEL)
+    osi, unsupported = o3.tools.import_script(ffp)
+    assert [x[0] for x in unsupported] == [18, 21, 29]
+    assert unsupported[1][1] == 'element notAnElement 2 1 2'
+    assert (osi.n_node, osi.n_ele, osi.n_mat, osi.n_tseries, osi.n_pat) == (4, 1, 1, 1, 1)
+    assert o3.get_ele_tags(osi) == [1]
+    assert o3.analyze(osi, 10, 0.1) == 0
+    assert np.isclose(o3.get_node_disp(osi, o3.node.NodeSetItem(1, None), o3.cc.X), 10 * 10.0 / 1.0e5, rtol=0.1)
+
+
+def test_import_exported_py_script(tmp_path):
+    ffp = str(tmp_path / 'model.py')
+    osi = o3.OpenSeesInstance(ndm=2, ndf=2, state=3)
+    osi.export_to_file(ffp)
+    nodes, eles = build_soil_column(osi)
+    osi.close_export()
+    assert o3.analyze(osi, 20, 0.01) == 0
+    expected = o3.get_node_disp(osi, nodes[0][0], o3.cc.X)
+
+    osi, unsupported = o3.tools.import_script(ffp, history=True)
+    assert unsupported == []
+    assert osi.n_node == len(nodes) * 2
+    assert o3.analyze(osi, 20, 0.01) == 0
+    assert np.isclose(o3.get_node_disp(osi, nodes[0][0], o3.cc.X), expected)
+    assert len(o3.snapshot.get_blocks(osi.history))
+
+
+def test_parse_py_lines():
+    lines = ["import openseespy.opensees as ops", "ops.node(1, 0.0, 2.5e-3)", "ops.fix(1, *[1, 1])",
+             "ops.element('zeroLength', 1, 1, 2, '-mat', 1, '-dir', 1)", "for i in range(3):",
+             "    ops.node(i, 0.0, 0.0)", "ops.timeSeries('Path', 1, '-values', [1.0, 2.0])"]
+    commands, unsupported = o3.tools.parse_py_lines(lines)
+    assert commands[0] == (2, 'node', [1, 0.0, 2.5e-3])
+    assert commands[1][2] == ['zeroLength', 1, 1, 2, '-mat', 1, '-dir', 1]
+    assert commands[2][2] == ['Path', 1, '-values', [1.0, 2.0]]
+    assert [x[0] for x in unsupported] == [3, 5, 6]
+
+
+def test_parse_tcl_lines_inline_pattern_block():
+    lines = ['timeSeries Linear 1', 'pattern Plain 1 1 { load 3 1.0 0.0 0.0 }',
+             'pattern Plain 2 1 { load 4 2.0 0.0 0.0; load 5 3.0 0.0 0.0',
+             'load 6 4.0 0.0 0.0 }', 'pattern Plain 3 1 {load 7 5.0 0.0 0.0}', 'analysis Static']
+    commands, unsupported = o3.tools.script_import.parse_tcl_lines(lines)
+    assert unsupported == []
+    assert [x[1] for x in commands] == ['timeSeries', 'pattern', 'load', 'pattern', 'load', 'load', 'load',
+                                        'pattern', 'load', 'analysis']
+    assert commands[1] == (2, 'pattern', ['Plain', 1, 1])
+    assert commands[2] == (2, 'load', [3, 1.0, 0.0, 0.0])
+    assert commands[6] == (4, 'load', [6, 4.0, 0.0, 0.0])
+    assert commands[8][2] == [7, 5.0, 0.0, 0.0]
@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+import o3seespy as o3
+from tests.helpers import build_soil_column
+
+
+def test_snapshot_rebuilds_model(tmp_path):
+    ffp = str(tmp_path / 'column.npz')
+    osi = o3.OpenSeesInstance(ndm=2, ndf=2, history=True)
+    nodes, eles = build_soil_column(osi, n_eles=4)
+    o3.snapshot.save(osi, ffp)
+    assert o3.analyze(osi, 20, 0.01) == 0
+    expected = o3.get_node_disp(osi, nodes[0][0], o3.cc.X)
+    n_node, n_ele, n_mat = osi.n_node, osi.n_ele, osi.n_mat
+
+    osi = o3.snapshot.load(ffp, history=True)
+    assert (osi.n_node, osi.n_ele, osi.n_mat) == (n_node, n_ele, n_mat)
+    assert len(o3.get_ele_tags(osi)) == 4
+    assert o3.analyze(osi, 20, 0.01) == 0
+    assert np.isclose(o3.get_node_disp(osi, nodes[0][0], o3.cc.X), expected)
+    o3.snapshot.save(osi, ffp)  # history of a loaded model can be saved again
+
+
+def test_snapshot_blocks():
+    osi = o3.OpenSeesInstance(ndm=2, ndf=2, history=True)
+    o3.node.build_nodes(osi, [[0, 0], [1, 0], [2, 0], [0, 1], [1, 1], [2, 1]])
+    o3.node.Node(osi, np.float64(3.0), 0.0)  # numpy types join the same block
+    mat = o3.nd_material.ElasticIsotropic(osi, 1.0e5, 0.3)
+    o3.element.SSPquad.build_many(osi, [[1, 2, 5, 4], [2, 3, 6, 5]], mat, o3.cc.PLANE_STRAIN, 1.0, 0.0, 0.0)
+    o3.set_equal_dof(osi, o3.node.NodeSetItem(1, None), o3.node.NodeSetItem(2, None), o3.cc.X)
+    blocks = o3.snapshot.get_blocks(osi.history)
+    assert [x[0] for x in blocks] == ['model', 'node', 'nDMaterial', 'element', 'equalDOF']
+    assert blocks[1][2].shape == (7, 1)
+    assert blocks[1][3].shape == (7, 2)
+    assert blocks[3][1] == ('sSSPquad', 'i', 'i', 'i', 'i', 'i', 'i', 'sPlaneStrain', 'f', 'f', 'f')
+
+
+def test_snapshot_requires_history(tmp_path):
+    osi = o3.OpenSeesInstance(ndm=2, ndf=2)
+    with pytest.raises(ValueError):
+        o3.snapshot.save(osi, str(tmp_path / 'model.npz'))
@@ -0,0 +1,32 @@
+import numpy as np
+import o3seespy as o3
+from tests.helpers import build_soil_column
+
+
+def test_analyze_adaptive_uses_fallback_test():
+    osi = o3.OpenSeesInstance(ndm=2, ndf=2)
+    build_soil_column(osi)
+    strict_test = o3.test.NormDispIncr(osi, tol=1.0e-30, max_iter=1)  # never converges
+    ok_test = o3.test.EnergyIncr(osi, tol=1.0e-6, max_iter=10)
+    strict_test.to_process(osi)
+    assert o3.analyze(osi, 1, 0.01) != 0
+    res = o3.analyze_adaptive(osi, 20, 0.01, tests=[strict_test, ok_test])
+    assert res == 0
+    assert np.isclose(o3.get_time(osi), 0.2)
+
+
+def test_analyze_adaptive_reduces_dt_then_fails():
+    osi = o3.OpenSeesInstance(ndm=2, ndf=2)
+    build_soil_column(osi)
+    o3.test.NormDispIncr(osi, tol=1.0e-30, max_iter=1)
+    res = o3.analyze_adaptive(osi, 10, 0.01, dt_factor=2, dt_min=0.0025, verbose=1)
+    assert res != 0
+    assert np.isclose(o3.get_time(osi), 0.0)
+
+
+def test_analyze_adaptive_steps():
+    osi = o3.OpenSeesInstance(ndm=2, ndf=2)
+    nodes, eles = build_soil_column(osi)
+    na = o3.recorder.NodeToArray(osi, nodes[0][0], [o3.cc.X], 'disp')
+    assert o3.analyze_adaptive(osi, 15, 0.01) == 0
+    assert len(na.collect()) == 15
@@ -0,0 +1,154 @@
+import numpy as np
+import pytest
+import o3seespy as o3
+from tests.helpers import build_soil_column
+
+
+def test_node_to_array_matches_cache():
+    osi = o3.OpenSeesInstance(ndm=2, ndf=2)
+    nodes, eles = build_soil_column(osi)
+    tc = o3.recorder.NodeToArrayCache(osi, nodes[0][0], [o3.cc.X], 'accel')
+    ta = o3.recorder.NodeToArray(osi, nodes[0][0], [o3.cc.X], 'accel', n_steps=10)  # forces buffer growth
+    tas = o3.recorder.NodesToArray(osi, [nodes[0][0], nodes[1][0]], [o3.cc.X, o3.cc.Y], 'disp')
+    es = o3.recorder.ElementsToArray(osi, eles, arg_vals=['stress'])
+    esc = o3.recorder.ElementsToArrayCache(osi, eles, arg_vals=['stress'])
+    assert o3.analyze(osi, 30, 0.01) == 0
+    o3.wipe(osi)
+    assert len(osi.array_recorders) == 0
+    x_acc = ta.collect()
+    assert x_acc.shape == (30,)
+    assert np.isclose(x_acc, tc.collect(), rtol=1.0e-6).all()
+    disps = tas.collect()
+    assert disps.shape == (30, 4)
+    assert np.isclose(disps[:, 1], 0.0).all()  # y-dof is fixed
+    stresses = es.collect()
+    stresses_cache = esc.collect()
+    assert stresses.shape == stresses_cache.shape
+    assert np.isclose(stresses, stresses_cache, rtol=1.0e-6, atol=1.0e-8).all()
+
+
+def test_node_to_array_w_dt():
+    osi = o3.OpenSeesInstance(ndm=2, ndf=2)
+    nodes, eles = build_soil_column(osi)
+    ta = o3.recorder.NodeToArray(osi, nodes[0][0], [o3.cc.X], 'disp', dt=0.02)
+    o3.analyze(osi, 30, 0.01)
+    assert len(ta.collect()) == 15
+
+
+def test_binary_recorders():
+    osi = o3.OpenSeesInstance(ndm=2, ndf=2)
+    nodes, eles = build_soil_column(osi)
+    tc = o3.recorder.NodesToArrayCache(osi, [nodes[0][0], nodes[1][0]], [o3.cc.X, o3.cc.Y], 'accel')
+    tb = o3.recorder.NodesToArrayCache(osi, [nodes[0][0], nodes[1][0]], [o3.cc.X, o3.cc.Y], 'accel', binary=True)
+    tb1 = o3.recorder.NodeToArrayCache(osi, nodes[0][0], [o3.cc.X], 'accel', binary=True)
+    esc = o3.recorder.ElementsToArrayCache(osi, eles, arg_vals=['stress'])
+    esb = o3.recorder.ElementsToArrayCache(osi, eles, arg_vals=['stress'], binary=True)
+    assert tb.n_cols == 4
+    assert esb.n_cols == 9
+    o3.analyze(osi, 30, 0.01)
+    o3.wipe(osi)
+    acc_txt = tc.collect()
+    acc_bin = tb.collect(mmap=True)
+    assert isinstance(acc_bin, np.memmap)
+    assert acc_bin.shape == (30, 4)
+    assert np.isclose(acc_bin, acc_txt, rtol=1.0e-6).all()
+    assert np.isclose(tb1.collect(), acc_txt[:, 0], rtol=1.0e-6).all()
+    stresses = esb.collect()
+    assert not isinstance(stresses, np.memmap)
+    assert np.isclose(stresses, esc.collect(), rtol=1.0e-6, atol=1.0e-8).all()
+    with pytest.raises(ValueError):
+        tc.collect(mmap=True)
+
+
+def test_binary_and_text_recorders_same_shape():
+    osi = o3.OpenSeesInstance(ndm=2, ndf=2)
+    nodes, eles = build_soil_column(osi)
+    recs = {}
+    for binary in [False, True]:
+        recs[binary] = [o3.recorder.NodesToArrayCache(osi, [nodes[0][0], nodes[1][0]], [o3.cc.X, o3.cc.Y], 'accel',
+                                                      binary=binary),
+                        o3.recorder.NodeToArrayCache(osi, nodes[0][0], [o3.cc.X], 'accel', binary=binary)]
+    o3.analyze(osi, 10, 0.01)
+    o3.wipe(osi)
+    inputs = [{}, {'usecols': 1}, {'usecols': [1]}, {'usecols': [0, 2]}, {'start': 3, 'stop': 4},
+              {'usecols': 1, 'start': 3, 'stop': 4}]
+    for i in range(2):
+        for kwargs in inputs:
+            if i == 1 and 'usecols' in kwargs:
+                continue
+            txt = recs[False][i].collect(unlink=False, **kwargs)
+            bin_vals = recs[True][i].collect(unlink=False, **kwargs)
+            assert bin_vals.shape == txt.shape, kwargs
+            assert np.isclose(bin_vals, txt, rtol=1.0e-6).all()
+    for rec in recs[False] + recs[True]:
+        rec.collect()  # deletes the file
+
+
+def test_collect_text_w_slicing():
+    osi = o3.OpenSeesInstance(ndm=2, ndf=2)
+    nodes, eles = build_soil_column(osi)
+    tc = o3.recorder.NodesToArrayCache(osi, [nodes[0][0], nodes[1][0]], [o3.cc.X, o3.cc.Y], 'accel')
+    tc2 = o3.recorder.NodesToArrayCache(osi, [nodes[0][0], nodes[1][0]], [o3.cc.X, o3.cc.Y], 'accel')
+    o3.analyze(osi, 30, 0.01)
+    o3.wipe(osi)
+    acc = tc.collect(unlink=False)
+    assert acc.shape == (30, 4)
+    assert np.isclose(acc, np.loadtxt(tc.tmpfname)).all()
+    acc_part = tc2.collect(usecols=[0, 2], start=5, stop=20)
+    assert np.isclose(acc_part, acc[5:20, [0, 2]]).all()
+    acc_col = tc.collect(usecols=2)
+    assert np.isclose(acc_col, acc[:, 2]).all()
+
+
+def test_load_text_file_stops_reading_at_stop(tmp_path):
+    ffp = str(tmp_path / 'rec.txt')
+    with open(ffp, 'w') as f:
+        f.write('1.0 2.0\n3.0 4.0\n5.0 6.0\nnot a number\n')
+    vals = o3.recorder.load_text_file(ffp, stop=2)
+    assert np.isclose(vals, [[1.0, 2.0], [3.0, 4.0]]).all()
+    assert o3.recorder.load_text_file(ffp, usecols=1, start=1, stop=3).shape == (2, 1)
+    with pytest.raises(ValueError):
+        o3.recorder.load_text_file(ffp)
+    with open(ffp, 'w') as f:
+        f.write('1.0 2.0\n3.0 4.0\n')
+    assert o3.recorder.load_text_file(ffp, start=1, stop=10).shape == (1, 2)
+
+
+def test_load_text_file_without_c_loadtxt(tmp_path, monkeypatch):
+    ffp = str(tmp_path / 'rec.txt')
+    vals = np.random.random((100, 3))
+    np.savetxt(ffp, vals)
+    expected = o3.recorder.load_text_file(ffp, chunk_size=500)
+    monkeypatch.setattr(np, '__version__', '1.22.0')  # parsed with numpy.fromstring
+    assert np.array_equal(o3.recorder.load_text_file(ffp, chunk_size=500), expected)
+    assert np.allclose(expected, vals)
+    assert np.array_equal(o3.recorder.load_text_file(ffp, usecols=[0, 2], start=10, stop=90, chunk_size=500),
+                          vals[10:90, [0, 2]])
+    with open(ffp, 'a') as f:
+        f.write('1.0 not 3.0\n')
+    with pytest.raises(ValueError):
+        o3.recorder.load_text_file(ffp)
+
+
+def test_text_element_recorder_checks_n_cols():
+    osi = o3.OpenSeesInstance(ndm=2, ndf=2)
+    nodes, eles = build_soil_column(osi)
+    esc = o3.recorder.ElementsToArrayCache(osi, eles, arg_vals=['stress'])
+    assert esc.n_cols == 3 * len(eles)
+    o3.analyze(osi, 5, 0.01)
+    o3.wipe(osi)
+    esc.n_cols += 1
+    with pytest.raises(ValueError):
+        esc.collect()
+
+
+def test_array_recorder_exports_single_analyze():
+    osi = o3.OpenSeesInstance(ndm=2, ndf=2, state=3)
+    nodes, eles = build_soil_column(osi)
+    ta = o3.recorder.NodeToArray(osi, nodes[0][0], [o3.cc.X], 'disp')
+    es = o3.recorder.ElementsToArray(osi, eles, arg_vals=['stress'])
+    n_commands = len(osi.commands)
+    assert o3.analyze(osi, 30, 0.01) == 0
+    assert osi.commands[n_commands:] == ['opy.analyze(30, 0.01)']
+    assert ta.collect().shape == (30,)
+    assert len(es.collect()) == 30
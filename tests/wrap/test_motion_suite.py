@@ -0,0 +1,27 @@
+import numpy as np
+import o3seespy as o3
+from tests.helpers import build_soil_column
+
+
+def run_soil_column(acc, scale=1.0, dt=0.01):
+    osi = o3.OpenSeesInstance(ndm=2, ndf=2)
+    nodes, eles = build_soil_column(osi, n_eles=2, acc=acc, dt=dt, scale=scale)
+    na = o3.recorder.NodeToArray(osi, nodes[0][0], [o3.cc.X], 'disp')
+    o3.analyze(osi, len(acc), dt)
+    return {'top_disp': na.collect()}
+
+
+def test_run_motion_suite():
+    motions = [np.sin(np.linspace(0, np.pi, 20)), np.sin(np.linspace(0, 2 * np.pi, 30)), 'not-a-motion']
+    results = o3.tools.run_motion_suite(run_soil_column, motions, scales=[1.0, 2.0], n_workers=2,
+                                        builder_kwargs={'dt': 0.01})
+    assert len(results) == 6
+    assert [x['index'] for x in results] == [0, 0, 1, 1, 2, 2]
+    assert results[0]['status'] == 'ok'
+    assert results[0]['outputs']['top_disp'].shape == (20,)
+    assert np.isclose(results[1]['outputs']['top_disp'], 2 * results[0]['outputs']['top_disp']).all()
+    assert results[4]['status'] == 'failed'
+    assert 'Traceback' in results[4]['error']
+    serial = o3.tools.run_motion_suite(run_soil_column, motions[:1], n_workers=1)
+    assert np.isclose(serial[0]['outputs']['top_disp'], results[0]['outputs']['top_disp']).all()
+    assert serial[0]['run_time'] > 0
@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+import o3seespy as o3
+
+
+def _build_cantilever(osi):
+    nodes = [o3.node.Node(osi, 0, 0), o3.node.Node(osi, 0, 1), o3.node.Node(osi, 0, 2)]
+    o3.Fix3DOF(osi, nodes[0], o3.cc.FIXED, o3.cc.FIXED, o3.cc.FIXED)
+    transf = o3.geom_transf.Linear2D(osi, [])
+    for i in range(2):
+        o3.element.ElasticBeamColumn2D(osi, [nodes[i], nodes[i + 1]], 1.0, 1.0e3, 1.0, transf)
+    ts = o3.time_series.Linear(osi, factor=1)
+    o3.pattern.Plain(osi, ts)
+    o3.Load(osi, nodes[-1], [1.0, 0.0, 0.0])
+    o3.constraints.Plain(osi)
+    o3.numberer.RCM(osi)
+    o3.system.BandGeneral(osi)
+    o3.test_check.NormDispIncr(osi, 1.0e-6, 10)
+    o3.algorithm.Linear(osi)
+    o3.integrator.LoadControl(osi, 1.0)
+    o3.analysis.Static(osi)
+    o3.analyze(osi, 1)
+    return nodes
+
+
+def test_get_all_node_disps_as_array():
+    osi = o3.OpenSeesInstance(ndm=2)
+    nodes = _build_cantilever(osi)
+    tags, disps = o3.get_all_node_disps_as_array(osi)
+    assert disps.shape == (3, 3)
+    for i, tag in enumerate(tags):
+        assert np.isclose(disps[i, 0], o3.get_node_disp(osi, nodes[tag - 1], o3.cc.X))
+    assert np.isclose(disps[:, 0], o3.get_all_node_disps(osi, o3.cc.X)).all()
+    tags, disps = o3.get_all_node_disps_as_array(osi, nodes=nodes[1:])
+    assert list(tags) == [2, 3]
+    assert disps[1, 0] > disps[0, 0] > 0.0
+    tags, vels = o3.get_all_node_vels_as_array(osi)
+    assert vels.shape == (3, 3)
+    tags, accels = o3.get_all_node_accels_as_array(osi)
+    assert accels.shape == (3, 3)
+
+
+def test_get_all_node_disps_as_array_not_run():
+    for state in [1, 2, 4]:
+        osi = o3.OpenSeesInstance(ndm=2, state=state)
+        nodes = _build_cantilever(osi)
+        with pytest.raises(o3.exceptions.ModelError):
+            o3.get_all_node_disps_as_array(osi)
+        with pytest.raises(o3.exceptions.ModelError):
+            o3.get_all_node_vels_as_array(osi, nodes=nodes)
@@ -0,0 +1,62 @@
+import numpy as np
+import o3seespy as o3
+from tests.helpers import build_soil_column
+
+
+def test_run_transient_matches_array_recorders():
+    osi = o3.OpenSeesInstance(ndm=2, ndf=2)
+    nodes, eles = build_soil_column(osi)
+    na = o3.recorder.NodeToArray(osi, nodes[0][0], [o3.cc.X], 'accel')
+    es = o3.recorder.ElementsToArray(osi, eles, arg_vals=['stress'])
+    outputs = {
+        'top_acc': o3.tools.NodeOutput(nodes[0][0], o3.cc.X, 'accel'),
+        'disps': o3.tools.NodeOutput([nodes[0][0], nodes[1][0]], [o3.cc.X, o3.cc.Y], 'disp'),
+        'base_reacts': o3.tools.NodeOutput(nodes[-1], o3.cc.X, 'reaction'),
+        'stresses': o3.tools.EleOutput(eles, ['stress']),
+    }
+    status, res = o3.tools.run_transient(osi, 30, 0.01, outputs=outputs)
+    assert status == 0
+    assert np.isclose(res['time'], np.arange(1, 31) * 0.01).all()
+    assert res['top_acc'].shape == (30,)
+    assert np.isclose(res['top_acc'], na.collect()).all()  # array recorders are also updated
+    assert res['disps'].shape == (30, 4)
+    assert np.isclose(res['disps'][:, 1], 0.0).all()
+    assert np.isclose(res['disps'][-1, 2], o3.get_node_disp(osi, nodes[1][0], o3.cc.X))
+    assert res['base_reacts'].shape == (30, 2)
+    assert np.isclose(res['stresses'], es.collect()).all()
+
+
+def test_run_transient_stops_on_failure():
+    osi = o3.OpenSeesInstance(ndm=2, ndf=2)
+    nodes, eles = build_soil_column(osi)
+    o3.test.NormDispIncr(osi, tol=1.0e-30, max_iter=1)
+    outputs = {'top_disp': o3.tools.NodeOutput(nodes[0][0], o3.cc.X, 'disp')}
+    status, res = o3.tools.run_transient(osi, 10, 0.01, outputs=outputs)
+    assert status != 0
+    assert len(res['time']) == 0
+    assert len(res['top_disp']) == 0
+
+
+def test_run_transient_exports_single_analyze():
+    outputs = {'top_disp': o3.tools.NodeOutput(o3.node.NodeSetItem(1, None), o3.cc.X, 'disp')}
+    osi = o3.OpenSeesInstance(ndm=2, ndf=2)
+    build_soil_column(osi)
+    status, res = o3.tools.run_transient(osi, 20, 0.01, outputs=outputs)
+    osi = o3.OpenSeesInstance(ndm=2, ndf=2, state=3)
+    build_soil_column(osi)
+    n_commands = len(osi.commands)
+    status_exp, res_exp = o3.tools.run_transient(osi, 20, 0.01, outputs=outputs)
+    assert osi.commands[n_commands:] == ['opy.analyze(20, 0.01)']
+    assert status_exp == status == 0
+    assert np.isclose(res_exp['top_disp'], res['top_disp']).all()
+
+
+def test_run_transient_export_only():
+    osi = o3.OpenSeesInstance(ndm=2, ndf=2, state=4)
+    nodes, eles = build_soil_column(osi)
+    outputs = {'top_disp': o3.tools.NodeOutput(nodes[0][0], o3.cc.X, 'disp')}
+    status, res = o3.tools.run_transient(osi, 20, 0.01, outputs=outputs)
+    assert status == 0
+    assert osi.commands[-1] == 'opy.analyze(20, 0.01)'
+    assert len(res['time']) == 0
+    assert len(res['top_disp']) == 0